@@ -1,5 +1,6 @@
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
+from apps.core.pagination import KeysetPagination
 from apps.core.permissions import HasRole, IsSuperAdmin
 from .models import AuditLog
 from .serializers import AuditLogSerializer
@@ -10,4 +11,5 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
     """
     permission_classes = [IsAuthenticated, IsSuperAdmin | HasRole(['SUPER_ADMIN', 'TENANT_ADMIN', 'SOC_ADMIN'])]
     queryset = AuditLog.objects.all()
-    serializer_class = AuditLogSerializer
\ No newline at end of file
+    serializer_class = AuditLogSerializer
+    pagination_class = KeysetPagination
\ No newline at end of file
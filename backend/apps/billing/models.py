@@ -1,7 +1,7 @@
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
-from apps.core.models import TenantAwareModel, TimeStampedModel, UUIDPrimaryKeyModel
+from apps.core.models import TenantAwareModel, TimeStampedModel, UUIDPrimaryKeyModel, tenant_indexes
 
 class Plan(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel):
     """
@@ -65,6 +65,9 @@ class Invoice(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel):
     pdf_url = models.URLField(max_length=500, blank=True)
     due_date = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = tenant_indexes('bill_invoice', soft_delete=False, status_field='status')
+
     def __str__(self):
         return f'Invoice #{self.invoice_number} - {self.user}'
 
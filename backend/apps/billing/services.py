@@ -1,12 +1,10 @@
-import stripe
 from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 from .models import Invoice, Plan, Subscription
 from apps.core.services.base import BaseService
 from apps.core.services.audit import AuditService
-
-stripe.api_key = settings.STRIPE_SECRET_KEY
+from apps.core.clients import get_stripe
 
 class SubscriptionService(BaseService):
     """
@@ -21,7 +19,7 @@ class SubscriptionService(BaseService):
         """
         tenant = cls.get_tenant_context(request)
         
-        session = stripe.checkout.Session.create(
+        session = get_stripe().checkout.Session.create(
             payment_method_types=['card'],
             line_items=[{
                 'price': plan.stripe_price_id_monthly,
@@ -10,6 +10,9 @@ from datetime import datetime, timezone as dt_timezone
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+
+from apps.core.clients import get_stripe
+from apps.core.mixins import ExportMixin
 from .models import Invoice, Plan, Subscription, BillingSettings
 from .serializers import (
     InvoiceSerializer, PlanSerializer, SubscriptionSerializer, BillingSettingsSerializer
@@ -42,8 +45,7 @@ class PlanViewSet(viewsets.ReadOnlyModelViewSet):
             )
 
         try:
-            import stripe
-            stripe.api_key = getattr(settings, 'STRIPE_SECRET_KEY', None)
+            stripe = get_stripe()
 
             if not stripe.api_key:
                 return Response(
@@ -81,10 +83,21 @@ class PlanViewSet(viewsets.ReadOnlyModelViewSet):
             )
 
 
-class InvoiceViewSet(viewsets.ModelViewSet):
+class InvoiceViewSet(ExportMixin, viewsets.ModelViewSet):
     queryset = Invoice.objects.all().order_by('-created_at')
     serializer_class = InvoiceSerializer
     permission_classes = [permissions.IsAuthenticated]
+    export_filename = 'billing_invoices'
+    export_columns = [
+        ('Invoice Number', 'invoice_number'),
+        ('User', 'user__email'),
+        ('Status', 'status'),
+        ('Amount', 'amount'),
+        ('Currency', 'currency'),
+        ('Payment Method', 'payment_method'),
+        ('Due Date', 'due_date'),
+        ('Created', 'created_at'),
+    ]
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -109,8 +122,7 @@ class SubscriptionViewSet(viewsets.ModelViewSet):
         """Cancel a subscription at period end via Stripe."""
         sub = self.get_object()
         try:
-            import stripe
-            stripe.api_key = getattr(settings, 'STRIPE_SECRET_KEY', None)
+            stripe = get_stripe()
             if sub.stripe_subscription_id and stripe.api_key:
                 stripe.Subscription.modify(sub.stripe_subscription_id, cancel_at_period_end=True)
             sub.cancel_at_period_end = True
@@ -140,8 +152,7 @@ class StripeWebhookView(View):
         webhook_secret = getattr(settings, 'STRIPE_WEBHOOK_SECRET', None)
 
         try:
-            import stripe
-            stripe.api_key = getattr(settings, 'STRIPE_SECRET_KEY', None)
+            stripe = get_stripe()
 
             if webhook_secret:
                 event = stripe.Webhook.construct_event(payload, sig_header, webhook_secret)
@@ -6,3 +6,5 @@ class CoreConfig(AppConfig):
 
     def ready(self):
         import apps.core.signals
+        import apps.core.conditional  # change counters behind ETags
+        import apps.core.kpis  # incrementally maintained dashboard counters
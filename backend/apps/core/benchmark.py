@@ -0,0 +1,181 @@
+"""
+Endpoint latency / query-count benchmarks against a checked-in budget (`manage.py bench_api`).
+
+Every GET route under /api/ is requested through the full middleware stack
+as each benchmark profile (a tenant user and a staff user), after warm-up,
+`repeat` times. For each (route, profile) the status code, SQL query count
+and latency distribution (p50 / p95 / max) are recorded and compared with
+benchmarks/api_budget.json:
+
+    - a route that starts failing (or changes error status) and any
+      increase in query count are regressions
+      (query counts are deterministic for a given dataset)
+    - p95 latency is a regression when it exceeds the budget by more than
+      the relative tolerance *and* the absolute floor (timer noise on
+      sub-10 ms endpoints is not a regression)
+
+Detail routes (`{pk}`) are filled with the first id returned by the sibling
+list route for the same profile; routes with other URL parameters are
+skipped. Streaming responses (exports) are read to the end inside the
+measurement, so their queries and generation time are counted. Run against a seed_scale tenant so numbers reflect production-sized
+tables.
+"""
+import json
+import re
+import statistics
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver
+
+DEFAULT_BUDGET = Path(settings.BASE_DIR) / 'benchmarks' / 'api_budget.json'
+
+_REGEX_PARAM = re.compile(r'\(\?P<(\w+)>[^)]*\)')
+_PATH_PARAM = re.compile(r'<(?:\w+:)?(\w+)>')
+
+
+def route_template(pattern):
+    """'^clients/(?P<pk>[^/.]+)/$' / 'clients/<int:pk>/' -> 'clients/{pk}/'."""
+    part = str(pattern).lstrip('^').rstrip('$')
+    part = _REGEX_PARAM.sub(r'{\1}', part)
+    return _PATH_PARAM.sub(r'{\1}', part).replace('\\', '')
+
+
+def view_handles_get(callback):
+    actions = getattr(callback, 'actions', None)
+    if actions is not None:
+        return 'get' in actions
+    view_class = getattr(callback, 'cls', None) or getattr(callback, 'view_class', None)
+    if view_class is None:
+        return False  # plain function view: methods unknown, not benchmarked
+    return hasattr(view_class, 'get') and 'get' in getattr(view_class, 'http_method_names', ('get',))
+
+
+def iter_get_routes(patterns=None, prefix='/'):
+    """
+    Yields (template, params) for every route answering GET, e.g.
+    ('/api/crm/clients/{pk}/', ['pk']). Format-suffix variants are skipped.
+    """
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    for entry in patterns:
+        part = route_template(entry.pattern)
+        if isinstance(entry, URLResolver):
+            yield from iter_get_routes(entry.url_patterns, prefix + part)
+        elif isinstance(entry, URLPattern) and view_handles_get(entry.callback):
+            template = prefix + part
+            params = re.findall(r'{(\w+)}', template)
+            if 'format' not in params:
+                yield template, params
+
+
+def list_route_for(template):
+    """'/api/crm/clients/{pk}/history/' -> '/api/crm/clients/' (the route listing the pks)."""
+    return template.split('{', 1)[0]
+
+
+def read_body(response):
+    """The response body; a streaming body is consumed (its queries run now)."""
+    if response.streaming:
+        return b''.join(response.streaming_content)
+    return response.content
+
+
+def first_id(response):
+    if response.streaming:
+        return None  # exports (CSV / XLSX), never a list of ids
+    try:
+        data = json.loads(response.content)
+    except ValueError:
+        return None
+    rows = data.get('results', data.get('data')) if isinstance(data, dict) else data
+    if isinstance(rows, dict):  # {"data": {"users": [...]}} envelopes
+        rows = next((value for value in rows.values() if isinstance(value, list)), None)
+    if isinstance(rows, list) and rows and isinstance(rows[0], dict):
+        return rows[0].get('id')
+    return None
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def measure(client, path, repeat, warmup, headers):
+    """Requests path warmup + repeat times; returns the last response and its measurements."""
+    response = None
+    for _ in range(warmup):
+        response = client.get(path, **headers)
+        read_body(response)
+    timings, queries = [], []
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            response = client.get(path, **headers)
+            body = read_body(response)
+            timings.append((time.perf_counter() - start) * 1000)
+        queries.append(len(captured))
+    return response, {
+        'status': response.status_code,
+        'queries': max(queries),
+        'p50_ms': round(statistics.median(timings), 2),
+        'p95_ms': round(percentile(timings, 0.95), 2),
+        'max_ms': round(max(timings), 2),
+        'bytes': len(body),
+    }
+
+
+def budget_key(template, profile):
+    return f'GET {template} [{profile}]'
+
+
+def load_budget(path):
+    path = Path(path)
+    if not path.exists():
+        return {'meta': {}, 'routes': {}}
+    return json.loads(path.read_text())
+
+
+def write_budget(path, results, meta):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    routes = {
+        key: {field: result[field] for field in ('status', 'queries', 'p50_ms', 'p95_ms')}
+        for key, result in sorted(results.items())
+    }
+    path.write_text(json.dumps({'meta': meta, 'routes': routes}, indent=2) + '\n')
+
+
+def compare(results, budget, tolerance, floor_ms):
+    """
+    Diff of measurements against budget entries:
+    [{key, kind: regression|improvement|new|missing|ok, reasons: [...]}]
+    """
+    diff = []
+    routes = budget.get('routes', {})
+    for key, result in sorted(results.items()):
+        expected = routes.get(key)
+        if expected is None:
+            diff.append({'key': key, 'kind': 'new', 'reasons': [], 'result': result})
+            continue
+        worse, better = [], []
+        if result['status'] != expected['status']:
+            # A route that starts failing regresses; one that stops failing improves
+            (better if result['status'] < 400 <= expected['status'] else worse).append(
+                f"status {expected['status']} -> {result['status']}"
+            )
+        if result['queries'] > expected['queries']:
+            worse.append(f"queries {expected['queries']} -> {result['queries']}")
+        elif result['queries'] < expected['queries']:
+            better.append(f"queries {expected['queries']} -> {result['queries']}")
+        delta = result['p95_ms'] - expected['p95_ms']
+        if abs(delta) > max(expected['p95_ms'] * tolerance, floor_ms):
+            (worse if delta > 0 else better).append(f"p95 {expected['p95_ms']:.1f} -> {result['p95_ms']:.1f} ms")
+        kind = 'regression' if worse else 'improvement' if better else 'ok'
+        diff.append({'key': key, 'kind': kind, 'reasons': worse + better, 'result': result, 'budget': expected})
+    for key in sorted(set(routes) - set(results)):
+        diff.append({'key': key, 'kind': 'missing', 'reasons': ['not measured'], 'budget': routes[key]})
+    return diff
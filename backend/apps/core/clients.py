@@ -0,0 +1,28 @@
+"""
+Lazy accessors for heavy third-party SDKs.
+
+Payment and integration SDKs pull in large dependency trees (stripe alone
+imports requests, urllib3 and certifi — ~50 ms) and used to be imported and
+configured at module top, so every process paid for them at startup: web
+workers, `run_jobs`, `migrate`, even `manage.py check`. Import them through
+these accessors instead, at the point of use:
+
+    from apps.core.clients import get_stripe
+
+    session = get_stripe().checkout.Session.create(...)
+
+The SDK is imported and configured on first call and cached for the process.
+`manage.py startup_profile` shows what is still imported eagerly.
+"""
+import functools
+
+from django.conf import settings
+
+
+@functools.cache
+def get_stripe():
+    """The `stripe` module, configured with STRIPE_SECRET_KEY (empty when unset)."""
+    import stripe
+
+    stripe.api_key = getattr(settings, 'STRIPE_SECRET_KEY', None) or None
+    return stripe
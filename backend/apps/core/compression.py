@@ -0,0 +1,159 @@
+"""
+Negotiated response compression (replaces django.middleware.gzip).
+
+CompressionMiddleware picks the best encoding the client accepts
+(Accept-Encoding with q-values) among brotli — when the `brotli` package is
+installed — and gzip, and compresses text-like responses larger than
+COMPRESSION['MIN_SIZE'] bytes. Streaming responses (CSV/JSON exports) are
+compressed chunk by chunk. Small responses are left alone: below ~1 KB the
+CPU cost outweighs the bytes saved.
+
+Compression is subject to BREACH when a response mixes secrets (CSRF tokens)
+with attacker-controlled input. API responses are authenticated by bearer
+token, so JSON / CSV are compressed as is. XLSX is not recompressed: the
+workbook is already a deflated zip archive. HTML (admin, browsable API)
+is handled as Django's GZipMiddleware does: gzip only, with up to
+MAX_RANDOM_BYTES of random padding in the gzip header.
+"""
+import gzip
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence, compress_string
+
+try:
+    import brotli
+except ImportError:  # Brotli disabled — gzip only
+    brotli = None
+
+DEFAULTS = {
+    'ENABLED': True,
+    'MIN_SIZE': 1024,
+    'GZIP_LEVEL': 6,
+    'BROTLI_QUALITY': 5,      # 4-6 is the speed / ratio sweet spot for dynamic content
+    'CONTENT_TYPES': (
+        'application/json', 'text/csv', 'text/plain', 'text/css', 'text/javascript',
+        'application/javascript', 'application/xml', 'text/xml',
+    ),
+    'PADDED_CONTENT_TYPES': ('text/html',),   # may carry CSRF tokens: padded gzip only
+    'MAX_RANDOM_BYTES': 100,                  # as GZipMiddleware.max_random_bytes
+}
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'COMPRESSION', {})}
+
+
+def available_encodings():
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def negotiate(accept_encoding, encodings=None):
+    """Best supported encoding (of `encodings`) for an Accept-Encoding header, or None."""
+    weights = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding] = q
+    best, best_q = None, 0.0
+    for coding in encodings or available_encodings():  # server preference breaks ties
+        q = weights.get(coding, weights.get('*', 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(content, encoding, cfg=None):
+    cfg = cfg or config()
+    if encoding == 'br':
+        return brotli.compress(content, quality=cfg['BROTLI_QUALITY'])
+    return gzip.compress(content, compresslevel=cfg['GZIP_LEVEL'], mtime=0)
+
+
+def _brotli_sequence(sequence, quality):
+    compressor = brotli.Compressor(quality=quality)
+    for chunk in sequence:
+        data = compressor.process(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+class CompressionMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process(request, await self.get_response(request))
+
+    def process(self, request, response):
+        cfg = config()
+        if not cfg['ENABLED'] or not self.is_compressible(response, cfg):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        padded = self.is_padded(response, cfg)
+        encoding = negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''), ('gzip',) if padded else None)
+        if encoding is None:
+            return response
+        max_random_bytes = cfg['MAX_RANDOM_BYTES'] if padded else None
+
+        if response.streaming:
+            if response.is_async:
+                return response
+            if encoding == 'br':
+                response.streaming_content = _brotli_sequence(response.streaming_content, cfg['BROTLI_QUALITY'])
+            else:
+                response.streaming_content = compress_sequence(
+                    response.streaming_content, max_random_bytes=max_random_bytes,
+                )
+            del response.headers['Content-Length']
+        else:
+            if padded:
+                compressed = compress_string(response.content, max_random_bytes=max_random_bytes)
+            else:
+                compressed = compress(response.content, encoding, cfg)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        # Compressed bytes differ from the identity representation (RFC 9110 §8.8.1)
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+    @staticmethod
+    def is_compressible(response, cfg):
+        if response.has_header('Content-Encoding') or response.status_code in (204, 206, 304):
+            return False
+        content_type = response.get('Content-Type', '').lower()
+        if not content_type.startswith(tuple(cfg['CONTENT_TYPES']) + tuple(cfg['PADDED_CONTENT_TYPES'])):
+            return False
+        return response.streaming or len(response.content) >= cfg['MIN_SIZE']
+
+    @staticmethod
+    def is_padded(response, cfg):
+        return response.get('Content-Type', '').lower().startswith(tuple(cfg['PADDED_CONTENT_TYPES']))
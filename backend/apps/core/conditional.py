@@ -0,0 +1,175 @@
+"""
+Conditional GET (ETag / Last-Modified) for polled read endpoints.
+
+ChangeCounter keeps one version stamp per (model, tenant) — and one per model
+across all tenants — in the Django cache. Every committed save / delete /
+m2m change of a model bumps its stamps; bulk `.update()` paths call
+ChangeCounter.bump() themselves.
+
+ConditionalGetMixin builds a weak ETag from the stamps of the models a
+response is derived from (`etag_models`) plus the request URL, user and
+tenant, and answers a matching If-None-Match / If-Modified-Since with 304
+right after authentication — before the queryset or the metrics behind the
+view run:
+
+    class SecurityStatsViewSet(ConditionalGetMixin, viewsets.ViewSet):
+        etag_models = ['soc.Alert', 'soc.Incident', 'soc.ManagedEndpoint', 'soc.CloudApp']
+
+Responses computed over time windows (e.g. "last 30 days") set
+`etag_max_age` so their validators also roll over at least that often;
+CONDITIONAL_GET['MAX_AGE'] bounds every ETag the same way as a safety net for
+writes that bypass both signals and bump().
+"""
+import hashlib
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils.http import http_date, parse_http_date_safe, parse_etags
+
+DEFAULTS = {
+    'ENABLED': True,
+    'MAX_AGE': 900,           # seconds; every ETag rolls over at least this often
+    'TIMEOUT': 86400,         # cache lifetime of a version stamp
+    # High-churn or framework models no conditional endpoint is derived from;
+    # telemetry rows are written per event / sample and only ever listed live
+    'EXCLUDE': [
+        'core.AuditLog', 'core.OutboxMessage', 'core.Job',
+        'soc.NetworkEvent', 'soc.SystemMonitor', 'soc.LogAnalysis',
+        'admin', 'auth.Permission', 'contenttypes', 'sessions', 'token_blacklist',
+    ],
+}
+
+ALL_TENANTS = '*'
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'CONDITIONAL_GET', {})}
+
+
+class ChangeCounter:
+
+    @staticmethod
+    def key(label, tenant_id):
+        return f'changes:{label.lower()}:{tenant_id if tenant_id is not None else ALL_TENANTS}'
+
+    @classmethod
+    def is_tracked(cls, model):
+        exclude = config()['EXCLUDE']
+        return model._meta.label not in exclude and model._meta.app_label not in exclude
+
+    @staticmethod
+    def is_tenant_scoped(label):
+        return any(f.name == 'tenant' for f in apps.get_model(label)._meta.concrete_fields)
+
+    @classmethod
+    def bump(cls, model, tenant_id=None):
+        """Marks the model changed for the tenant (and across tenants) once the transaction commits."""
+        label = model if isinstance(model, str) else model._meta.label
+        keys = {cls.key(label, ALL_TENANTS)}
+        if tenant_id is not None:
+            keys.add(cls.key(label, tenant_id))
+        transaction.on_commit(lambda: cache.set_many(
+            {key: time.time_ns() for key in keys}, timeout=config()['TIMEOUT']
+        ))
+
+    @classmethod
+    def versions(cls, labels, tenant_id=None):
+        """{label: stamp} for the given tenant (or across tenants when None)."""
+        keys = {
+            # Models without a tenant column only have the cross-tenant stamp
+            cls.key(label, tenant_id if cls.is_tenant_scoped(label) else None): label
+            for label in labels
+        }
+        found = cache.get_many(list(keys))
+        now = time.time_ns()
+        for key in set(keys) - set(found):
+            # Unknown or evicted: start a new version rather than guess an old one
+            cache.add(key, now, timeout=config()['TIMEOUT'])
+            found[key] = cache.get(key, now)
+        return {label: found[key] for key, label in keys.items()}
+
+
+def _on_change(sender, instance, **kwargs):
+    if ChangeCounter.is_tracked(sender):
+        ChangeCounter.bump(sender, getattr(instance, 'tenant_id', None))
+
+
+def _on_m2m_change(sender, instance, action, **kwargs):
+    if action.startswith('post_') and ChangeCounter.is_tracked(type(instance)):
+        ChangeCounter.bump(type(instance), getattr(instance, 'tenant_id', None))
+
+
+post_save.connect(_on_change, dispatch_uid='conditional_get_save')
+post_delete.connect(_on_change, dispatch_uid='conditional_get_delete')
+m2m_changed.connect(_on_m2m_change, dispatch_uid='conditional_get_m2m')
+
+
+class ConditionalGetMixin:
+    etag_models = ()          # 'app_label.Model' labels the response is derived from
+    etag_scope = 'tenant'     # 'global' for responses not filtered by tenant (catalogue)
+    etag_vary_on_user = True  # responses filtered by / personalised for request.user
+    etag_max_age = None       # seconds; roll validators over for time-window metrics
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.conditional_validators = None
+        if request.method not in ('GET', 'HEAD') or not self.etag_models or not config()['ENABLED']:
+            return
+        etag, last_modified = self.get_validators(request)
+        self.conditional_validators = (etag, last_modified)
+        if self.is_not_modified(request, etag, last_modified):
+            # DRF looks the handler up after initial(): answer without running it
+            setattr(self, request.method.lower(), self.not_modified)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        validators = getattr(self, 'conditional_validators', None)
+        if validators and response.status_code in (200, 304):
+            etag, last_modified = validators
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+            response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def not_modified(self, request, *args, **kwargs):
+        # Imported here: this module loads from CoreConfig.ready(), before DRF is needed
+        from rest_framework.response import Response
+
+        return Response(status=304)
+
+    def get_etag_tenant(self, request):
+        if self.etag_scope == 'global':
+            return None
+        tenant = getattr(request, 'tenant', None) or getattr(request.user, 'tenant', None)
+        return getattr(tenant, 'pk', None)
+
+    def get_validators(self, request):
+        """(weak ETag, last-modified epoch seconds) for this request."""
+        tenant_id = self.get_etag_tenant(request)
+        versions = ChangeCounter.versions(self.etag_models, tenant_id)
+        max_age = min(filter(None, [self.etag_max_age, config()['MAX_AGE']]))
+        window = int(time.time() // max_age) * max_age
+        parts = [
+            type(self).__module__, type(self).__qualname__, request.get_full_path(),
+            request.headers.get('Accept', ''), str(tenant_id),
+            str(request.user.pk) if self.etag_vary_on_user else '',
+            str(window),
+            *(f'{label}={versions[label]}' for label in sorted(versions)),
+        ]
+        digest = hashlib.sha1('|'.join(parts).encode()).hexdigest()
+        last_modified = max([window, *(stamp // 10 ** 9 for stamp in versions.values())])
+        return f'W/"{digest}"', last_modified
+
+    @staticmethod
+    def is_not_modified(request, etag, last_modified):
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match:
+            # Weak comparison (RFC 9110 §13.1.2): ignore the W/ prefix on both sides
+            wanted = {tag.removeprefix('W/') for tag in parse_etags(if_none_match)}
+            return '*' in wanted or etag.removeprefix('W/') in wanted
+        since = parse_http_date_safe(request.headers.get('If-Modified-Since') or '')
+        return since is not None and last_modified <= since
@@ -0,0 +1,216 @@
+"""
+Deferred domain event bus (Signal Architecture, Charter §20).
+
+Cross-module side effects subscribe to typed events instead of hanging off
+model post_save receivers:
+
+    @EventBus.subscribe(OrderCreated)
+    def generate_invoice(event, context): ...
+
+EventBus.publish() defers dispatch to transaction.on_commit, so subscribers
+never see rows that are later rolled back and never run inside the caller's
+transaction. All subscribers of one event share a single EventContext, which
+resolves the aggregate, its user and the matching CRM Contact / Client once.
+
+settings.EVENT_BUS['MODE']:
+    'sync'  — subscribers run in the committing thread, right after commit
+    'async' — each event is handed to a bounded worker pool, so the request
+              returns without waiting for its subscribers. Events for the
+              same aggregate always go to the same worker and stay in order
+              (OrderCreated is handled before OrderCompleted).
+"""
+import atexit
+import contextvars
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils.functional import cached_property
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'MODE': 'sync',
+    'WORKERS': 4,
+}
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'EVENT_BUS', {})}
+
+
+# ── Events ────────────────────────────────────────────────────────────────
+
+class DomainEvent:
+    """
+    Base event. Events carry primary keys rather than instances so they can
+    be dispatched on another thread; subscribers read rows via the context.
+    """
+    model = None  # 'app_label.Model' of the aggregate
+
+    def __init__(self, pk, tenant_id=None, user_id=None):
+        self.pk = pk
+        self.tenant_id = tenant_id
+        self.user_id = user_id
+
+    @classmethod
+    def from_instance(cls, instance):
+        return cls(
+            instance.pk,
+            tenant_id=getattr(instance, 'tenant_id', None),
+            user_id=getattr(instance, 'user_id', None),
+        )
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.model}:{self.pk})"
+
+
+class OrderCreated(DomainEvent):
+    model = 'store.Order'
+
+
+class OrderCompleted(DomainEvent):
+    model = 'store.Order'
+
+
+class DealWon(DomainEvent):
+    model = 'crm.Deal'
+
+
+# ── Shared context ────────────────────────────────────────────────────────
+
+class EventContext:
+    """
+    Lazily resolved objects shared by every subscriber of one event.
+    Subscribers that create the CRM records (e.g. the order → CRM sync) assign
+    `context.contact` so later subscribers reuse them instead of re-querying.
+    """
+
+    def __init__(self, event):
+        self.event = event
+
+    @cached_property
+    def instance(self):
+        model = apps.get_model(self.event.model)
+        return model._base_manager.filter(pk=self.event.pk).first()
+
+    @cached_property
+    def tenant(self):
+        return getattr(self.instance, 'tenant', None)
+
+    @cached_property
+    def user(self):
+        if self.event.user_id is None:
+            return None
+        User = apps.get_model(settings.AUTH_USER_MODEL)
+        return User._base_manager.filter(pk=self.event.user_id).first()
+
+    @cached_property
+    def contact(self):
+        if not self.user or not self.user.email:
+            return None
+        Contact = apps.get_model('crm', 'Contact')
+        contacts = Contact.all_objects.select_related('client').filter(email=self.user.email, is_deleted=False)
+        if self.tenant is not None:
+            contacts = contacts.filter(tenant=self.tenant)
+        return contacts.first()
+
+    @property
+    def client(self):
+        return self.contact.client if self.contact else None
+
+
+# ── Bus ───────────────────────────────────────────────────────────────────
+
+class EventBus:
+    _subscribers = {}
+    _lock = threading.Lock()
+    _workers = None
+    _stats = {'published': 0, 'dispatched': 0, 'handler_errors': 0}
+
+    @classmethod
+    def subscribe(cls, event_type, priority=100):
+        """Registers handler(event, context). Lower priority runs first within an event."""
+        def decorator(handler):
+            with cls._lock:
+                handlers = cls._subscribers.setdefault(event_type, [])
+                if not any(h is handler for _, h in handlers):
+                    handlers.append((priority, handler))
+                    handlers.sort(key=lambda item: item[0])
+            return handler
+        return decorator
+
+    @classmethod
+    def publish(cls, event):
+        """Dispatches the event once the current transaction commits (immediately in autocommit)."""
+        cls._count('published')
+        transaction.on_commit(lambda: cls._submit(event))
+
+    @classmethod
+    def dispatch(cls, event):
+        """Runs every subscriber of the event in order, isolating failures per handler."""
+        context = EventContext(event)
+        for _, handler in cls._subscribers.get(type(event), []):
+            try:
+                with transaction.atomic():
+                    handler(event, context)
+            except Exception:
+                cls._count('handler_errors')
+                logger.exception(f"EventBus: {handler.__module__}.{handler.__name__} failed for {event!r}")
+        cls._count('dispatched')
+
+    @classmethod
+    def stats(cls):
+        with cls._lock:
+            stats = dict(cls._stats)
+        stats['mode'] = config()['MODE']
+        return stats
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    @classmethod
+    def _submit(cls, event):
+        if config()['MODE'] != 'async':
+            cls.dispatch(event)
+            return
+        # Carry the tenant ContextVar (and any other context) into the worker
+        context = contextvars.copy_context()
+        cls._worker_for(event).submit(context.run, cls._run_in_worker, event)
+
+    @classmethod
+    def _run_in_worker(cls, event):
+        close_old_connections()
+        try:
+            cls.dispatch(event)
+        finally:
+            close_old_connections()
+
+    @classmethod
+    def _worker_for(cls, event):
+        """Single-thread executors partitioned by aggregate, for per-aggregate ordering."""
+        with cls._lock:
+            if cls._workers is None:
+                cls._workers = [
+                    ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'event-bus-{i}')
+                    for i in range(max(config()['WORKERS'], 1))
+                ]
+            return cls._workers[hash((event.model, str(event.pk))) % len(cls._workers)]
+
+    @classmethod
+    def shutdown(cls):
+        """Waits for queued events to be dispatched (atexit, tests)."""
+        with cls._lock:
+            workers, cls._workers = cls._workers, None
+        for executor in workers or ():
+            executor.shutdown(wait=True)
+
+    @classmethod
+    def _count(cls, key):
+        with cls._lock:
+            cls._stats[key] += 1
+
+
+atexit.register(EventBus.shutdown)
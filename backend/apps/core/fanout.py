@@ -0,0 +1,141 @@
+"""
+Concurrent fan-out of independent read-only work (Command Center modules).
+
+    results, failures = FanOut.run({
+        'dashboard.crm': partial(collect, 'crm'),
+        'dashboard.store': partial(collect, 'store'),
+    }, scope=tenant.pk)
+
+Tasks run on a shared, bounded thread pool (FAN_OUT['WORKERS'] threads per
+process). Django connections are per thread, so each pool thread queries over
+its own connection and a caller waits for its slowest task rather than for
+the sum of them. Each task gets a copy of the caller's context, which carries
+the tenant ContextVar.
+
+A task not finished FAN_OUT['TIMEOUTS'][name] (default FAN_OUT['TIMEOUT'])
+seconds after the fan-out started is reported in `failures` as a
+TimeoutError. Its result is discarded. A thread cannot be interrupted, so a
+task that already started finishes in the background and holds its pool slot
+until then. While it does, later runs with the same scope fail that name
+with TimeoutError at once instead of submitting it again: a slow task
+occupies at most one slot per scope however often it is polled. The caller
+passes the scope (the tenant whose data the tasks read), so one tenant's slow
+module does not fail that module for every other tenant. Keep timeouts above
+the statement timeout of the database role.
+
+Other threads cannot see rows the caller has not committed. Inside an atomic
+block (including TestCase), and with FAN_OUT['ENABLED'] off, tasks therefore
+run inline one after another, without timeouts.
+"""
+import atexit
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ENABLED': True,
+    'WORKERS': 8,       # pool threads per process; each may hold a database connection
+    'TIMEOUT': 5.0,     # seconds
+    'TIMEOUTS': {},     # task name -> seconds, e.g. {'dashboard.store': 2.0}
+}
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'FAN_OUT', {})}
+
+
+class FanOut:
+    _lock = threading.Lock()
+    _executor = None
+    _abandoned = {}  # (name, scope) -> future of a timed-out task that is still running
+
+    @classmethod
+    def run(cls, tasks, scope=None):
+        """
+        Runs {name: callable} concurrently. Returns ({name: result},
+        {name: exception}); timed-out tasks fail with TimeoutError. `scope`
+        (e.g. a tenant pk) keys the tasks still running from earlier calls.
+        """
+        cfg = config()
+        if not cfg['ENABLED'] or connection.in_atomic_block:
+            return cls._run_inline(tasks)
+
+        executor = cls._get_executor()
+        start = time.monotonic()
+        results, failures, futures = {}, {}, {}
+        with cls._lock:
+            running = {name for name, key_scope in cls._abandoned if key_scope == scope}
+        for name, task in tasks.items():
+            if name in running:
+                failures[name] = TimeoutError(f'{name} is still running from an earlier call')
+            else:
+                futures[name] = executor.submit(contextvars.copy_context().run, cls._run_task, task)
+        for name, future in futures.items():
+            timeout = cfg['TIMEOUTS'].get(name, cfg['TIMEOUT'])
+            try:
+                results[name] = future.result(timeout=max(0.0, start + timeout - time.monotonic()))
+            except FutureTimeoutError:
+                logger.warning('Fan-out task %s timed out after %.1fs', name, timeout)
+                failures[name] = TimeoutError(f'{name} did not finish within {timeout}s')
+                if not future.cancel():  # cancelled: it was still queued and never starts
+                    cls._abandon((name, scope), future)
+            except Exception as exc:
+                failures[name] = exc
+        return results, failures
+
+    @classmethod
+    def _abandon(cls, key, future):
+        with cls._lock:
+            cls._abandoned[key] = future
+
+        def release(done):
+            with cls._lock:
+                if cls._abandoned.get(key) is done:
+                    del cls._abandoned[key]
+
+        future.add_done_callback(release)  # runs at once if it finished meanwhile
+
+    @staticmethod
+    def _run_inline(tasks):
+        results, failures = {}, {}
+        for name, task in tasks.items():
+            try:
+                results[name] = task()
+            except Exception as exc:
+                failures[name] = exc
+        return results, failures
+
+    @staticmethod
+    def _run_task(task):
+        close_old_connections()
+        try:
+            return task()
+        finally:
+            close_old_connections()
+
+    @classmethod
+    def _get_executor(cls):
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=max(config()['WORKERS'], 1), thread_name_prefix='fan-out',
+                )
+            return cls._executor
+
+    @classmethod
+    def shutdown(cls):
+        """Waits for running tasks to finish (atexit, tests)."""
+        with cls._lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(FanOut.shutdown)
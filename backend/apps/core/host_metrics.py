@@ -0,0 +1,234 @@
+"""
+In-process host metrics sampler (Observability, Charter §19).
+
+A daemon thread samples every INTERVAL seconds into a ring buffer of the
+last HISTORY samples:
+
+    - cpu_percent      busy share of all CPUs since the previous sample (/proc/stat)
+    - memory_percent   MemTotal - MemAvailable over MemTotal (/proc/meminfo)
+    - disk_percent     used share of the filesystem holding DISK_PATH (statvfs, as df)
+    - rss_mb           resident memory of this worker process (/proc/self/statm)
+    - db_ping_ms       connect (if needed) + SELECT 1 from the sampler thread; None when unreachable
+    - error_rate       percent of responses that were 5xx since the previous sample
+
+Health endpoints read HostMetrics.current() and HostMetrics.history(minutes)
+without touching the database. Only the sampler thread samples and writes
+the buffer; until its first sample, or with ENABLED off, current() is None
+and history() empty. Sources missing on the platform (no /proc outside
+Linux) report None. Each worker process samples for itself; host
+figures are the same in all of them, rss_mb and error_rate are per worker.
+The sampler starts with RequestLoggingMiddleware and restarts in a process
+forked after it started (gunicorn --preload).
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ENABLED': True,
+    'INTERVAL': 10,       # seconds between samples
+    'HISTORY': 360,       # samples kept (1 hour at the default interval)
+    'DISK_PATH': '/',
+    'DB_PING': True,
+}
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'HOST_METRICS', {})}
+
+
+# ── Sources ───────────────────────────────────────────────────────────────
+
+def _cpu_times():
+    """(idle, total) jiffies over all CPUs, or None."""
+    try:
+        with open('/proc/stat') as f:
+            fields = [int(value) for value in f.readline().split()[1:]]
+    except (OSError, ValueError):
+        return None
+    # user nice system idle iowait irq softirq steal; guest time is already in user / nice
+    fields = fields[:8]
+    return fields[3] + (fields[4] if len(fields) > 4 else 0), sum(fields)
+
+
+def _load_percent():
+    """Fallback without /proc/stat: 1-minute load average per CPU."""
+    try:
+        return round(os.getloadavg()[0] / (os.cpu_count() or 1) * 100, 2)
+    except (AttributeError, OSError):
+        return None
+
+
+def _memory():
+    """(percent used, available MB), or (None, None)."""
+    values = {}
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                key, _, rest = line.partition(':')
+                if key in ('MemTotal', 'MemAvailable'):
+                    values[key] = int(rest.split()[0])  # kB
+    except (OSError, ValueError, IndexError):
+        return None, None
+    total, available = values.get('MemTotal'), values.get('MemAvailable')
+    if not total or available is None:
+        return None, None
+    return round((total - available) / total * 100, 2), round(available / 1024, 1)
+
+
+def _disk(path):
+    """(percent used, free GB) as df reports them, or (None, None)."""
+    try:
+        st = os.statvfs(path)
+    except (AttributeError, OSError):
+        return None, None
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    usable = used + st.f_bavail * st.f_frsize
+    if not usable:
+        return None, None
+    return round(used / usable * 100, 2), round(st.f_bavail * st.f_frsize / 1024 ** 3, 2)
+
+
+def _rss_mb():
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return round(pages * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2, 1)
+
+
+def _db_ping_ms():
+    start = time.perf_counter()
+    try:
+        connection.ensure_connection()
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+    except Exception:
+        logger.warning('Host metrics database ping failed', exc_info=True)
+        return None
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+class HostMetrics:
+    FIELDS = (
+        'at', 'cpu_percent', 'memory_percent', 'memory_available_mb', 'disk_percent',
+        'disk_free_gb', 'rss_mb', 'db_ping_ms', 'requests', 'error_rate',
+    )
+    _lock = threading.Lock()
+    _samples = deque(maxlen=DEFAULTS['HISTORY'])
+    _thread = None
+    _stop = None
+    _pid = None
+    _cpu = None        # previous (idle, total) reading
+    _responses = None  # previous (requests, errors) totals
+
+    @classmethod
+    def ensure_started(cls):
+        """Starts the sampler thread once per process (again after a fork)."""
+        cfg = config()
+        if not cfg['ENABLED'] or cls._pid == os.getpid():
+            return
+        with cls._lock:
+            if cls._pid == os.getpid():
+                return
+            cls._pid = os.getpid()
+            cls._samples = deque(maxlen=cfg['HISTORY'])
+            cls._cpu = cls._responses = None
+            cls._stop = threading.Event()
+            cls._thread = threading.Thread(
+                target=cls._run, args=(cls._stop, cfg['INTERVAL']), name='host-metrics', daemon=True,
+            )
+            cls._thread.start()
+
+    @classmethod
+    def stop(cls):
+        with cls._lock:
+            if cls._stop is not None:
+                cls._stop.set()
+            cls._pid = None
+
+    @classmethod
+    def _run(cls, stop, interval):
+        while True:
+            try:
+                cls._sample()
+            except Exception:
+                logger.exception('Host metrics sample failed')
+            finally:
+                # The sampler thread's own connection; honours CONN_MAX_AGE like a request
+                close_old_connections()
+            if stop.wait(interval):
+                return
+
+    @classmethod
+    def _sample(cls):
+        """Takes one sample and appends it to the ring buffer. Sampler thread only."""
+        from apps.core.observability import ResponseCounts
+
+        cfg = config()
+        cpu = _cpu_times()
+        responses = ResponseCounts.totals()
+        memory_percent, memory_available_mb = _memory()
+        disk_percent, disk_free_gb = _disk(cfg['DISK_PATH'])
+        sample = {
+            'at': time.time(),
+            'cpu_percent': _load_percent(),
+            'memory_percent': memory_percent,
+            'memory_available_mb': memory_available_mb,
+            'disk_percent': disk_percent,
+            'disk_free_gb': disk_free_gb,
+            'rss_mb': _rss_mb(),
+            'db_ping_ms': _db_ping_ms() if cfg['DB_PING'] else None,
+            'requests': 0,
+            'error_rate': 0.0,
+        }
+        with cls._lock:
+            if cpu and cls._cpu:
+                idle, total = cpu[0] - cls._cpu[0], cpu[1] - cls._cpu[1]
+                if total > 0:
+                    sample['cpu_percent'] = round((1 - idle / total) * 100, 2)
+            if cls._responses:
+                requests, errors = responses[0] - cls._responses[0], responses[1] - cls._responses[1]
+                sample['requests'] = requests
+                sample['error_rate'] = round(errors / requests * 100, 2) if requests else 0.0
+            cls._cpu, cls._responses = cpu, responses
+            cls._samples.append(sample)
+        return sample
+
+    @classmethod
+    def current(cls):
+        """The latest sample (its 'at' tells how old it is), or None before the first one."""
+        cls.ensure_started()
+        with cls._lock:
+            return cls._samples[-1] if cls._samples else None
+
+    @classmethod
+    def history(cls, minutes=None):
+        """Samples of the last `minutes` (all kept samples when None), oldest first."""
+        cls.ensure_started()
+        with cls._lock:
+            samples = list(cls._samples)
+        if minutes is not None:
+            since = time.time() - minutes * 60
+            samples = [sample for sample in samples if sample['at'] >= since]
+        return samples
+
+    @classmethod
+    def availability(cls):
+        """Percent of kept samples whose database ping succeeded, or None without pings."""
+        samples = cls.history()
+        if not samples or not config()['DB_PING']:
+            return None
+        return round(sum(sample['db_ping_ms'] is not None for sample in samples) / len(samples) * 100, 2)
+
+
+atexit.register(HostMetrics.stop)
@@ -0,0 +1,577 @@
+"""
+Streaming bulk imports of CSV / JSON Lines files into tenant-scoped models.
+
+    class ClientImporter(ModelImporter):
+        name = 'crm.clients'
+        model = Client
+        fields = ('name', 'status', 'email', 'assigned_to')
+        match_choices = ('id', 'name', 'email')
+        lookups = {'assigned_to': 'email'}
+
+    ImporterRegistry.register(ClientImporter)
+
+Entry points: `manage.py import_records`, POST /api/core/imports/ and the
+`import` action BulkImportMixin adds to a resource's ViewSet. Each run is an
+ImportRun row whose counters are updated after every batch; small uploads
+are imported inline, larger ones are stored and handed to the 'imports'
+job queue (apps.core.tasks.run_import).
+
+The file is read incrementally and processed IMPORTS['BATCH_SIZE'] rows at a
+time, with a fixed number of queries per batch whatever its size:
+
+    - existing rows are matched on the run's match fields (default: id),
+      so re-importing a file updates rather than duplicates
+    - foreign keys are given either as `<field>_id` (primary key) or as
+      `<field>` (the importer's lookup field, e.g. a client's name), and
+      resolved within the tenant
+    - rows are validated with full_clean() (foreign keys and unique fields
+      are checked in bulk instead of per row); invalid rows are reported
+      with their line number and skipped
+    - valid rows are written with bulk_create / bulk_update in one
+      transaction, together with one audit entry for the batch
+
+bulk_create / bulk_update send no post_save signals: importers must not be
+declared for models whose save() or signal handlers maintain other data.
+"""
+import codecs
+import csv
+import io
+import json
+from collections import defaultdict
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.files.storage import default_storage
+from django.db import DatabaseError, models, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+from django.utils.text import get_valid_filename
+
+try:
+    import orjson
+except ImportError:  # stdlib json parses JSON Lines instead
+    orjson = None
+
+DEFAULTS = {
+    'BATCH_SIZE': 1000,
+    'UPDATE_BATCH_SIZE': 100,         # rows per UPDATE ... CASE statement; cost grows with its square
+    'INLINE_MAX_BYTES': 1024 * 1024,  # larger uploads are queued instead of imported in the request
+    'MAX_ERRORS': 100,                # row errors kept on the ImportRun
+    'STORAGE_PREFIX': 'imports/',
+}
+
+FORMATS = ('csv', 'jsonl')
+TRUE_VALUES = {'true', 't', 'yes', 'y', '1'}
+FALSE_VALUES = {'false', 'f', 'no', 'n', '0'}
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'IMPORTS', {})}
+
+
+class ImportFileError(Exception):
+    """The file as a whole cannot be read (wrong format, bad encoding, missing header)."""
+
+
+# ── Parsing ───────────────────────────────────────────────────────────────
+
+def detect_format(filename):
+    """'clients.csv' -> 'csv', 'clients.jsonl' / '.ndjson' -> 'jsonl', otherwise None."""
+    suffix = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    return {'csv': 'csv', 'jsonl': 'jsonl', 'ndjson': 'jsonl'}.get(suffix)
+
+
+def iter_rows(fileobj, fmt):
+    """
+    Yields (line number, {column: value}) from a binary file object, one row
+    at a time. CSV values are strings; JSON Lines values keep their JSON type.
+    Rows that are not an object are yielded as (line, ImportFileError).
+    """
+    if fmt == 'csv':
+        text = io.TextIOWrapper(fileobj, encoding='utf-8-sig', newline='')
+        reader = csv.DictReader(text)
+        try:
+            if not reader.fieldnames:
+                raise ImportFileError('The CSV file has no header row.')
+            reader.fieldnames = [name.strip() for name in reader.fieldnames]
+            for row in reader:
+                yield reader.line_num, {key: value for key, value in row.items() if key is not None}
+        except (UnicodeDecodeError, csv.Error) as exc:
+            raise ImportFileError(f'Line {reader.line_num}: {exc}') from exc
+        finally:
+            text.detach()  # leave the caller's file open
+    elif fmt == 'jsonl':
+        decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        for line_no, raw in enumerate(fileobj, start=1):
+            try:
+                line = decoder.decode(raw).strip()
+            except UnicodeDecodeError as exc:
+                raise ImportFileError(f'Line {line_no}: {exc}') from exc
+            if not line:
+                continue
+            try:
+                row = orjson.loads(line) if orjson is not None else json.loads(line)
+            except ValueError as exc:
+                yield line_no, ImportFileError(f'Invalid JSON: {exc}')
+                continue
+            yield line_no, row if isinstance(row, dict) else ImportFileError('Each line must be a JSON object.')
+    else:
+        raise ImportFileError(f"Unsupported format {fmt!r}; use one of: {', '.join(FORMATS)}.")
+
+
+def batches(rows, size):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+# ── Importers ─────────────────────────────────────────────────────────────
+
+def scoped_queryset(model, tenant):
+    """Live rows of the model belonging to the tenant (no reliance on the request context)."""
+    queryset = model._base_manager.all()
+    names = {field.name for field in model._meta.concrete_fields}
+    if 'tenant' in names:
+        queryset = queryset.filter(tenant=tenant)
+    if 'is_deleted' in names:
+        queryset = queryset.filter(is_deleted=False)
+    return queryset
+
+
+class ModelImporter:
+    """
+    Imports rows into `model` for one ImportRun. Subclasses declare:
+
+        name           registry key, '<app>.<resource>'
+        model          the tenant-scoped model written to
+        fields         importable model fields (foreign keys by field name)
+        match_choices  fields (or field combinations, comma-separated) a run
+                       may match existing rows on; the first is the default
+        lookups        {foreign key: field of the related model} accepted in
+                       the `<field>` column instead of a `<field>_id`
+    """
+    name = None
+    model = None
+    fields = ()
+    match_choices = ('id',)
+    lookups = {}
+
+    def __init__(self, run):
+        self.run = run
+        self.tenant = run.tenant
+        self.match_fields = tuple(run.match_fields or self.match_choices[0].split(','))
+        self.batch_number = 0
+        opts = self.model._meta
+        self.model_fields = {name: opts.get_field(name) for name in self.fields}
+        self.foreign_keys = {
+            name: field for name, field in self.model_fields.items() if isinstance(field, models.ForeignKey)
+        }
+        self.unique_fields = [
+            name for name, field in self.model_fields.items() if field.unique and not field.primary_key
+        ]
+        self.key_fields = [opts.get_field(name) for name in self.match_fields]
+        # Checked in bulk (resolve_references / check_unique) rather than one query per row
+        self.clean_exclude = [field.name for field in opts.concrete_fields if field.is_relation]
+
+    @classmethod
+    def validate_match(cls, match):
+        """Normalised match fields for a `--match` / `match` value, or ValueError."""
+        choices = {choice.replace(' ', '') for choice in cls.match_choices}
+        value = (match or cls.match_choices[0]).replace(' ', '')
+        if value not in choices:
+            raise ValueError(f"Cannot match {cls.name} rows on {value!r}; choose from: {', '.join(sorted(choices))}.")
+        return value.split(',')
+
+    @classmethod
+    def columns(cls):
+        """Accepted column names, for help texts and error messages."""
+        opts = cls.model._meta
+        names = []
+        for name in dict.fromkeys(('id', *cls.fields)):
+            field = opts.get_field(name)
+            if isinstance(field, models.ForeignKey):
+                names.append(f'{name}_id')
+                if name in cls.lookups:
+                    names.append(f'{name} ({cls.lookups[name]})')
+            else:
+                names.append(name)
+        return names
+
+    # ── Batch processing ──────────────────────────────────────────────────
+
+    def process(self, batch):
+        """
+        Validates and writes one batch of (line, row) pairs. Returns
+        (created, updated, errors) where errors are {'line', 'errors'} dicts.
+        """
+        self.batch_number += 1
+        errors = []
+        parsed = []
+        for line, row in batch:
+            if isinstance(row, Exception):
+                errors.append({'line': line, 'errors': {'__all__': [str(row)]}})
+            else:
+                parsed.append((line, row))
+
+        references = self.resolve_references(parsed)
+        existing = self.match_existing(parsed)
+        new, changed, seen = [], [], {}
+        for line, row in parsed:
+            try:
+                key = self.match_key(row)
+                if key is not None and key in seen:
+                    raise ValidationError(f'Duplicate of line {seen[key]}.')
+                instance, written = self.build(row, key, existing.get(key) if key else None, references)
+            except ValidationError as exc:
+                errors.append({'line': line, 'errors': self.messages(exc)})
+                continue
+            if key is not None:
+                seen[key] = line
+            if instance._state.adding:
+                new.append((line, instance))
+            elif written:
+                changed.append((line, instance, written))
+            # else: identical to the stored row, nothing to write
+
+        errors.extend(self.check_unique([(line, instance) for line, instance, *_ in new + changed]))
+        rejected = {error['line'] for error in errors}
+        new = [instance for line, instance in new if line not in rejected]
+        changed = [(instance, written) for line, instance, written in changed if line not in rejected]
+
+        if not self.run.dry_run and (new or changed):
+            self.write(new, changed, lines=(batch[0][0], batch[-1][0]), failed=len(errors))
+        return len(new), len(changed), errors
+
+    def write(self, new, changed, lines, failed):
+        from .conditional import ChangeCounter
+        from .kpis import KPICounters
+        from .services.audit import AuditService
+
+        with transaction.atomic():
+            if new:
+                self.model._base_manager.bulk_create(new, batch_size=config()['BATCH_SIZE'])
+            if changed:
+                self.update(changed)
+            entry = AuditService.build_entry(None, self.audit_action, f'core.ImportRun:{self.run.pk}', {
+                'resource': self.name, 'batch': self.batch_number, 'lines': list(lines),
+                'created': len(new), 'updated': len(changed), 'failed': failed,
+            })
+            entry.user, entry.tenant = self.run.user, self.tenant
+            AuditService.log_actions([entry])
+            ChangeCounter.bump(self.model, self.tenant.pk)
+            KPICounters.invalidate(self.model, self.tenant.pk)
+
+    def update(self, changed):
+        """
+        Writes (instance, changed field names) pairs. Rows receiving identical
+        values (e.g. a status change across many rows) share one
+        UPDATE ... WHERE pk IN (...); the rest go through bulk_update, whose
+        per-row CASE expressions are far more expensive to build.
+        """
+        manager = self.model._base_manager
+        extra = {}
+        if any(field.name == 'updated_at' for field in self.model._meta.concrete_fields):
+            extra['updated_at'] = timezone.now()  # auto_now is applied by neither update() nor bulk_update()
+
+        groups = defaultdict(list)
+        for instance, written in changed:
+            values = tuple((name, getattr(instance, self.model_fields[name].attname)) for name in sorted(written))
+            groups[values].append(instance)
+        singles, update_fields = [], set()
+        for values, instances in groups.items():
+            if len(instances) > 1:
+                manager.filter(pk__in=[instance.pk for instance in instances]).update(
+                    **{self.model_fields[name].attname: value for name, value in values}, **extra
+                )
+            else:
+                singles.extend(instances)
+                update_fields.update(name for name, _ in values)
+        if singles:
+            for instance in singles:
+                for name, value in extra.items():
+                    setattr(instance, name, value)
+            manager.bulk_update(singles, sorted(update_fields | set(extra)), batch_size=config()['UPDATE_BATCH_SIZE'])
+
+    @property
+    def audit_action(self):
+        return self.name.replace('.', '_').upper() + '_IMPORTED'  # e.g. CRM_CLIENTS_IMPORTED
+
+    # ── Rows ──────────────────────────────────────────────────────────────
+
+    def build(self, row, key, instance, references):
+        """Applies the row onto instance (or a new one); returns it and the field names written."""
+        if instance is None:
+            instance = self.model(tenant=self.tenant)
+            if key is not None:
+                # A new row keeps its match values (e.g. the id), so importing the file again updates it
+                for field, value in zip(self.key_fields, key):
+                    setattr(instance, field.attname, value)
+        before = None if instance._state.adding else {
+            name: getattr(instance, field.attname) for name, field in self.model_fields.items()
+        }
+        errors, written = {}, []
+        for name, field in self.model_fields.items():
+            if isinstance(field, models.ForeignKey):
+                found, value = self.reference_value(name, row, references)
+                if isinstance(value, ValidationError):
+                    errors[name] = value.messages
+                elif found:
+                    setattr(instance, field.attname, value)
+                    written.append(name)
+                continue
+            if name not in row:
+                continue
+            setattr(instance, field.attname, self.clean_value(field, row[name]))
+            written.append(name)
+        for field in self.model._meta.concrete_fields:
+            if field.is_relation and field.name != 'tenant' and not field.null and getattr(instance, field.attname) is None:
+                errors.setdefault(field.name, ['This field is required.'])
+        try:
+            instance.full_clean(exclude=self.clean_exclude, validate_unique=False, validate_constraints=False)
+        except ValidationError as exc:
+            errors.update(exc.message_dict)
+        if errors:
+            raise ValidationError(errors)
+        if before is not None:
+            # Only columns whose value actually changes are updated (compared after cleaning)
+            written = [
+                name for name in written if getattr(instance, self.model_fields[name].attname) != before[name]
+            ]
+        return instance, written
+
+    @staticmethod
+    def clean_value(field, value):
+        if isinstance(value, str):
+            value = value.strip()
+            if value == '':
+                if field.null:
+                    return None
+                return '' if field.empty_strings_allowed else field.get_default()
+            if isinstance(field, models.BooleanField):
+                lowered = value.lower()
+                if lowered in TRUE_VALUES:
+                    return True
+                if lowered in FALSE_VALUES:
+                    return False
+        return value
+
+    def match_key(self, row):
+        """Tuple of python values of the match fields, or None when the row does not carry them."""
+        key = []
+        for field in self.key_fields:
+            column = field.attname if isinstance(field, models.ForeignKey) else field.name
+            raw = row.get(column)
+            if raw is None or (isinstance(raw, str) and not raw.strip()):
+                return None
+            key.append(field.to_python(raw.strip() if isinstance(raw, str) else raw))
+        return tuple(key)
+
+    def match_existing(self, parsed):
+        """{match key: instance} for the batch's rows that already exist — one query."""
+        keys = set()
+        for _, row in parsed:
+            try:
+                key = self.match_key(row)
+            except ValidationError:
+                continue  # reported when the row is built
+            if key is not None:
+                keys.add(key)
+        if not keys:
+            return {}
+        first = self.key_fields[0]
+        queryset = scoped_queryset(self.model, self.tenant).filter(**{f'{first.attname}__in': {key[0] for key in keys}})
+        found = {}
+        for instance in queryset:
+            key = tuple(getattr(instance, field.attname) for field in self.key_fields)
+            if key in keys:
+                found.setdefault(key, instance)
+        return found
+
+    def resolve_references(self, parsed):
+        """
+        {(foreign key, column): {value: pk}} for every foreign key column used
+        in the batch — one query per column, restricted to the tenant's rows.
+        """
+        resolved = {}
+        for name, field in self.foreign_keys.items():
+            related = field.related_model
+            for column, lookup in ((field.attname, related._meta.pk.name), (name, self.lookups.get(name))):
+                if lookup is None:
+                    continue
+                values = set()
+                for _, row in parsed:
+                    value = row.get(column)
+                    if value is not None and str(value).strip():
+                        values.add(str(value).strip())
+                if not values:
+                    continue
+                if lookup == related._meta.pk.name:
+                    values = self.valid_pks(related, values)
+                pairs = self.reference_queryset(field).filter(**{f'{lookup}__in': values}).values_list(lookup, 'pk')
+                resolved[(name, column)] = {str(value): pk for value, pk in pairs}
+        return resolved
+
+    def reference_queryset(self, field):
+        """Rows a foreign key may point at: the tenant's, plus staff for user references."""
+        related = field.related_model
+        if related is get_user_model():
+            return related._base_manager.filter(Q(tenant=self.tenant) | Q(is_staff=True), is_active=True)
+        return scoped_queryset(related, self.tenant)
+
+    @staticmethod
+    def valid_pks(model, values):
+        pk = model._meta.pk
+        valid = set()
+        for value in values:
+            try:
+                valid.add(pk.to_python(value))
+            except ValidationError:
+                pass
+        return valid
+
+    def reference_value(self, name, row, references):
+        """(found, pk) for the row's foreign key; pk is a ValidationError when it does not resolve."""
+        field = self.foreign_keys[name]
+        for column in (field.attname, name):
+            if column not in row or (column == name and name not in self.lookups):
+                continue
+            raw = row[column]
+            value = str(raw).strip() if raw is not None else ''
+            if not value:
+                if not field.null:
+                    return True, ValidationError(f'{column} is required.')
+                return True, None
+            pk = references.get((name, column), {}).get(value)
+            if pk is None:
+                related = field.related_model._meta
+                lookup = related.pk.name if column == field.attname else self.lookups[name]
+                return True, ValidationError(f'No {related.verbose_name} with {lookup} {value!r}.')
+            return True, pk
+        return False, None
+
+    def check_unique(self, pending):
+        """Row errors for unique fields clashing with another row of the batch or the table."""
+        errors = []
+        for name in self.unique_fields:
+            attname = self.model_fields[name].attname
+            values = {}
+            for line, instance in pending:
+                value = getattr(instance, attname)
+                if value in (None, ''):
+                    continue
+                if value in values:
+                    errors.append({'line': line, 'errors': {name: [f'Duplicate of line {values[value][0]}.']}})
+                else:
+                    values[value] = (line, instance.pk)
+            if not values:
+                continue
+            # Unique across the whole table, not just the tenant
+            taken = dict(self.model._base_manager.filter(**{f'{attname}__in': list(values)}).values_list(attname, 'pk'))
+            for value, (line, pk) in values.items():
+                if value in taken and taken[value] != pk:
+                    errors.append({'line': line, 'errors': {name: [f'{value!r} is already in use.']}})
+        return errors
+
+    @staticmethod
+    def messages(exc):
+        return exc.message_dict if hasattr(exc, 'error_dict') else {'__all__': exc.messages}
+
+
+class ImporterRegistry:
+    _importers = {}
+    _discovered = False
+
+    @classmethod
+    def register(cls, importer):
+        cls._importers[importer.name] = importer
+        return importer
+
+    @classmethod
+    def autodiscover(cls):
+        """Imports every installed app's importers module (once)."""
+        if not cls._discovered:
+            autodiscover_modules('importers')
+            cls._discovered = True
+
+    @classmethod
+    def get(cls, name):
+        cls.autodiscover()
+        if name not in cls._importers:
+            raise ValueError(f"Unknown import resource {name!r}; choose from: {', '.join(sorted(cls._importers))}.")
+        return cls._importers[name]
+
+    @classmethod
+    def all(cls):
+        cls.autodiscover()
+        return dict(sorted(cls._importers.items()))
+
+
+# ── Runs ──────────────────────────────────────────────────────────────────
+
+def start_import(tenant, user, resource, upload, fmt=None, match=None, dry_run=False):
+    """
+    Creates the ImportRun for an uploaded file. Files up to INLINE_MAX_BYTES
+    are imported immediately; larger ones are saved to default_storage and
+    queued. Raises ValueError for an unknown resource, format or match.
+    """
+    from .models import ImportRun
+    from .tasks import process_import
+
+    importer = ImporterRegistry.get(resource)
+    fmt = fmt or detect_format(upload.name)
+    if fmt not in FORMATS:
+        raise ValueError(f"Cannot tell the format of {upload.name!r}; pass format ({', '.join(FORMATS)}).")
+    run = ImportRun.objects.create(
+        tenant=tenant, user=user, resource=resource, format=fmt, file_name=upload.name,
+        match_fields=importer.validate_match(match), dry_run=dry_run,
+    )
+    settings_ = config()
+    if upload.size <= settings_['INLINE_MAX_BYTES']:
+        return run_import(run, upload)
+    run.file_path = default_storage.save(
+        f"{settings_['STORAGE_PREFIX']}{run.pk}-{get_valid_filename(upload.name)}", upload
+    )
+    run.save(update_fields=['file_path'])
+    process_import.delay(str(run.pk))
+    return run
+
+
+def run_import(run, fileobj, progress=None, batch_size=None):
+    """
+    Imports the binary file object for the ImportRun, saving its counters after
+    every batch and calling progress(run) if given. File-level problems mark
+    the run failed; row problems are recorded in run.errors.
+    """
+    settings_ = config()
+    importer = ImporterRegistry.get(run.resource)(run)
+    fileobj = getattr(fileobj, 'file', fileobj)  # Django File / UploadedFile -> the raw binary file
+    run.status, run.started_at = run.STATUS_RUNNING, timezone.now()
+    run.save(update_fields=['status', 'started_at'])
+    counters = ['processed', 'created', 'updated', 'failed', 'errors']
+    try:
+        for batch in batches(iter_rows(fileobj, run.format), batch_size or settings_['BATCH_SIZE']):
+            try:
+                created, updated, errors = importer.process(batch)
+            except DatabaseError as exc:
+                # The batch transaction rolled back: every row of it failed
+                created, updated = 0, 0
+                errors = [{'line': batch[0][0], 'errors': {'__all__': [f'Batch of {len(batch)} rows not written: {exc}']}}]
+                run.failed += len(batch) - 1
+            run.processed += len(batch)
+            run.created += created
+            run.updated += updated
+            run.failed += len(errors)
+            run.errors = (run.errors + errors)[:settings_['MAX_ERRORS']]
+            run.save(update_fields=counters)
+            if progress is not None:
+                progress(run)
+    except ImportFileError as exc:
+        run.status, run.last_error = run.STATUS_FAILED, str(exc)
+    else:
+        run.status = run.STATUS_DONE
+    run.finished_at = timezone.now()
+    run.save(update_fields=[*counters, 'status', 'last_error', 'finished_at'])
+    return run
@@ -0,0 +1,292 @@
+"""
+Database-backed background jobs (no broker).
+
+    @job(queue='soc', priority=10)
+    def isolate_asset_task(endpoint_id): ...
+
+    isolate_asset_task.delay(endpoint.pk)              # run as soon as a worker is free
+    isolate_asset_task.schedule(endpoint.pk, delay=60) # run in a minute
+
+Enqueuing inserts a Job row in the caller's transaction, so a job exists if
+and only if the work that requested it committed. `manage.py run_jobs`
+starts worker processes that claim jobs with SELECT ... FOR UPDATE SKIP
+LOCKED, highest priority first, never running more than a queue's
+CONCURRENCY at once across all workers. Jobs run inside the tenant context
+they were enqueued from; failures are retried with exponential backoff and
+marked failed after max_attempts. A worker that dies mid-job leaves a lease
+behind which expires after LEASE seconds, after which the job is claimed again.
+
+Arguments and results must be JSON-serialisable; pass primary keys, not
+model instances.
+"""
+import json
+import logging
+import os
+import random
+import socket
+import traceback
+import uuid
+import zlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, models, transaction
+from django.db.models import F, Min, Q
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules, import_string
+
+from .middleware import get_current_tenant, tenant_context
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'PROCESSES': 2,
+    'QUEUES': {
+        'default': {'CONCURRENCY': 4},
+    },
+    'MAX_ATTEMPTS': 3,
+    'BACKOFF_BASE': 5.0,      # seconds, doubled per attempt
+    'BACKOFF_MAX': 900,
+    'LEASE': 600,             # seconds a running job may take before it is re-claimed
+    'POLL_INTERVAL': 1.0,
+}
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'JOB_QUEUE', {})}
+
+
+def queue_concurrency(queue):
+    """Max jobs of the queue running at once across all workers (None = unlimited)."""
+    return config()['QUEUES'].get(queue, {}).get('CONCURRENCY')
+
+
+# ── Task registry ─────────────────────────────────────────────────────────
+
+class Task:
+    """A function registered as a background job. Calling it runs it inline."""
+
+    def __init__(self, func, queue='default', priority=0, max_attempts=None):
+        self.func = func
+        self.name = f'{func.__module__}.{func.__name__}'
+        self.queue = queue
+        self.priority = priority
+        self.max_attempts = max_attempts
+        self.__doc__ = func.__doc__
+        self.__name__ = func.__name__
+        self.__module__ = func.__module__
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def delay(self, *args, **kwargs):
+        return self.schedule(*args, **kwargs)
+
+    def schedule(self, *args, delay=None, run_at=None, priority=None, queue=None, **kwargs):
+        """Enqueues the task; `delay` (seconds or timedelta) or `run_at` defer it."""
+        from .models import Job
+
+        if run_at is None:
+            run_at = timezone.now()
+            if delay is not None:
+                run_at += delay if isinstance(delay, timedelta) else timedelta(seconds=delay)
+        return Job.objects.create(
+            queue=queue or self.queue,
+            task=self.name,
+            args=_json(list(args)),
+            kwargs=_json(kwargs),
+            priority=self.priority if priority is None else priority,
+            max_attempts=self.max_attempts or config()['MAX_ATTEMPTS'],
+            run_at=run_at,
+            tenant=get_current_tenant(),
+        )
+
+    def __repr__(self):
+        return f'<Task {self.name} queue={self.queue}>'
+
+
+class JobRegistry:
+    _tasks = {}
+
+    @classmethod
+    def register(cls, task):
+        cls._tasks[task.name] = task
+        return task
+
+    @classmethod
+    def get(cls, name):
+        if name not in cls._tasks:
+            # Task modules not imported in this process yet
+            task = import_string(name)
+            if not isinstance(task, Task):
+                raise ImportError(f"'{name}' is not a registered job")
+            cls.register(task)
+        return cls._tasks[name]
+
+    @classmethod
+    def queues(cls):
+        """Configured queues plus every queue a registered task uses."""
+        return sorted(set(config()['QUEUES']) | {task.queue for task in cls._tasks.values()})
+
+    @classmethod
+    def autodiscover(cls):
+        """Imports every installed app's tasks module so the worker knows all jobs."""
+        autodiscover_modules('tasks')
+
+
+def job(queue='default', priority=0, max_attempts=None):
+    """Registers the decorated function as a background job."""
+    def decorator(func):
+        return JobRegistry.register(Task(func, queue=queue, priority=priority, max_attempts=max_attempts))
+    return decorator
+
+
+# ── Worker side ───────────────────────────────────────────────────────────
+
+class JobQueue:
+
+    @classmethod
+    def worker_id(cls):
+        return f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+
+    @classmethod
+    def claim(cls, worker_id, queues=None):
+        """
+        Leases the next runnable job to worker_id and returns it, or None.
+        Jobs are taken highest priority first across the given queues, skipping
+        queues that already run their CONCURRENCY limit. On PostgreSQL a
+        transaction-level advisory lock per limited queue makes the "count
+        running, then claim" step atomic across workers.
+        """
+        from .models import Job
+
+        queues = sorted(queues or JobRegistry.queues())
+        limits = {queue: queue_concurrency(queue) for queue in queues}
+        now = timezone.now()
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    for queue in queues:  # sorted, so workers never deadlock on each other
+                        if limits[queue] is not None:
+                            cursor.execute('SELECT pg_advisory_xact_lock(%s)', [zlib.crc32(f'jobs:{queue}'.encode())])
+            running = dict(
+                Job.objects.filter(queue__in=queues, status=Job.STATUS_RUNNING, locked_until__gte=now)
+                .values_list('queue').annotate(total=models.Count('id')).order_by()
+            )
+            open_queues = [
+                queue for queue in queues
+                if limits[queue] is None or running.get(queue, 0) < limits[queue]
+            ]
+            if not open_queues:
+                return None
+            ready = Q(queue__in=open_queues) & (
+                Q(status=Job.STATUS_QUEUED, run_at__lte=now)
+                | Q(status=Job.STATUS_RUNNING, locked_until__lt=now)
+            )
+            pk = (
+                Job.objects.select_for_update(skip_locked=True)
+                .filter(ready)
+                .order_by('-priority', 'run_at', 'id')
+                .values_list('id', flat=True)
+                .first()
+            )
+            if pk is None:
+                return None
+            claimed = Job.objects.filter(ready, pk=pk).update(
+                status=Job.STATUS_RUNNING,
+                locked_by=worker_id,
+                locked_until=now + timedelta(seconds=config()['LEASE']),
+                attempts=F('attempts') + 1,
+                started_at=now,
+            )
+            if not claimed:
+                return None
+        return Job.objects.select_related('tenant').get(pk=pk)
+
+    @classmethod
+    def run(cls, job):
+        """Executes a claimed job and records the outcome. Returns True on success."""
+        from .models import Job
+
+        try:
+            task = JobRegistry.get(job.task)
+            with tenant_context(job.tenant):
+                result = task.func(*job.args, **job.kwargs)
+        except Exception:
+            cls._fail(job, traceback.format_exc())
+            return False
+        Job.objects.filter(pk=job.pk, locked_by=job.locked_by).update(
+            status=Job.STATUS_DONE,
+            result=_json(result),
+            finished_at=timezone.now(),
+            locked_until=None,
+            last_error='',
+        )
+        return True
+
+    @classmethod
+    def run_next(cls, worker_id, queues=None):
+        """Claims and runs one job. Returns None when nothing was runnable."""
+        job = cls.claim(worker_id, queues)
+        if job is None:
+            return None
+        return cls.run(job)
+
+    @classmethod
+    def stats(cls):
+        """Per-queue depth, running count and oldest-job lag for the health endpoints."""
+        from .models import Job
+
+        now = timezone.now()
+        rows = Job.objects.values_list('queue', 'status').annotate(total=models.Count('id')).order_by()
+        queues = {}
+        for queue, status, total in rows:
+            queues.setdefault(queue, {'queued': 0, 'running': 0, 'done': 0, 'failed': 0})[status] = total
+        for queue in queues:
+            queues[queue]['concurrency'] = queue_concurrency(queue)
+        oldest = Job.objects.filter(status=Job.STATUS_QUEUED, run_at__lte=now).aggregate(oldest=Min('run_at'))['oldest']
+        return {
+            'queues': queues,
+            'scheduled': Job.objects.filter(status=Job.STATUS_QUEUED, run_at__gt=now).count(),
+            'lag_seconds': round((now - oldest).total_seconds(), 1) if oldest else 0.0,
+        }
+
+    @classmethod
+    def purge(cls, older_than_days):
+        """Deletes finished jobs (done or failed) older than the given age."""
+        from .models import Job
+
+        cutoff = timezone.now() - timedelta(days=older_than_days)
+        deleted, _ = Job.objects.filter(
+            status__in=[Job.STATUS_DONE, Job.STATUS_FAILED], finished_at__lt=cutoff
+        ).delete()
+        return deleted
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    @classmethod
+    def _fail(cls, job, error):
+        from .models import Job
+
+        cfg = config()
+        if job.attempts >= job.max_attempts:
+            status, delay = Job.STATUS_FAILED, 0
+            logger.error(f"Jobs: {job} failed permanently after {job.attempts} attempts")
+        else:
+            status = Job.STATUS_QUEUED
+            delay = min(cfg['BACKOFF_BASE'] * 2 ** (job.attempts - 1), cfg['BACKOFF_MAX'])
+            delay *= random.uniform(0.8, 1.2)
+            logger.warning(f"Jobs: {job} failed (attempt {job.attempts}), retrying in {delay:.1f}s")
+        now = timezone.now()
+        Job.objects.filter(pk=job.pk, locked_by=job.locked_by).update(
+            status=status,
+            run_at=now + timedelta(seconds=delay),
+            locked_until=None,
+            last_error=error[-4000:],
+            finished_at=now if status == Job.STATUS_FAILED else None,
+        )
+
+
+def _json(value):
+    return json.loads(json.dumps(value, cls=DjangoJSONEncoder))
@@ -0,0 +1,378 @@
+"""
+Incrementally maintained KPI counters (TenantKPICounter) for the Command
+Center and SOC stats.
+
+A KPI counts the rows of one model that match a set of field lookups:
+
+    KPI('soc.alerts.unresolved', 'soc.Alert', is_resolved=False)
+
+    KPICounters.get(['soc.alerts', 'soc.alerts.unresolved'], tenant)
+    -> {'soc.alerts': 201, 'soc.alerts.unresolved': 37}      # one query
+
+Counters are kept per tenant; the counter with tenant NULL counts the rows
+that have no tenant. Figures across tenants are the SUM of those counters,
+taken on read, so a write only ever touches the counter row of its own
+tenant.
+
+Every tracked model remembers the values its KPIs look at when an instance
+is loaded (post_init). On save / delete the old and new values are matched
+against each KPI, and the differences are added to the tenant's counters.
+The UPDATE runs in the transaction of the write, so a rolled-back write
+never moves a counter. Rows count the way the model's default manager
+does: soft-deleted rows are excluded only where `objects` excludes them.
+
+Counters that do not exist yet are counted from their table the first time
+they are read, then recounted with the counter rows locked: a write that
+committed between the count and the insert found no row to update. Writes
+that bypass signals (bulk_create, queryset.update(), raw deletes) call
+KPICounters.invalidate() so their counters are recounted on the next read.
+`manage.py rebuild_kpis` recomputes every counter from scratch and reports
+drift. Time-windowed figures ("resolved today", "expiring in 30 days")
+cannot be maintained by events and stay aggregate queries.
+"""
+import logging
+import operator
+from collections import defaultdict
+
+from django.apps import apps
+from django.db import DatabaseError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.signals import post_delete, post_init, post_save
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()  # field deferred when the instance was loaded
+
+_OPERATORS = {
+    'exact': operator.eq,
+    'in': lambda value, expected: value in expected,
+    'lt': operator.lt,
+    'lte': operator.le,
+    'gt': operator.gt,
+    'gte': operator.ge,
+}
+
+
+class KPI:
+    def __init__(self, key, label, **lookups):
+        self.key = key
+        self.label = label
+        self.lookups = lookups
+
+    @cached_property
+    def model(self):
+        return apps.get_model(self.label)
+
+    @cached_property
+    def conditions(self):
+        from .models import SoftDeleteManager
+        lookups = dict(self.lookups)
+        if isinstance(self.model._default_manager, SoftDeleteManager):
+            lookups['is_deleted'] = False
+        return lookups
+
+    @cached_property
+    def checks(self):
+        """[(attname, operator, expected)] evaluating the lookups on remembered values."""
+        checks = []
+        for lookup, expected in self.conditions.items():
+            name, _, op = lookup.partition('__')
+            checks.append((self.model._meta.get_field(name).attname, _OPERATORS[op or 'exact'], expected))
+        return checks
+
+    @property
+    def q(self):
+        return Q(**self.conditions)
+
+    def matches(self, values):
+        """True / False for a row with these {attname: value}; None when a value is unknown."""
+        for attname, op, expected in self.checks:
+            value = values.get(attname, MISSING)
+            if value is MISSING:
+                return None
+            # SQL semantics: NULL matches no comparison
+            if value is None and expected is not None or not op(value, expected):
+                return False
+        return True
+
+
+KPIS = [
+    KPI('crm.clients', 'crm.Client'),
+    KPI('crm.clients.active', 'crm.Client', status='active'),
+    KPI('crm.deals.open', 'crm.Deal', stage__in=['discovery', 'proposal', 'negotiation']),
+    KPI('store.orders', 'store.Order'),
+    KPI('store.orders.pending', 'store.Order', status__in=['pending', 'processing']),
+    KPI('erp.invoices.overdue', 'erp.Invoice', status='overdue'),
+    KPI('erp.invoices.unpaid', 'erp.Invoice', status='unpaid'),
+    KPI('support.tickets.open', 'support.Ticket', status__in=['open', 'in_progress']),
+    KPI('support.tickets.critical', 'support.Ticket', status__in=['open', 'in_progress'], priority='critical'),
+    KPI('marketing.campaigns', 'marketing.Campaign'),
+    KPI('marketing.campaigns.active', 'marketing.Campaign', status='active'),
+    KPI('soc.alerts', 'soc.Alert'),
+    KPI('soc.alerts.unresolved', 'soc.Alert', is_resolved=False),
+    KPI('soc.alerts.critical', 'soc.Alert', is_resolved=False, severity='critical'),
+    KPI('soc.incidents', 'soc.Incident'),
+    KPI('soc.incidents.open', 'soc.Incident', status='open'),
+    KPI('soc.incidents.active', 'soc.Incident', status__in=['open', 'investigating', 'contained']),
+    KPI('soc.endpoints', 'soc.ManagedEndpoint'),
+    KPI('soc.endpoints.online', 'soc.ManagedEndpoint', status='online'),
+    KPI('soc.endpoints.at_risk', 'soc.ManagedEndpoint', status='at_risk'),
+    KPI('soc.cloud_apps', 'soc.CloudApp'),
+    KPI('soc.cloud_apps.high_risk', 'soc.CloudApp', risk_level='high'),
+    KPI('hrm.employees.active', 'hrm.Employee', status='active'),
+    KPI('hrm.leaves.pending', 'hrm.LeaveRequest', status='pending'),
+    KPI('scm.purchase_orders.pending', 'scm.PurchaseOrder', status__in=['draft', 'sent']),
+    KPI('scm.inventory.low_stock', 'scm.InventoryItem', quantity_on_hand__lte=10),
+    KPI('contracts.active', 'contracts.ServiceContract', status='active'),
+    KPI('projects', 'projects.Project'),
+    KPI('projects.active', 'projects.Project', status__in=['active', 'in_progress']),
+    KPI('itam.assets', 'itam.Asset'),
+    KPI('itam.assets.active', 'itam.Asset', status='active'),
+    KPI('approvals', 'approvals.ApprovalRequest'),
+    KPI('approvals.pending', 'approvals.ApprovalRequest', status='pending'),
+    KPI('itsm.changes.open', 'itsm.ChangeRequest', status__in=['draft', 'submitted', 'in_progress']),
+    KPI('itsm.changes.high_risk', 'itsm.ChangeRequest', risk_level='high', status__in=['draft', 'submitted']),
+    KPI('itsm.changes.completed', 'itsm.ChangeRequest', status='completed'),
+    KPI('documents', 'documents.Document'),
+    KPI('documents.archived', 'documents.Document', is_archived=True),
+]
+
+_BY_KEY = {kpi.key: kpi for kpi in KPIS}
+_BY_LABEL = defaultdict(list)
+for _kpi in KPIS:
+    _BY_LABEL[_kpi.label].append(_kpi)
+
+
+class KPICounters:
+    _attnames = {}  # label -> attnames remembered per instance
+
+    @classmethod
+    def kpis(cls, keys=None):
+        return KPIS if keys is None else [_BY_KEY[key] for key in keys]
+
+    @classmethod
+    def for_model(cls, model):
+        return _BY_LABEL.get(model if isinstance(model, str) else model._meta.label, [])
+
+    @staticmethod
+    def _scope(queryset, tenant_ids):
+        """Filters to the tenants (None: rows without a tenant); tenant_ids None keeps every tenant."""
+        if tenant_ids is None:
+            return queryset
+        scope = Q(tenant_id__in=[t for t in tenant_ids if t is not None])
+        if None in tenant_ids:
+            scope |= Q(tenant__isnull=True)
+        return queryset.filter(scope)
+
+    @staticmethod
+    def _by_label(kpis):
+        by_label = defaultdict(list)
+        for kpi in kpis:
+            by_label[kpi.label].append(kpi)
+        return by_label
+
+    @staticmethod
+    def tenant_ids():
+        """Every counter scope: each tenant, plus None for rows without a tenant."""
+        from apps.tenants.models import Tenant
+        return [None, *Tenant._base_manager.values_list('pk', flat=True)]
+
+    # ── Reads ─────────────────────────────────────────────────────────────
+
+    @classmethod
+    def get(cls, keys, tenant=None):
+        """
+        {key: count} for the tenant; across all tenants when None, summed
+        from the tenants' counters. Counters that do not exist yet are
+        counted and stored; keys whose model cannot be counted (logged) are
+        left out.
+        """
+        from .models import TenantKPICounter
+        tenant_id = getattr(tenant, 'pk', tenant)
+        if tenant_id is None:
+            return cls._get_total(keys)
+        values = dict(
+            TenantKPICounter.objects.filter(key__in=keys, tenant_id=tenant_id).values_list('key', 'value')
+        )
+        missing = [key for key in keys if key not in values]
+        if missing:
+            counted = cls._fill(cls.kpis(missing), [tenant_id])
+            values.update({key: value for (_, key), value in counted.items()})
+        return values
+
+    @classmethod
+    def _get_total(cls, keys):
+        from .models import TenantKPICounter
+        tenant_ids = cls.tenant_ids()
+        totals = {
+            row['key']: row
+            for row in TenantKPICounter.objects.filter(key__in=keys).values('key').annotate(
+                total=Sum('value'), scopes=Count('pk'),
+            )
+        }
+        # A key summed over fewer counters than there are scopes is missing some of them
+        incomplete = [key for key in keys if totals.get(key, {'scopes': 0})['scopes'] < len(tenant_ids)]
+        values = {key: row['total'] for key, row in totals.items() if key not in incomplete}
+        if incomplete:
+            counted = cls._fill(cls.kpis(incomplete), tenant_ids, all_tenants=True)
+            for (_, key), value in counted.items():
+                values[key] = values.get(key, 0) + value
+        return values
+
+    @classmethod
+    def _fill(cls, kpis, tenant_ids, all_tenants=False):
+        """
+        Counts the KPIs of the tenants from their tables, creates the
+        counters that do not exist, then recounts them with the counter rows
+        locked (as rebuild_kpis does): a write committed between the first
+        count and the insert found no counter to update. Returns
+        {(tenant_id, key): count}; models that cannot be counted are logged
+        and left out.
+        """
+        from .models import TenantKPICounter
+        scope = None if all_tenants else tenant_ids
+        filled = {}
+        for label, group in cls._by_label(kpis).items():
+            keys = [kpi.key for kpi in group]
+            try:
+                with transaction.atomic():
+                    counted = cls.count_by_tenant(group, scope)
+                    # Committed first, so writes from here on find a counter to update
+                    TenantKPICounter.objects.bulk_create(
+                        [
+                            TenantKPICounter(tenant_id=t, key=key, value=counted.get((t, key), 0))
+                            for t in tenant_ids for key in keys
+                        ],
+                        ignore_conflicts=True,
+                    )
+                with transaction.atomic():
+                    counters = list(
+                        cls._scope(TenantKPICounter.objects.filter(key__in=keys), scope).select_for_update()
+                    )
+                    counted = cls.count_by_tenant(group, scope)
+                    now = timezone.now()
+                    changed = []
+                    for counter in counters:
+                        value = counted.get((counter.tenant_id, counter.key), 0)
+                        if counter.value != value:
+                            counter.value, counter.updated_at = value, now
+                            changed.append(counter)
+                    TenantKPICounter.objects.bulk_update(changed, ['value', 'updated_at'], batch_size=1000)
+            except DatabaseError:
+                logger.exception('Counting KPIs of %s failed', label)
+                continue
+            filled.update({(t, key): counted.get((t, key), 0) for t in tenant_ids for key in keys})
+        return filled
+
+    @classmethod
+    def count_by_tenant(cls, kpis, tenant_ids=None):
+        """
+        {(tenant_id, key): count} from the tables, one grouped aggregate per
+        model, for the tenants (every tenant when None); tenant_id None
+        entries count the rows without a tenant. Tenants without matching
+        rows are left out.
+        """
+        counted = defaultdict(int)
+        for group in cls._by_label(kpis).values():
+            queryset = cls._scope(group[0].model._base_manager.all(), tenant_ids)
+            rows = queryset.order_by().values('tenant_id').annotate(
+                **{kpi.key: Count('pk', filter=kpi.q) for kpi in group}
+            )
+            for row in rows:
+                for kpi in group:
+                    counted[(row['tenant_id'], kpi.key)] += row[kpi.key]
+        return counted
+
+    # ── Writes ────────────────────────────────────────────────────────────
+
+    @classmethod
+    def state(cls, model, instance):
+        """The values the model's KPIs look at, read without loading deferred fields."""
+        label = model._meta.label
+        if label not in cls._attnames:
+            cls._attnames[label] = {'tenant_id'}.union(
+                *({attname for attname, _, _ in kpi.checks} for kpi in cls.for_model(label))
+            )
+        values = instance.__dict__
+        return {attname: values.get(attname, MISSING) for attname in cls._attnames[label]}
+
+    @classmethod
+    def record_change(cls, model, old, new):
+        """Moves the counters for a row going from state `old` to `new` (None: no row)."""
+        deltas = defaultdict(int)
+        for state, sign in ((old, -1), (new, 1)):
+            if state is None:
+                continue
+            tenant_id = state.get('tenant_id', MISSING)
+            for kpi in cls.for_model(model):
+                matched = kpi.matches(state)
+                if matched is None or tenant_id is MISSING:
+                    # A deferred field hides part of the row's state: recount on the next read
+                    tenant_ids = {s.get('tenant_id', MISSING) for s in (old, new) if s is not None}
+                    if MISSING in tenant_ids:
+                        cls.invalidate(model, all_tenants=True)
+                    else:
+                        cls.invalidate(model, *tenant_ids)
+                    return
+                if matched:
+                    deltas[(tenant_id, kpi.key)] += sign
+        cls.apply(deltas)
+
+    @classmethod
+    def apply(cls, deltas):
+        """Adds {(tenant_id, key): delta} to the tenants' counters."""
+        from .models import TenantKPICounter
+        # Usually every key of a write moves by the same delta for one tenant: one UPDATE
+        groups = defaultdict(list)
+        for (tenant_id, key), delta in deltas.items():
+            if delta:
+                groups[(tenant_id, delta)].append(key)
+        now = timezone.now()
+        for (tenant_id, delta), keys in groups.items():
+            # Counters that do not exist yet are counted in full on their first read
+            cls._scope(TenantKPICounter.objects.filter(key__in=keys), [tenant_id]).update(
+                value=F('value') + delta, updated_at=now,
+            )
+
+    @classmethod
+    def invalidate(cls, model, *tenant_ids, all_tenants=False):
+        """
+        Drops the model's counters for the tenants (None: rows without a
+        tenant; every tenant with all_tenants) after a write that sent no
+        signals. Totals across tenants are sums, so they follow.
+        """
+        from .models import TenantKPICounter
+        keys = [kpi.key for kpi in cls.for_model(model)]
+        if not keys:
+            return
+        cls._scope(TenantKPICounter.objects.filter(key__in=keys), None if all_tenants else tenant_ids).delete()
+
+
+# ── Signals ───────────────────────────────────────────────────────────────
+
+def _remember(sender, instance, **kwargs):
+    instance._kpi_state = KPICounters.state(sender, instance)
+
+
+def _on_save(sender, instance, created, **kwargs):
+    new = KPICounters.state(sender, instance)
+    # No remembered state (instance built before the signals were connected): recount
+    KPICounters.record_change(sender, None if created else getattr(instance, '_kpi_state', {}), new)
+    instance._kpi_state = new
+
+
+def _on_delete(sender, instance, **kwargs):
+    from .models import SoftDeleteModel
+    # SoftDeleteModel.delete() saves (already counted) and then sends post_delete for a row that still exists
+    if isinstance(instance, SoftDeleteModel) and sender._base_manager.filter(pk=instance.pk).exists():
+        return
+    KPICounters.record_change(sender, getattr(instance, '_kpi_state', {}), None)
+    instance._kpi_state = None
+
+
+for _label in _BY_LABEL:
+    post_init.connect(_remember, sender=_label, dispatch_uid=f'kpi_init_{_label}')
+    post_save.connect(_on_save, sender=_label, dispatch_uid=f'kpi_save_{_label}')
+    post_delete.connect(_on_delete, sender=_label, dispatch_uid=f'kpi_delete_{_label}')
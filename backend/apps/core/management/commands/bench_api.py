@@ -0,0 +1,169 @@
+import json
+import logging
+from datetime import datetime, timezone
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.benchmark import (
+    DEFAULT_BUDGET, budget_key, compare, first_id, iter_get_routes, list_route_for, load_budget, measure,
+    write_budget,
+)
+
+PROFILES = ('tenant', 'staff')
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark every GET route under /api/ as a tenant user and a staff user: latency '
+        'distribution and SQL query count, diffed against the checked-in budget'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tenant', help='Tenant domain to run as (default: scale-001.test if seeded, else the first tenant)')
+        parser.add_argument('--tenant-user', help='Email of the tenant profile user (default: first non-staff user of the tenant)')
+        parser.add_argument('--staff-user', help='Email of the staff profile user (default: first staff user of the tenant, else a superuser)')
+        parser.add_argument('--profiles', default=','.join(PROFILES), help='Comma-separated profiles to run')
+        parser.add_argument('--prefix', default='/api/', help='Only benchmark routes starting with this path')
+        parser.add_argument('--filter', help='Only benchmark routes containing this substring')
+        parser.add_argument('--repeat', type=int, default=10, help='Measured requests per route and profile')
+        parser.add_argument('--warmup', type=int, default=1, help='Unmeasured requests first (warm caches)')
+        parser.add_argument('--budget', default=str(DEFAULT_BUDGET), help='Budget file to compare with / update')
+        parser.add_argument('--tolerance', type=float, default=0.5, help='Relative p95 slack before a latency change counts')
+        parser.add_argument('--floor-ms', type=float, default=10.0, help='Absolute p95 slack before a latency change counts')
+        parser.add_argument('--update', action='store_true', help='Write the measurements into the budget (routes outside --prefix / --filter keep theirs)')
+        parser.add_argument('--check', action='store_true', help='Exit non-zero when any route regresses')
+        parser.add_argument('--all', action='store_true', help='List unchanged routes too')
+        parser.add_argument('--report', help='Also write the measurements and diff as JSON to this path')
+
+    def handle(self, *args, **options):
+        from rest_framework.test import APIClient
+
+        if options['verbosity'] < 2:
+            # Routes failing with 500 are reported in the diff; their tracebacks are noise here
+            logging.getLogger('django.request').setLevel(logging.CRITICAL)
+
+        tenant = self._tenant(options['tenant'])
+        users = self._users(tenant, options)
+        headers = {'HTTP_X_TENANT_ID': tenant.domain}
+        routes = [
+            (template, params) for template, params in iter_get_routes()
+            if template.startswith(options['prefix']) and (not options['filter'] or options['filter'] in template)
+        ]
+        self.stdout.write(
+            f"Benchmarking {len(routes)} routes as {', '.join(f'{p}={u.email}' for p, u in users.items())} "
+            f"on {tenant.domain} ({options['repeat']} runs each)"
+        )
+
+        results, skipped = {}, []
+        for profile, user in users.items():
+            client = APIClient(raise_request_exception=False)
+            client.force_authenticate(user)
+            list_ids = {}
+            for template, params in routes:
+                path = self._path(client, template, params, list_ids, headers)
+                if path is None:
+                    skipped.append(budget_key(template, profile))
+                    continue
+                response, result = measure(client, path, options['repeat'], options['warmup'], headers)
+                if not params:
+                    list_ids[template] = first_id(response)
+                results[budget_key(template, profile)] = result
+                if options['verbosity'] >= 2:
+                    self.stdout.write(f"  {budget_key(template, profile)} {result}")
+
+        budget = load_budget(options['budget'])
+        measured_scope = {budget_key(template, profile) for template, _ in routes for profile in users}
+        scoped = {'routes': {k: v for k, v in budget['routes'].items() if k in measured_scope}}
+        diff = compare(results, scoped, options['tolerance'], options['floor_ms'])
+        self._print(diff, skipped, options['all'])
+
+        if options['report']:
+            with open(options['report'], 'w') as fh:
+                json.dump({'tenant': tenant.domain, 'results': results, 'diff': diff, 'skipped': skipped}, fh, indent=2)
+        if options['update']:
+            meta = {
+                'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'tenant': tenant.domain, 'repeat': options['repeat'],
+                'profiles': {profile: user.email for profile, user in users.items()},
+            }
+            # Routes outside this run's --prefix / --filter / --profiles keep their budget
+            kept = {k: v for k, v in budget['routes'].items() if k not in measured_scope}
+            write_budget(options['budget'], {**kept, **results}, meta)
+            self.stdout.write(self.style.SUCCESS(f"Budget written to {options['budget']}"))
+
+        regressions = sum(entry['kind'] == 'regression' for entry in diff)
+        if regressions and options['check'] and not options['update']:
+            raise CommandError(f'{regressions} route(s) regressed against {options["budget"]}.')
+
+    def _tenant(self, domain):
+        from apps.tenants.models import Tenant
+
+        if domain:
+            tenant = Tenant._base_manager.filter(domain=domain).first()
+        else:
+            tenant = (
+                Tenant._base_manager.filter(domain='scale-001.test').first()
+                or Tenant._base_manager.order_by('created_at').first()
+            )
+        if tenant is None:
+            raise CommandError('No tenant to benchmark; run `manage.py seed_scale` first.')
+        return tenant
+
+    def _users(self, tenant, options):
+        User = get_user_model()
+        active = User._base_manager.filter(is_active=True).order_by('date_joined')
+        staff = active.filter(tenant=tenant, is_staff=True)
+        candidates = {
+            'tenant': (options['tenant_user'], active.filter(tenant=tenant, is_staff=False, is_superuser=False)),
+            'staff': (options['staff_user'], staff if staff.exists() else active.filter(is_superuser=True)),
+        }
+        users = {}
+        for profile in filter(None, options['profiles'].split(',')):
+            if profile not in candidates:
+                raise CommandError(f'Unknown profile {profile!r}; choose from {", ".join(PROFILES)}.')
+            email, queryset = candidates[profile]
+            user = User._base_manager.filter(email=email).first() if email else queryset.first()
+            if user is None:
+                raise CommandError(f'No user for the {profile} profile; pass --{profile}-user.')
+            users[profile] = user
+        return users
+
+    @staticmethod
+    def _path(client, template, params, list_ids, headers):
+        """Concrete path for the template, or None when its parameters cannot be filled."""
+        if not params:
+            return template
+        if len(params) > 1:
+            return None
+        list_route = list_route_for(template)
+        if list_route not in list_ids:
+            list_ids[list_route] = first_id(client.get(list_route, **headers))
+        pk = list_ids[list_route]
+        return template.replace('{' + params[0] + '}', str(pk)) if pk is not None else None
+
+    def _print(self, diff, skipped, show_all):
+        styles = {
+            'regression': self.style.ERROR, 'improvement': self.style.SUCCESS,
+            'new': self.style.WARNING, 'missing': self.style.WARNING, 'ok': str,
+        }
+        self.stdout.write(f"\n{'route':<72}{'status':>7}{'queries':>9}{'p50 ms':>9}{'p95 ms':>9}  change")
+        order = ('regression', 'missing', 'new', 'improvement', 'ok')
+        for entry in sorted(diff, key=lambda e: (order.index(e['kind']), e['key'])):
+            if entry['kind'] == 'ok' and not show_all:
+                continue
+            result = entry.get('result')
+            columns = (
+                f"{result['status']:>7}{result['queries']:>9}{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}"
+                if result else f"{'-':>7}{'-':>9}{'-':>9}{'-':>9}"
+            )
+            change = f"{entry['kind']}: {', '.join(entry['reasons'])}" if entry['reasons'] else entry['kind']
+            self.stdout.write(styles[entry['kind']](f"{entry['key']:<72}{columns}  {change}"))
+
+        counts = {kind: sum(e['kind'] == kind for e in diff) for kind in order}
+        summary = (
+            f"\n{len(diff)} routes: {counts['regression']} regressed, {counts['improvement']} improved, "
+            f"{counts['new']} new, {counts['missing']} missing, {counts['ok']} within budget; "
+            f"{len(skipped)} skipped (unfillable URL parameters)"
+        )
+        self.stdout.write((self.style.ERROR if counts['regression'] else self.style.SUCCESS)(summary))
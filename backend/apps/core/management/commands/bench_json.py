@@ -0,0 +1,127 @@
+import io
+import statistics
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.core import compression
+from apps.core.renderers import FastJSONParser, FastJSONRenderer, orjson
+
+
+def endpoint_payload(rows):
+    """A page of ManagedEndpointSerializer output for unsaved, realistic endpoints."""
+    from apps.soc.models import ManagedEndpoint, Workspace
+    from apps.soc.serializers import ManagedEndpointSerializer
+
+    now = timezone.now()
+    workspace = Workspace(id=uuid.uuid4(), name='Head Office')
+    endpoints = [
+        ManagedEndpoint(
+            id=uuid.uuid4(), workspace=workspace, hostname=f'ws-{i:05d}.corp.example.com',
+            ip_address=f'10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}', mac_address='00:1a:2b:3c:4d:5e',
+            device_type='workstation', os='Windows 11 Enterprise 23H2', status='online',
+            agent_version='4.12.0', last_seen=now - timedelta(minutes=i % 90), risk_score=i % 100,
+            created_at=now - timedelta(days=i % 400), updated_at=now,
+        )
+        for i in range(rows)
+    ]
+    return {'next': None, 'previous': None, 'results': ManagedEndpointSerializer(endpoints, many=True).data}
+
+
+def report_payloads():
+    """ReportService output for the first tenant, wrapped the way the report views return it."""
+    from apps.reports.services import ReportService
+    from apps.tenants.models import Tenant
+
+    tenant = Tenant.objects.first()
+    payloads = {}
+    for name in ('revenue', 'crm', 'support', 'security'):
+        try:
+            data = getattr(ReportService, f'get_{name}_report')(tenant)
+        except Exception as exc:  # Report modules whose tables are missing in this database
+            payloads[f'report:{name}'] = exc
+            continue
+        payloads[f'report:{name}'] = {'status': 'success', 'data': data}
+    return payloads
+
+
+def raw_payload(rows):
+    """values()-style rows carrying Decimal / UUID / datetime, as BFF endpoints return them."""
+    now = timezone.now()
+    return {
+        'status': 'success',
+        'data': [
+            {
+                'id': uuid.uuid4(), 'amount': Decimal('1234.56') + i, 'created_at': now - timedelta(hours=i),
+                'name': f'Invoice {i}', 'paid': i % 3 == 0, 'ratio': i / 7,
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark JSON rendering / parsing (DRF stdlib vs orjson) and gzip / brotli '
+        'compression on representative API payloads'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=500, help='Rows in the synthetic list payloads')
+        parser.add_argument('--repeat', type=int, default=30, help='Runs per measurement (median reported)')
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stderr.write(self.style.WARNING('orjson is not installed: FastJSONRenderer falls back to stdlib json.'))
+        self.repeat = max(options['repeat'], 1)
+
+        payloads = {
+            f'endpoints x{options["rows"]}': endpoint_payload(options['rows']),
+            f'raw rows x{options["rows"]}': raw_payload(options['rows']),
+            **report_payloads(),
+        }
+
+        self.stdout.write(
+            f"{'payload':<22}{'bytes':>10}{'drf ms':>9}{'fast ms':>9}{'speedup':>9}"
+            f"{'parse x':>9}{'gzip':>9}{'gz ms':>8}{'br':>9}{'br ms':>8}  same"
+        )
+        for name, data in payloads.items():
+            if isinstance(data, Exception):
+                self.stdout.write(self.style.WARNING(f'{name:<22}skipped: {data}'))
+                continue
+            self.stdout.write(self._row(name, data))
+
+    def _row(self, name, data):
+        drf, fast = JSONRenderer(), FastJSONRenderer()
+        drf_bytes, drf_ms = self._time(lambda: drf.render(data))
+        fast_bytes, fast_ms = self._time(lambda: fast.render(data))
+        _, parse_drf_ms = self._time(lambda: JSONParser().parse(io.BytesIO(drf_bytes)))
+        _, parse_fast_ms = self._time(lambda: FastJSONParser().parse(io.BytesIO(drf_bytes)))
+
+        cfg = compression.config()
+        gz, gz_ms = self._time(lambda: compression.compress(fast_bytes, 'gzip', cfg))
+        if compression.brotli is not None:
+            br, br_ms = self._time(lambda: compression.compress(fast_bytes, 'br', cfg))
+            br_cols = f'{len(br):>9}{br_ms:>8.2f}'
+        else:
+            br_cols = f"{'-':>9}{'-':>8}"
+        return (
+            f'{name:<22}{len(fast_bytes):>10}{drf_ms:>9.2f}{fast_ms:>9.2f}{drf_ms / max(fast_ms, 1e-6):>8.1f}x'
+            f'{parse_drf_ms / max(parse_fast_ms, 1e-6):>8.1f}x{len(gz):>9}{gz_ms:>8.2f}{br_cols}'
+            f"  {'yes' if drf_bytes == fast_bytes else 'NO'}"
+        )
+
+    def _time(self, func):
+        timings = []
+        result = None
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            result = func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return result, statistics.median(timings)
@@ -0,0 +1,127 @@
+import statistics
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+
+class _Rollback(Exception):
+    pass
+
+
+def index_queries(model):
+    """
+    Yields (index, queryset) pairs: for every declared Meta index, the list
+    query it is meant to serve, using values from an existing row that
+    matches the index condition. Trailing created_at becomes newest-first
+    ordering, every other column an equality filter.
+    """
+    for index in model._meta.indexes:
+        fields = [name.lstrip('-') for name in index.fields]
+        base = model._base_manager.all()
+        if index.condition is not None:
+            base = base.filter(index.condition)
+        attnames = [model._meta.get_field(name).attname for name in fields]
+        sample = base.order_by().values(*attnames).first()
+        if sample is None:
+            continue
+
+        order = None
+        if fields[-1] in ('created_at', 'updated_at'):
+            order = f'-{fields[-1]}'
+            attnames = attnames[:-1]
+        queryset = base.filter(**{name: sample[name] for name in attnames})
+        if order:
+            queryset = queryset.order_by(order)
+        yield index, queryset[:50]
+
+
+class Command(BaseCommand):
+    help = (
+        'EXPLAIN and time the list query behind every declared model index. '
+        'With --compare the indexes are dropped inside a rolled-back transaction '
+        'to show the before/after plans (takes table locks: dev/staging only).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('models', nargs='*', help='app_label.Model labels (default: every model declaring indexes)')
+        parser.add_argument('--repeat', type=int, default=20, help='Executions per query for the median timing')
+        parser.add_argument('--compare', action='store_true', help='Also run each query without its index')
+        parser.add_argument('--plans', action='store_true', help='Print full query plans')
+
+    def handle(self, *args, **options):
+        if options['models']:
+            try:
+                models = [apps.get_model(label) for label in options['models']]
+            except (LookupError, ValueError) as exc:
+                raise CommandError(exc)
+        else:
+            models = [m for m in apps.get_models() if m._meta.indexes]
+
+        # Models whose migrations are pending have no table to explain against
+        tables = set(connection.introspection.table_names())
+        for model in [m for m in models if m._meta.db_table not in tables]:
+            self.stderr.write(self.style.WARNING(f'Skipping {model._meta.label}: table {model._meta.db_table} does not exist'))
+            models.remove(model)
+
+        cases = [
+            (model, index, queryset)
+            for model in models
+            for index, queryset in index_queries(model)
+        ]
+        if not cases:
+            raise CommandError('No indexed queries to run; seed some data first (scripts/data.py).')
+
+        results = {id(index): {} for _, index, _ in cases}
+        if options['compare']:
+            try:
+                with transaction.atomic():
+                    with connection.cursor() as cursor:
+                        for _, index, _ in cases:
+                            cursor.execute(f'DROP INDEX {connection.ops.quote_name(index.name)}')
+                    for case in cases:
+                        results[id(case[1])]['before'] = self._measure(case, options)
+                    raise _Rollback
+            except _Rollback:
+                pass
+            # SQLite caches prepared statements (and their plans) per connection
+            connection.close()
+
+        for case in cases:
+            results[id(case[1])]['after'] = self._measure(case, options)
+
+        for model, index, _ in cases:
+            result = results[id(index)]
+            after = result['after']
+            line = f"{model._meta.label} {index.name}: {after['median_ms']:.2f}ms"
+            style = self.style.SUCCESS if after['uses_index'] else self.style.WARNING
+            if 'before' in result:
+                before = result['before']
+                line += f" (without index {before['median_ms']:.2f}ms)"
+            line += '' if after['uses_index'] else ' [index not used by planner]'
+            self.stdout.write(style(line))
+            if options['plans']:
+                if 'before' in result:
+                    self.stdout.write('    before:')
+                    self._write_plan(result['before']['plan'])
+                    self.stdout.write('    after:')
+                self._write_plan(after['plan'])
+
+    def _measure(self, case, options):
+        model, index, queryset = case
+        plan = queryset.explain()
+        timings = []
+        for _ in range(max(options['repeat'], 1)):
+            start = time.perf_counter()
+            list(queryset.values_list('pk', flat=True))
+            timings.append((time.perf_counter() - start) * 1000)
+        return {
+            'plan': plan,
+            'uses_index': index.name in plan,
+            'median_ms': statistics.median(timings),
+        }
+
+    def _write_plan(self, plan):
+        for row in plan.splitlines():
+            self.stdout.write(f'        {row}')
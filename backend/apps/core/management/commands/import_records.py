@@ -0,0 +1,94 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.imports import FORMATS, ImporterRegistry, config, detect_format, run_import
+
+
+class Command(BaseCommand):
+    help = (
+        'Bulk-import a CSV / JSON Lines file into a tenant (crm.clients, crm.contacts, crm.leads, '
+        'scm.inventory, itam.assets): streamed, validated and written in batches'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('resource', nargs='?', help='Importer name, e.g. crm.clients (see --list)')
+        parser.add_argument('path', nargs='?', help='File to import')
+        parser.add_argument('--tenant', help='Tenant domain to import into')
+        parser.add_argument('--format', choices=FORMATS, help='File format (default: from the file extension)')
+        parser.add_argument('--match', help='Field(s) identifying existing rows to update, e.g. "email" (default: id)')
+        parser.add_argument('--batch-size', type=int, help=f"Rows per transaction (default: {config()['BATCH_SIZE']})")
+        parser.add_argument('--user', help='Email of the user the audit entries are attributed to')
+        parser.add_argument('--dry-run', action='store_true', help='Validate every row without writing')
+        parser.add_argument('--list', action='store_true', help='List importable resources and their columns')
+
+    def handle(self, *args, **options):
+        if options['list']:
+            for name, importer in ImporterRegistry.all().items():
+                self.stdout.write(self.style.MIGRATE_HEADING(name))
+                self.stdout.write(f"  columns: {', '.join(importer.columns())}")
+                self.stdout.write(f"  match:   {' | '.join(importer.match_choices)}")
+            return
+        if not options['resource'] or not options['path'] or not options['tenant']:
+            raise CommandError('resource, path and --tenant are required (or pass --list).')
+
+        from apps.core.models import ImportRun
+        from apps.tenants.models import Tenant
+
+        tenant = Tenant._base_manager.filter(domain=options['tenant']).first()
+        if tenant is None:
+            raise CommandError(f"No tenant with domain {options['tenant']!r}.")
+        user = None
+        if options['user']:
+            user = get_user_model()._base_manager.filter(email=options['user']).first()
+            if user is None:
+                raise CommandError(f"No user with email {options['user']!r}.")
+        fmt = options['format'] or detect_format(options['path'])
+        if fmt is None:
+            raise CommandError('Cannot tell the file format from its extension; pass --format.')
+        try:
+            importer = ImporterRegistry.get(options['resource'])
+            match_fields = importer.validate_match(options['match'])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        run = ImportRun.objects.create(
+            tenant=tenant, user=user, resource=importer.name, format=fmt, file_name=options['path'],
+            match_fields=match_fields, dry_run=options['dry_run'],
+        )
+        mode = ' (dry run)' if options['dry_run'] else ''
+        self.stdout.write(f"Importing {options['path']} into {importer.name} for {tenant.domain}{mode}, run {run.pk}")
+
+        start = time.perf_counter()
+
+        def progress(run):
+            elapsed = time.perf_counter() - start
+            self.stdout.write(
+                f'  {run.processed:>10,} rows  {run.created:>10,} created  {run.updated:>10,} updated  '
+                f'{run.failed:>8,} failed  {run.processed / max(elapsed, 1e-6):>9,.0f} rows/s'
+            )
+
+        try:
+            with open(options['path'], 'rb') as fh:
+                run_import(
+                    run, fh, progress=progress if options['verbosity'] >= 1 else None,
+                    batch_size=options['batch_size'],
+                )
+        except OSError as exc:
+            ImportRun.objects.filter(pk=run.pk).update(status=ImportRun.STATUS_FAILED, last_error=str(exc))
+            raise CommandError(str(exc))
+
+        for error in run.errors:
+            messages = '; '.join(f'{field}: {" ".join(msgs)}' for field, msgs in error['errors'].items())
+            self.stdout.write(self.style.WARNING(f"  line {error['line']}: {messages}"))
+        if run.failed > len(run.errors):
+            self.stdout.write(self.style.WARNING(f'  ... {run.failed - len(run.errors):,} more row errors not listed'))
+
+        elapsed = time.perf_counter() - start
+        summary = (
+            f'{run.processed:,} rows in {elapsed:.1f}s ({run.processed / max(elapsed, 1e-6):,.0f} rows/s): '
+            f'{run.created:,} created, {run.updated:,} updated, {run.failed:,} failed'
+        )
+        if run.status == ImportRun.STATUS_FAILED:
+            raise CommandError(f'{run.last_error} (after {summary})')
+        self.stdout.write((self.style.WARNING if run.failed else self.style.SUCCESS)(summary))
@@ -0,0 +1,88 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+
+from apps.core.kpis import KPICounters
+
+
+class Command(BaseCommand):
+    help = (
+        'Recompute the incrementally maintained KPI counters (apps.core.kpis) from their tables '
+        'and report counters that had drifted'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tenant', help='Only rebuild this tenant (domain)')
+        parser.add_argument('--check', action='store_true', help='Report drift without writing; exits 1 on drift')
+
+    def handle(self, *args, **options):
+        from apps.core.models import TenantKPICounter
+        from apps.tenants.models import Tenant
+
+        if options['tenant']:
+            tenant = Tenant._base_manager.filter(domain=options['tenant']).first()
+            if tenant is None:
+                raise CommandError(f"No tenant with domain {options['tenant']!r}.")
+            tenants = {tenant.pk: tenant.domain}
+        else:
+            tenants = dict(Tenant._base_manager.values_list('pk', 'domain'))
+            tenants[None] = 'no tenant'
+
+        by_label = defaultdict(list)
+        for kpi in KPICounters.kpis():
+            by_label[kpi.label].append(kpi)
+
+        checked = drifted = missing = 0
+        failed = []
+        for label, kpis in by_label.items():
+            keys = [kpi.key for kpi in kpis]
+            counters = TenantKPICounter.objects.filter(key__in=keys)
+            if options['tenant']:
+                counters = counters.filter(tenant_id=tenant.pk)
+            existing = set(counters.values_list('tenant_id', 'key'))
+            if not options['check']:
+                # Rows first, so saves committing during the recount update a row and are not lost
+                TenantKPICounter.objects.bulk_create(
+                    [TenantKPICounter(tenant_id=t, key=key, value=0) for t in tenants for key in keys],
+                    ignore_conflicts=True,
+                )
+            try:
+                with transaction.atomic():
+                    # Writers of this model wait on the counter rows until the recount is stored
+                    stored = {(c.tenant_id, c.key): c for c in counters.select_for_update()}
+                    actual = KPICounters.count_by_tenant(kpis, list(tenants) if options['tenant'] else None)
+                    changed = []
+                    for tenant_id in tenants:
+                        for key in keys:
+                            value = actual.get((tenant_id, key), 0)
+                            counter = stored.get((tenant_id, key))
+                            checked += 1
+                            if (tenant_id, key) not in existing:
+                                missing += 1
+                            elif counter.value != value:
+                                drifted += 1
+                                self.stdout.write(self.style.WARNING(
+                                    f'  {tenants[tenant_id]:<30} {key:<30} {counter.value:>10,} -> {value:,}'
+                                ))
+                            if counter is not None and counter.value != value:
+                                counter.value, counter.updated_at = value, timezone.now()
+                                changed.append(counter)
+                    if changed and not options['check']:
+                        TenantKPICounter.objects.bulk_update(changed, ['value', 'updated_at'], batch_size=1000)
+            except DatabaseError as exc:  # Modules whose tables are missing or outdated in this database
+                failed.append(f'{label}: {str(exc).splitlines()[0]}')
+                if not options['check']:
+                    KPICounters.invalidate(label, all_tenants=True)
+
+        for failure in failed:
+            self.stdout.write(self.style.ERROR(f'  {failure}'))
+        summary = f'{checked:,} counters checked, {drifted:,} drifted'
+        if missing:
+            summary += f", {missing:,} {'missing' if options['check'] else 'created'}"
+        if failed:
+            summary += f', {len(failed)} models could not be counted'
+        if options['check'] and drifted:
+            raise CommandError(summary)
+        self.stdout.write((self.style.WARNING if drifted or failed else self.style.SUCCESS)(summary))
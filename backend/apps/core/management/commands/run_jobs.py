@@ -0,0 +1,102 @@
+import json
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, connections
+
+from apps.core.jobs import JobQueue, JobRegistry, config
+
+logger = logging.getLogger(__name__)
+
+
+def work(queues, once, poll_interval):
+    """Worker process loop: claim and run one job at a time until told to stop."""
+    import django
+    from django.apps import apps
+
+    if not apps.ready:  # spawn start method: fresh interpreter
+        django.setup()
+    JobRegistry.autodiscover()
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the parent forwards Ctrl-C as SIGTERM
+
+    worker_id = JobQueue.worker_id()
+    try:
+        while not stop.is_set():
+            try:
+                outcome = JobQueue.run_next(worker_id, queues)
+            except Exception:
+                # Transient DB errors (lost connection, lock timeouts): reconnect and retry
+                logger.exception('Job worker failed to claim a job')
+                connection.close()
+                stop.wait(poll_interval)
+                continue
+            if outcome is not None:
+                continue
+            if once:
+                return
+            stop.wait(poll_interval)
+    finally:
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = 'Run background job workers: claim queued jobs with SKIP LOCKED and execute them in parallel processes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, help='Worker processes (default: JOB_QUEUE["PROCESSES"])')
+        parser.add_argument('--queues', help='Comma-separated queues to serve (default: all)')
+        parser.add_argument('--once', action='store_true', help='Exit once no job is runnable instead of polling')
+        parser.add_argument('--stats', action='store_true', help='Print per-queue depth / running / lag and exit')
+        parser.add_argument('--purge', type=int, metavar='DAYS', help='Delete finished jobs older than DAYS and exit')
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            self.stdout.write(json.dumps(JobQueue.stats(), indent=2))
+            return
+        if options['purge'] is not None:
+            deleted = JobQueue.purge(options['purge'])
+            self.stdout.write(self.style.SUCCESS(f'Purged {deleted} finished jobs.'))
+            return
+
+        cfg = config()
+        processes = options['processes'] or cfg['PROCESSES']
+        JobRegistry.autodiscover()
+        queues = options['queues'].split(',') if options['queues'] else JobRegistry.queues()
+
+        # Children must not inherit the parent's open DB sockets
+        connections.close_all()
+        workers = [
+            multiprocessing.Process(
+                target=work, args=(queues, options['once'], cfg['POLL_INTERVAL']), name=f'job-worker-{i}'
+            )
+            for i in range(processes)
+        ]
+        stopping = threading.Event()
+
+        def shutdown(*_):
+            stopping.set()
+            for process in workers:
+                if process.is_alive():
+                    process.terminate()
+
+        signal.signal(signal.SIGTERM, shutdown)
+        signal.signal(signal.SIGINT, shutdown)
+
+        started = time.monotonic()
+        self.stdout.write(f"Job workers started: {processes} processes on queues {', '.join(queues)}.")
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join()
+
+        elapsed = time.monotonic() - started
+        state = 'Stopped' if stopping.is_set() else 'Drained'
+        self.stdout.write(self.style.SUCCESS(f'{state} after {elapsed:.1f}s.'))
+        self.stdout.write(json.dumps(JobQueue.stats()))
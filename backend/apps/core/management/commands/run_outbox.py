@@ -0,0 +1,86 @@
+import json
+import logging
+import signal
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from apps.core.outbox import Outbox, config
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Drain the transactional outbox: deliver queued domain signals with parallel consumers, retries and backoff'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, help='Parallel consumer threads (default: OUTBOX["WORKERS"])')
+        parser.add_argument('--batch-size', type=int, help='Messages claimed per batch (default: OUTBOX["BATCH_SIZE"])')
+        parser.add_argument('--once', action='store_true', help='Exit once the outbox is drained instead of polling')
+        parser.add_argument('--stats', action='store_true', help='Print lag / throughput / dead-letter metrics and exit')
+        parser.add_argument('--purge', type=int, metavar='DAYS', help='Delete delivered messages older than DAYS and exit')
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            self.stdout.write(json.dumps(Outbox.stats(), indent=2))
+            return
+        if options['purge'] is not None:
+            deleted = Outbox.purge(options['purge'])
+            self.stdout.write(self.style.SUCCESS(f'Purged {deleted} delivered outbox messages.'))
+            return
+
+        cfg = config()
+        workers = options['workers'] or cfg['WORKERS']
+        self.batch_size = options['batch_size'] or cfg['BATCH_SIZE']
+        self.once = options['once']
+        self.stop = threading.Event()
+        self.totals = {'delivered': 0, 'failed': 0}
+        self.lock = threading.Lock()
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *_: self.stop.set())
+            signal.signal(signal.SIGINT, lambda *_: self.stop.set())
+
+        started = time.monotonic()
+        self.stdout.write(f'Outbox consumer started with {workers} workers (batch {self.batch_size}).')
+        threads = [
+            threading.Thread(target=self._consume, name=f'outbox-{i}', daemon=True)
+            for i in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=0.5)
+
+        elapsed = max(time.monotonic() - started, 1e-6)
+        self.stdout.write(self.style.SUCCESS(
+            f"Delivered {self.totals['delivered']}, failed {self.totals['failed']} "
+            f"({self.totals['delivered'] / elapsed:.1f} msg/s)."
+        ))
+        self.stdout.write(json.dumps(Outbox.stats()))
+
+    def _consume(self):
+        poll_interval = config()['POLL_INTERVAL']
+        try:
+            while not self.stop.is_set():
+                try:
+                    delivered, failed = Outbox.process_batch(self.batch_size)
+                except Exception:
+                    # Transient DB errors (lost connection, lock timeouts): reconnect and retry
+                    logger.exception('Outbox consumer failed to claim a batch')
+                    connection.close()
+                    self.stop.wait(poll_interval)
+                    continue
+                with self.lock:
+                    self.totals['delivered'] += delivered
+                    self.totals['failed'] += failed
+                if delivered or failed:
+                    continue
+                if self.once:
+                    return
+                self.stop.wait(poll_interval)
+        finally:
+            connection.close()
@@ -0,0 +1,76 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from apps.core.query_inspector import inspect_queries, list_size
+
+
+def iter_list_routes(patterns=None, prefix='/'):
+    """Yields (path, view_name) for every parameterless DRF list action in the URLconf."""
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    for entry in patterns:
+        part = str(entry.pattern).replace('^', '').replace('$', '')
+        if isinstance(entry, URLResolver):
+            yield from iter_list_routes(entry.url_patterns, prefix + part)
+        elif isinstance(entry, URLPattern):
+            actions = getattr(entry.callback, 'actions', None) or {}
+            if actions.get('get') != 'list' or '<' in part or '(' in part:
+                continue
+            yield prefix + part, entry.name
+
+
+class Command(BaseCommand):
+    help = 'Hit every DRF list endpoint and report SQL shapes that repeat once per returned row (N+1)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help='Email of the user to authenticate as (default: first superuser)')
+        parser.add_argument('--tenant', help='Tenant domain sent as X-Tenant-ID')
+        parser.add_argument('--prefix', default='/api/', help='Only scan routes starting with this path')
+        parser.add_argument('--threshold', type=int, default=3, help='Minimum repetitions to report a shape')
+        parser.add_argument('--fail', action='store_true', help='Exit non-zero if any endpoint scales with page size')
+
+    def handle(self, *args, **options):
+        from rest_framework.test import APIClient
+
+        User = get_user_model()
+        if options['user']:
+            user = User.objects.filter(email=options['user']).first()
+        else:
+            user = User.objects.filter(is_superuser=True).first()
+        if user is None:
+            raise CommandError('No user to authenticate as; pass --user or create a superuser.')
+
+        client = APIClient()
+        client.force_authenticate(user)
+        headers = {'HTTP_X_TENANT_ID': options['tenant']} if options['tenant'] else {}
+
+        routes = sorted(r for r in iter_list_routes() if r[0].startswith(options['prefix']))
+        offenders = 0
+        for path, name in routes:
+            with inspect_queries(options['threshold']) as inspector:
+                try:
+                    response = client.get(path, **headers)
+                except Exception as exc:
+                    self.stdout.write(self.style.ERROR(f'{path}: {exc.__class__.__name__}: {exc}'))
+                    continue
+
+            rows = list_size(response)
+            findings = inspector.findings(rows)
+            line = f'{path} [{response.status_code}] queries={inspector.total} rows={rows}'
+            if not findings:
+                self.stdout.write(line)
+                continue
+
+            scaling = any(f['scales_with_page'] for f in findings)
+            offenders += scaling
+            self.stdout.write((self.style.ERROR if scaling else self.style.WARNING)(line))
+            for finding in findings:
+                flag = ' [scales with page size]' if finding['scales_with_page'] else ''
+                self.stdout.write(f"    {finding['count']}x {finding['origin']}{flag}")
+                self.stdout.write(f"        {finding['sql'][:200]}")
+
+        summary = f'Scanned {len(routes)} list endpoints, {offenders} with N+1 queries.'
+        if offenders and options['fail']:
+            raise CommandError(summary)
+        self.stdout.write(self.style.SUCCESS(summary) if not offenders else self.style.WARNING(summary))
@@ -0,0 +1,125 @@
+import multiprocessing
+import os
+import time
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+
+from apps.core.seeding import VOLUMES, BulkWriter, TenantSeeder, is_seeded, purge, volume
+
+
+def seed_tenant(job):
+    """Worker: seeds one tenant over its own database connection."""
+    import django
+    from django.apps import apps
+
+    if not apps.ready:  # spawn start method: fresh interpreter
+        django.setup()
+    from apps.tenants.models import Tenant
+
+    tenant_id, options = job
+    tenant = Tenant._base_manager.get(pk=tenant_id)
+    start = time.perf_counter()
+    try:
+        seeder = TenantSeeder(
+            tenant, scale=options['scale'], days=options['days'], seed=options['seed'],
+            writer=BulkWriter(options['batch_size'], use_copy=False if options['no_copy'] else None),
+        )
+        return tenant.domain, seeder.run(), time.perf_counter() - start
+    finally:
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate production-sized synthetic data: N tenants with VOLUMES x scale rows each, '
+        'bulk-inserted (COPY on PostgreSQL), one worker process per tenant'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tenants', type=int, default=1, help='Tenants to create and fill')
+        parser.add_argument('--scale', type=float, default=1.0, help='Multiplier on the per-tenant volumes (0.01 for a smoke run)')
+        parser.add_argument('--days', type=int, default=365, help='History length the timestamps are spread over')
+        parser.add_argument('--workers', type=int, help='Parallel tenant workers (default: min(tenants, CPUs); 1 on SQLite)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per bulk_create / COPY batch')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed; the same seed reproduces the same data')
+        parser.add_argument('--prefix', default='scale', help='Tenant domains are <prefix>-001.test, <prefix>-002.test, ...')
+        parser.add_argument('--no-copy', action='store_true', help='Use bulk_create on PostgreSQL too')
+        parser.add_argument('--reset', action='store_true', help='Delete previously seeded rows of these tenants first')
+        parser.add_argument('--dry-run', action='store_true', help='Print the row counts that would be written and exit')
+
+    def handle(self, *args, **options):
+        if options['tenants'] < 1 or options['scale'] <= 0:
+            raise CommandError('--tenants and --scale must be positive.')
+
+        if options['dry_run']:
+            self._plan(options)
+            return
+
+        tenants = self._tenants(options)
+        workers = options['workers'] or min(len(tenants), os.cpu_count() or 1)
+        if connection.vendor == 'sqlite' and workers > 1:
+            self.stderr.write(self.style.WARNING('SQLite allows a single writer: seeding tenants one at a time.'))
+            workers = 1
+        method = 'COPY' if connection.vendor == 'postgresql' and not options['no_copy'] else 'bulk_create'
+        self.stdout.write(
+            f"Seeding {len(tenants)} tenant(s) at scale {options['scale']:g} "
+            f"with {method}, {workers} worker(s)"
+        )
+
+        jobs = [(tenant.pk, options) for tenant in tenants]
+        start = time.perf_counter()
+        if workers == 1:
+            results = map(seed_tenant, jobs)
+            self._collect(results)
+        else:
+            connections.close_all()  # never share a connection with the forked workers
+            with multiprocessing.Pool(workers) as pool:
+                self._collect(pool.imap_unordered(seed_tenant, jobs))
+        self.stdout.write(self.style.SUCCESS(f'Done in {time.perf_counter() - start:.1f}s'))
+
+    def _tenants(self, options):
+        from apps.tenants.models import Tenant
+
+        tenants = []
+        for i in range(1, options['tenants'] + 1):
+            tenant, _ = Tenant._base_manager.get_or_create(
+                domain=f"{options['prefix']}-{i:03d}.test",
+                defaults={'name': f"{options['prefix'].title()} Tenant {i:03d}", 'subscription_plan': 'enterprise'},
+            )
+            if is_seeded(tenant):
+                if not options['reset']:
+                    raise CommandError(f'{tenant.domain} already holds seeded rows; pass --reset to replace them.')
+                self.stdout.write(f'Purging {tenant.domain} ...')
+                purge(tenant)
+            tenants.append(tenant)
+        return tenants
+
+    def _plan(self, options):
+        tenants, scale = options['tenants'], options['scale']
+        self.stdout.write(f"{'model':<26}{'per tenant':>14}{'total':>16}")
+        for label in VOLUMES:
+            rows = volume(label, scale)
+            self.stdout.write(f'{label:<26}{rows:>14,}{rows * tenants:>16,}')
+        total = sum(volume(label, scale) for label in VOLUMES)
+        self.stdout.write(self.style.SUCCESS(f"{'total':<26}{total:>14,}{total * tenants:>16,}"))
+
+    def _collect(self, results):
+        totals = defaultdict(lambda: [0, 0.0])
+        failures = {}
+        for domain, report, seconds in results:
+            rows = sum(entry[0] for entry in report.values() if isinstance(entry, tuple))
+            self.stdout.write(f'  {domain}: {rows:,} rows in {seconds:.1f}s ({rows / max(seconds, 1e-6):,.0f} rows/s)')
+            for label, entry in report.items():
+                if isinstance(entry, tuple):
+                    totals[label][0] += entry[0]
+                    totals[label][1] += entry[1]
+                else:
+                    failures[label] = entry
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"\n{'model':<26}{'rows':>14}{'seconds':>10}{'rows/s':>12}"))
+        for label, (rows, seconds) in totals.items():
+            self.stdout.write(f'{label:<26}{rows:>14,}{seconds:>10.1f}{rows / max(seconds, 1e-6):>12,.0f}')
+        for label, error in failures.items():
+            self.stdout.write(self.style.WARNING(f'{label:<26}skipped: {error}'))
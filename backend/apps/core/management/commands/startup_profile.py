@@ -0,0 +1,202 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter under `-X importtime`: times each startup phase and
+# every AppConfig.ready(), then prints the result as JSON on stdout.
+BOOTSTRAP = r'''
+import json, time
+started = time.perf_counter()
+
+from django.apps.config import AppConfig
+
+ready_ms = {}
+_create = AppConfig.create.__func__
+
+
+def _timed_create(cls, entry):
+    app_config = _create(cls, entry)
+    ready = app_config.ready
+
+    def timed_ready():
+        start = time.perf_counter()
+        ready()
+        ready_ms[app_config.label] = (time.perf_counter() - start) * 1000
+
+    app_config.ready = timed_ready
+    return app_config
+
+
+AppConfig.create = classmethod(_timed_create)
+
+phases = {}
+
+
+def phase(name, func):
+    start = time.perf_counter()
+    func()
+    phases[name] = (time.perf_counter() - start) * 1000
+
+
+import django
+from django.conf import settings
+
+phase('settings', lambda: settings.INSTALLED_APPS)
+phase('setup', django.setup)
+phases['setup'] -= sum(ready_ms.values())
+phase('ready', lambda: None)
+phases['ready'] = sum(ready_ms.values())
+if LOAD_URLS:
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.urls import get_resolver
+
+    phase('middleware', WSGIHandler)
+    phase('urls', lambda: get_resolver().url_patterns)
+phases['bootstrap'] = (time.perf_counter() - started) * 1000 - sum(phases.values())
+print(json.dumps({'phases': phases, 'ready': ready_ms}))
+'''
+
+PHASES = (
+    ('bootstrap', 'interpreter imports before settings'),
+    ('settings', 'settings module'),
+    ('setup', 'apps.populate: app configs + models'),
+    ('ready', 'AppConfig.ready() (all apps)'),
+    ('middleware', 'middleware chain'),
+    ('urls', 'URLconf: views, serializers, services'),
+)
+
+
+def parse_importtime(stderr):
+    """{module: (self µs, cumulative µs)} from `-X importtime` output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        if not self_us.strip().isdigit():
+            continue  # column header
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def package_of(module):
+    """Attribution bucket: the distribution for third-party code, the app for project code."""
+    parts = module.split('.')
+    if parts[0] in ('apps', 'api', 'config', 'integrations') and len(parts) > 1:
+        return '.'.join(parts[:2])
+    return parts[0]
+
+
+class Command(BaseCommand):
+    help = (
+        'Profile process startup in a fresh interpreter: per-module import cost (-X importtime), '
+        'AppConfig.ready() cost and time to first-request readiness'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=25, help='Rows in the module / package tables')
+        parser.add_argument('--runs', type=int, default=3, help='Fresh interpreters to start (median reported)')
+        parser.add_argument('--prefix', help='Only list modules starting with this prefix, e.g. "apps."')
+        parser.add_argument('--no-urls', action='store_true', help='Stop after django.setup() (management-command startup)')
+        parser.add_argument('--json', action='store_true', help='Print the raw report as JSON')
+
+    def handle(self, *args, **options):
+        runs = [self._run(not options['no_urls']) for _ in range(max(options['runs'], 1))]
+        report = self._aggregate(runs)
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self._phases(report)
+        self._ready(report, options['limit'])
+        self._packages(report, options['limit'])
+        self._modules(report, options['limit'], options['prefix'])
+
+    def _run(self, load_urls):
+        env = {**os.environ, 'PYTHONDONTWRITEBYTECODE': '1'}
+        code = f'LOAD_URLS = {load_urls!r}\n{BOOTSTRAP}'
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            capture_output=True, text=True, env=env, cwd=os.getcwd(),
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+        if proc.returncode != 0:
+            tail = [line for line in proc.stderr.splitlines() if not line.startswith('import time:')]
+            raise CommandError('Startup failed:\n' + '\n'.join(tail[-20:]))
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        result['wall'] = wall_ms
+        result['modules'] = parse_importtime(proc.stderr)
+        return result
+
+    @staticmethod
+    def _aggregate(runs):
+        median = statistics.median
+        modules = defaultdict(list)
+        for run in runs:
+            for name, timing in run['modules'].items():
+                modules[name].append(timing)
+        module_ms = {
+            name: {
+                'self_ms': median(t[0] for t in timings) / 1000,
+                'cumulative_ms': median(t[1] for t in timings) / 1000,
+            }
+            for name, timings in modules.items()
+        }
+        packages = defaultdict(float)
+        for name, timing in module_ms.items():
+            packages[package_of(name)] += timing['self_ms']
+        return {
+            'runs': len(runs),
+            'wall_ms': median(run['wall'] for run in runs),
+            'phases_ms': {
+                name: median(run['phases'][name] for run in runs)
+                for name, _ in PHASES if name in runs[0]['phases']
+            },
+            'ready_ms': {
+                label: median(run['ready'].get(label, 0.0) for run in runs) for label in runs[0]['ready']
+            },
+            'modules_imported': len(module_ms),
+            'packages_ms': dict(sorted(packages.items(), key=lambda item: -item[1])),
+            'modules': dict(sorted(module_ms.items(), key=lambda item: -item[1]['cumulative_ms'])),
+        }
+
+    def _phases(self, report):
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"Startup (median of {report['runs']} runs, {report['modules_imported']} modules imported)"
+        ))
+        for name, label in PHASES:
+            if name in report['phases_ms']:
+                self.stdout.write(f"  {name:<12}{report['phases_ms'][name]:>9.1f} ms  {label}")
+        accounted = sum(report['phases_ms'].values())
+        self.stdout.write(f"  {'process':<12}{report['wall_ms'] - accounted:>9.1f} ms  interpreter start / exit")
+        self.stdout.write(self.style.SUCCESS(f"  {'total':<12}{report['wall_ms']:>9.1f} ms"))
+
+    def _ready(self, report, limit):
+        self.stdout.write(self.style.MIGRATE_HEADING('\nAppConfig.ready()'))
+        ready = sorted(report['ready_ms'].items(), key=lambda item: -item[1])
+        for label, ms in [item for item in ready if item[1] >= 0.05][:limit]:
+            self.stdout.write(f'  {label:<28}{ms:>9.1f} ms')
+
+    def _packages(self, report, limit):
+        self.stdout.write(self.style.MIGRATE_HEADING('\nImport cost by package (self time)'))
+        for name, ms in list(report['packages_ms'].items())[:limit]:
+            self.stdout.write(f'  {name:<28}{ms:>9.1f} ms')
+
+    def _modules(self, report, limit, prefix):
+        heading = 'Slowest imports (cumulative)' + (f' under {prefix!r}' if prefix else '')
+        self.stdout.write(self.style.MIGRATE_HEADING(f'\n{heading}'))
+        self.stdout.write(f"  {'module':<52}{'cumul ms':>10}{'self ms':>9}")
+        rows = [
+            (name, timing) for name, timing in report['modules'].items()
+            if prefix is None or name.startswith(prefix)
+        ]
+        for name, timing in rows[:limit]:
+            self.stdout.write(f"  {name:<52}{timing['cumulative_ms']:>10.1f}{timing['self_ms']:>9.1f}")
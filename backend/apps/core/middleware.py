@@ -1,11 +1,39 @@
 import time
 import logging
-import threading
+import contextvars
+from contextlib import contextmanager
 
-_thread_locals = threading.local()
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+# Tenant context lives in a ContextVar (not threading.local) so each request -
+# sync or async, including the sync_to_async threads an async request hops to -
+# and each task run in a copied context (apps.core.fanout) sees its own tenant.
+_current_tenant = contextvars.ContextVar('current_tenant', default=None)
 
 def get_current_tenant():
-    return getattr(_thread_locals, 'tenant', None)
+    return _current_tenant.get()
+
+def set_current_tenant(tenant):
+    """Sets the tenant for the current context; returns a token for reset_current_tenant()."""
+    return _current_tenant.set(tenant)
+
+def reset_current_tenant(token):
+    _current_tenant.reset(token)
+
+@contextmanager
+def tenant_context(tenant):
+    """
+    Scopes TenantAwareManager queries to a tenant outside the request cycle
+    (background jobs, management commands, worker threads):
+
+        with tenant_context(tenant):
+            Alert.objects.count()
+    """
+    token = _current_tenant.set(tenant)
+    try:
+        yield tenant
+    finally:
+        _current_tenant.reset(token)
 
 from django.utils.deprecation import MiddlewareMixin
 from django.http import JsonResponse
@@ -13,15 +41,92 @@ from django.http import JsonResponse
 logger = logging.getLogger(__name__)
 
 class RequestLoggingMiddleware:
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
+        from apps.core import observability
+        from apps.core.host_metrics import HostMetrics
+
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+        # Installed with the middleware rather than in CoreConfig.ready(): serializer
+        # time is only ever attributed inside a request, and processes that never
+        # serve one (migrate, run_jobs) skip importing rest_framework.serializers.
+        if observability.config()['ENABLED'] and observability.config()['SERIALIZER_TIMING']:
+            observability.install_serializer_timing()
+        # Likewise only serving processes run the host metrics sampler
+        HostMetrics.ensure_started()
 
     def __call__(self, request):
-        start_time = time.time()
-        
-        response = self.get_response(request)
+        from apps.core import observability
+
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        start_time = time.perf_counter()
+        if not observability.config()['ENABLED']:
+            response = self.get_response(request)
+            self._log_basic(request, response, time.perf_counter() - start_time)
+            return response
+
+        with observability.track_request(observability.RequestMetrics()) as metrics:
+            response = self.get_response(request)
+        self._log(request, response, (time.perf_counter() - start_time) * 1000, metrics)
+        return response
+
+    async def __acall__(self, request):
+        from apps.core import observability
+
+        # Logging reads request.user, which may load the user from the database
+        start_time = time.perf_counter()
+        if not observability.config()['ENABLED']:
+            response = await self.get_response(request)
+            await sync_to_async(self._log_basic)(request, response, time.perf_counter() - start_time)
+            return response
+
+        async with observability.atrack_request(observability.RequestMetrics()) as metrics:
+            response = await self.get_response(request)
+        await sync_to_async(self._log)(request, response, (time.perf_counter() - start_time) * 1000, metrics)
+        return response
+
+    def _log(self, request, response, duration_ms, metrics):
+        from apps.core import observability
+
+        route = observability.route_for(request)
+        observability.RouteStats.record(route, duration_ms, metrics)
+        observability.ResponseCounts.record(response.status_code)
+
+        user = getattr(request.user, 'username', 'Anonymous') if hasattr(request, 'user') and request.user.is_authenticated else 'Anonymous'
+        tenant_obj = getattr(request, 'tenant', None)
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'route': route,
+            'user': user,
+            'tenant': tenant_obj.name if tenant_obj else None,
+            'status': response.status_code,
+            'duration_ms': round(duration_ms, 2),
+            'ip': self.get_client_ip(request),
+            **metrics.as_dict(),
+        }
+
+        log = logger.warning if duration_ms >= observability.config()['SLOW_REQUEST_MS'] else logger.info
+        log(
+            "Method: %(method)s | Path: %(path)s | User: %(user)s | Tenant: %(tenant)s | "
+            "Status: %(status)s | Duration: %(duration_ms).1fms | Queries: %(db_queries)s "
+            "(%(db_time_ms).1fms) | Cache: %(cache_hits)s/%(cache_misses)s | "
+            "Serializer: %(serializer_time_ms).1fms | IP: %(ip)s",
+            record,
+            extra={'request_metrics': record},
+        )
+
+    def _log_basic(self, request, response, duration):
+        from apps.core.observability import ResponseCounts
+
+        ResponseCounts.record(response.status_code)
         
-        duration = time.time() - start_time
         user = getattr(request.user, 'username', 'Anonymous') if hasattr(request, 'user') and request.user.is_authenticated else 'Anonymous'
         
         tenant_obj = getattr(request, 'tenant', None)
@@ -33,7 +138,6 @@ class RequestLoggingMiddleware:
             f"Status: {response.status_code} | Duration: {duration:.3f}s | "
             f"IP: {self.get_client_ip(request)}"
         )
-        return response
 
     def get_client_ip(self, request):
         x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
@@ -42,10 +146,33 @@ class RequestLoggingMiddleware:
         return request.META.get('REMOTE_ADDR')
 
 class TenantMiddleware:
+    """
+    Resolves request.tenant and binds it to the tenant ContextVar for the
+    duration of the request. Sync and async capable, so async views can be
+    adopted without Django adapting the chain around them.
+    """
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        request.tenant = self.resolve_tenant(request)
+        with tenant_context(request.tenant):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        # Resolution may hit the database (TenantCache miss, request.user)
+        request.tenant = await sync_to_async(self.resolve_tenant)(request)
+        with tenant_context(request.tenant):
+            return await self.get_response(request)
+
+    def resolve_tenant(self, request):
         # 1. Check Header (API Priority)
         tenant_domain = request.headers.get('X-Tenant-ID')
         
@@ -56,23 +183,50 @@ class TenantMiddleware:
             if len(parts) > 2: # e.g. tenant.bitguard.com
                 tenant_domain = parts[0]
 
+        # Resolutions are served from an in-process LRU+TTL cache (apps.tenants.cache)
+        from apps.tenants.cache import TenantCache
+
         # 3. Check User Profile Default (Fallback for Internal Org)
         if not tenant_domain and request.user.is_authenticated:
-            if hasattr(request.user, 'employee_profile') and request.user.employee_profile.tenant:
-                request.tenant = request.user.employee_profile.tenant
-                _thread_locals.tenant = request.tenant
-                return self.get_response(request)
-
-        from apps.tenants.models import Tenant
+            tenant = TenantCache.for_user(request.user)
+            if tenant:
+                return tenant
 
         if tenant_domain:
-            try:
-                request.tenant = Tenant.objects.get(domain=tenant_domain, is_active=True)
-            except Tenant.DoesNotExist:
-                request.tenant = None
-        else:
-            request.tenant = None
+            return TenantCache.for_domain(tenant_domain)
+        return None
+
+
+class AuditBufferMiddleware:
+    """
+    Opens a per-request AuditBuffer scope so autocommit audit rows logged while
+    handling the request are written with one bulk_create when it finishes.
+    No-op unless settings.AUDIT_BUFFER['ENABLED'] is set.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        from apps.core.services.audit_buffer import AuditBuffer
+
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not AuditBuffer.is_enabled():
+            return self.get_response(request)
+
+        with AuditBuffer.scope():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        from apps.core.services.audit_buffer import AuditBuffer
 
-        _thread_locals.tenant = request.tenant
+        if not AuditBuffer.is_enabled():
+            return await self.get_response(request)
 
-        return self.get_response(request)
+        async with AuditBuffer.ascope():
+            return await self.get_response(request)
@@ -0,0 +1,45 @@
+"""
+Migration operations for rolling out indexes on live tables.
+
+AddIndexOnline behaves exactly like AddIndex in the migration state, but on
+PostgreSQL it builds (and on rollback drops) the index with CONCURRENTLY so
+writes to the table are not blocked while it builds. Other backends (SQLite
+in dev/test) fall back to the plain operation.
+
+Migrations using it must set `atomic = False`: PostgreSQL refuses
+CREATE INDEX CONCURRENTLY inside a transaction. If a concurrent build is
+interrupted it leaves an INVALID index behind; drop it and re-run migrate.
+"""
+from django.db.migrations.operations import AddIndex
+
+
+def _online(schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return False
+    if schema_editor.connection.in_atomic_block:
+        raise RuntimeError(
+            'Concurrent index operations cannot run inside a transaction; '
+            'set atomic = False on the migration.'
+        )
+    return True
+
+
+class AddIndexOnline(AddIndex):
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if not _online(schema_editor):
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.add_index(model, self.index, concurrently=True)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if not _online(schema_editor):
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.remove_index(model, self.index, concurrently=True)
+
+    def describe(self):
+        return f"{super().describe()} (concurrently on PostgreSQL)"
+
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+def drop_cross_tenant_totals(apps, schema_editor):
+    # The tenant NULL counters held totals across tenants; they now count the
+    # rows without a tenant and are recounted on their next read.
+    apps.get_model('core', 'TenantKPICounter').objects.filter(tenant__isnull=True).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_tenantkpicounter'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_cross_tenant_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,188 @@
+"""
+Reusable ViewSet mixins.
+
+SparseFieldsMixin — `?fields=` / `?omit=` sparse fieldsets for read endpoints:
+
+    GET /api/security/alerts/?fields=id,title,severity
+    GET /api/support/tickets/?omit=description,messages
+
+Unrequested serializer fields are dropped from the response and the model
+columns nothing reads any more are deferred (`.defer()`), so large text/JSON
+columns are neither transferred from the database nor serialized. Columns are
+only deferred when every remaining field reads a model field or an annotation
+directly; a property, method or `get_*_display` source may read any column. Views may
+also declare `list_serializer_class`, a compact representation the list
+action returns for `?view=compact` (and no `?fields=`):
+
+    GET /api/support/tickets/?view=compact
+
+BulkImportMixin — `POST <list route>/import/` CSV / JSON Lines uploads for the
+view's `import_resource` (apps.core.imports):
+
+    POST /api/crm/clients/import/   file=<clients.csv> match=email dry_run=false
+
+Small files are imported in the request (201 with the finished ImportRun);
+larger ones are queued (202, poll the Location for progress).
+
+ExportMixin — `GET <list route>/export/?file_format=csv|xlsx` streams the
+filtered list as a download (apps.core.exports), columns from `export_columns`:
+
+    GET /api/support/tickets/export/?file_format=xlsx&status=open
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+
+from .pagination import config as pagination_config
+
+
+def requested_fields(request, param):
+    raw = request.query_params.get(param) if request is not None else None
+    if not raw:
+        return None
+    return {name.strip() for name in raw.split(',') if name.strip()}
+
+
+class SparseFieldsMixin:
+    fields_query_param = 'fields'
+    omit_query_param = 'omit'
+    view_query_param = 'view'
+    list_serializer_class = None
+
+    def get_serializer_class(self):
+        if self.is_compact_request():
+            return self.list_serializer_class
+        return super().get_serializer_class()
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        if self.is_sparse_request():
+            self.trim_fields(getattr(serializer, 'child', serializer).fields)
+        return serializer
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not self.is_sparse_request():
+            return queryset
+        serializer = self.get_serializer()
+        deferred = self.deferrable_columns(queryset, serializer.fields)
+        return queryset.defer(*deferred) if deferred else queryset
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    def is_compact_request(self):
+        request = getattr(self, 'request', None)
+        return (
+            request is not None
+            and getattr(self, 'action', None) == 'list'
+            and self.list_serializer_class is not None
+            and request.query_params.get(self.view_query_param) == 'compact'
+            and requested_fields(request, self.fields_query_param) is None
+        )
+
+    def is_sparse_request(self):
+        request = getattr(self, 'request', None)
+        return (
+            request is not None
+            and request.method in SAFE_METHODS
+            and (
+                self.is_compact_request()
+                or any(
+                    requested_fields(request, param) is not None
+                    for param in (self.fields_query_param, self.omit_query_param)
+                )
+            )
+        )
+
+    def trim_fields(self, fields):
+        keep = requested_fields(self.request, self.fields_query_param)
+        omit = requested_fields(self.request, self.omit_query_param) or set()
+        for name in list(fields):
+            if (keep is not None and name not in keep) or name in omit:
+                fields.pop(name)
+
+    def deferrable_columns(self, queryset, fields):
+        """Concrete columns no remaining serializer field reads (empty if that cannot be known)."""
+        opts = queryset.model._meta
+        needed = set(pagination_config()['KEYSET_FIELDS'])
+        for field in fields.values():
+            if field.source == '*' or isinstance(field, serializers.SerializerMethodField):
+                return []
+            root = field.source.split('.')[0]
+            if root in queryset.query.annotations:
+                continue
+            try:
+                needed.add(opts.get_field(root).name)  # also resolves attnames such as client_id
+            except FieldDoesNotExist:
+                return []
+
+        select_related = queryset.query.select_related
+        columns = []
+        for model_field in opts.concrete_fields:
+            if model_field.primary_key or model_field.name in needed:
+                continue
+            if model_field.is_relation and (
+                select_related is True or (isinstance(select_related, dict) and model_field.name in select_related)
+            ):
+                continue
+            columns.append(model_field.name)
+        return columns
+
+
+class BulkImportMixin:
+    import_resource = None  # ImporterRegistry name, e.g. 'crm.clients'
+
+    @action(detail=False, methods=['post'], url_path='import', parser_classes=[MultiPartParser, FormParser])
+    def bulk_import(self, request, *args, **kwargs):
+        """Imports an uploaded CSV / JSON Lines file into this resource."""
+        return import_response(request, self.import_resource)
+
+
+def import_response(request, resource):
+    """Starts an import of the request's upload: 201 when it ran inline, 202 when queued."""
+    from .imports import start_import
+    from .serializers import ImportRunSerializer, ImportUploadSerializer
+
+    tenant = getattr(request, 'tenant', None)
+    if tenant is None:
+        return Response({'error': 'Imports need a tenant context.'}, status=status.HTTP_400_BAD_REQUEST)
+    upload = ImportUploadSerializer(data=request.data)
+    upload.is_valid(raise_exception=True)
+    data = upload.validated_data
+    try:
+        run = start_import(
+            tenant, request.user, resource, data['file'],
+            fmt=data.get('format'), match=data.get('match'), dry_run=data['dry_run'],
+        )
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+    body = ImportRunSerializer(run).data
+    if run.status == run.STATUS_QUEUED:
+        location = reverse('import-run-detail', args=[run.pk], request=request)
+        return Response(body, status=status.HTTP_202_ACCEPTED, headers={'Location': location})
+    return Response(body, status=status.HTTP_201_CREATED)
+
+
+class ExportMixin:
+    export_columns = ()     # (header, lookup[, value for empty cells]); lookups may span relations
+    export_filename = None  # download name without date / extension (default: the model's plural name)
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request, *args, **kwargs):
+        """Streams the filtered list as CSV (default) or XLSX."""
+        from .exports import FORMATS, streaming_export
+
+        # Not `format`: DRF reserves that query parameter for renderer selection
+        file_format = request.query_params.get('file_format', 'csv').lower()
+        if file_format not in FORMATS:
+            return Response(
+                {'error': f"file_format must be one of: {', '.join(FORMATS)}"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        queryset = self.filter_queryset(self.get_queryset())
+        filename = self.export_filename or str(queryset.model._meta.verbose_name_plural).replace(' ', '_')
+        return streaming_export(queryset, self.export_columns, file_format, filename)
@@ -61,6 +61,23 @@ class TenantAwareModel(models.Model):
     class Meta:
         abstract = True
 
+def tenant_indexes(prefix, soft_delete=True, status_field=None):
+    """
+    Standard index set for tenant-scoped models, matching how list endpoints
+    query them (BaseService.filter_by_context / TenantAwareManager):
+
+        tenant [+ is_deleted] + created_at  -> filtered, newest-first lists
+        tenant + status_field               -> status counters and filters
+
+    Usage: class Meta: indexes = tenant_indexes('soc_incident', status_field='status')
+    `prefix` keeps the generated names unique and within the 30 char limit.
+    """
+    leading = ['tenant', 'is_deleted'] if soft_delete else ['tenant']
+    indexes = [models.Index(fields=[*leading, 'created_at'], name=f'{prefix}_tn_created_idx')]
+    if status_field:
+        indexes.append(models.Index(fields=['tenant', status_field], name=f'{prefix}_tn_{status_field}_idx'))
+    return indexes
+
 # Core app now serves as a utility belt and middleware container.
 # All business logic models have been moved to domain-specific apps:
 # - Identity -> apps.users
@@ -73,7 +90,8 @@ class AuditLog(models.Model):
     Centralized audit log for critical system events.
     Ensures traceability for regulatory and financial compliance (Charter Section 11).
     """
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Explicit default (not auto_now_add) so buffered entries keep the time the action happened
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name='audit_logs')
     tenant = models.ForeignKey('tenants.Tenant', on_delete=models.SET_NULL, null=True, related_name='audit_logs')
     action = models.CharField(max_length=255) # e.g. "PROFILE_UPDATE", "CHECKOUT_INITIATED"
@@ -86,3 +104,161 @@ class AuditLog(models.Model):
 
     def __str__(self):
         return f"{self.timestamp} - {self.action} by {self.user}"
+
+
+class OutboxMessage(models.Model):
+    """
+    Transactional outbox for cross-module domain signals (Charter Section 20).
+    Written in the same transaction as the state change that raised the signal
+    and delivered afterwards by `manage.py run_outbox` (apps.core.outbox),
+    inside the tenant context it was sent from.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_PROCESSING = 'processing'
+    STATUS_DONE = 'done'
+    STATUS_DEAD = 'dead'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_PROCESSING, 'Processing'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_DEAD, 'Dead letter'),
+    ]
+
+    topic = models.CharField(max_length=100)  # registered signal name, e.g. "order_paid"
+    payload = models.JSONField(default=dict, blank=True)
+    tenant = models.ForeignKey('tenants.Tenant', on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    claimed_by = models.CharField(max_length=64, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'available_at'], name='core_outbox_ready_idx'),
+            models.Index(fields=['claimed_by'], name='core_outbox_claim_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.topic} #{self.pk} ({self.status})"
+
+
+class Job(models.Model):
+    """
+    Background job stored in the database (no broker). Enqueued with
+    `task.delay()` / `task.schedule()` and executed by `manage.py run_jobs`
+    (apps.core.jobs).
+    """
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    queue = models.CharField(max_length=50, default='default')
+    task = models.CharField(max_length=255)  # dotted path of the registered task
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    priority = models.SmallIntegerField(default=0)  # higher runs first
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_at = models.DateTimeField(default=timezone.now)
+    tenant = models.ForeignKey('tenants.Tenant', on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    locked_by = models.CharField(max_length=64, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    result = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-priority', 'run_at', 'id']
+        indexes = [
+            models.Index(fields=['queue', 'status', '-priority', 'run_at'], name='core_job_ready_idx'),
+            models.Index(fields=['status', 'locked_until'], name='core_job_lease_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} ({self.status})"
+
+
+class ImportRun(models.Model):
+    """
+    One bulk import of a CSV / JSONL file (apps.core.imports). Counters are
+    updated after every batch, so the row doubles as the progress report
+    polled through /api/core/imports/<id>/.
+    """
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+    FORMAT_CHOICES = [('csv', 'CSV'), ('jsonl', 'JSON Lines')]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    tenant = models.ForeignKey('tenants.Tenant', on_delete=models.CASCADE, related_name='+')
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    resource = models.CharField(max_length=100)  # importer name, e.g. "crm.clients"
+    format = models.CharField(max_length=10, choices=FORMAT_CHOICES)
+    file_name = models.CharField(max_length=255, blank=True)
+    file_path = models.CharField(max_length=500, blank=True)  # default_storage path while queued
+    match_fields = models.JSONField(default=list, blank=True)
+    dry_run = models.BooleanField(default=False)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    processed = models.PositiveIntegerField(default=0)
+    created = models.PositiveIntegerField(default=0)
+    updated = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)  # first IMPORTS['MAX_ERRORS'] row errors
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [models.Index(fields=['tenant', '-created_at'], name='core_import_tn_created_idx')]
+
+    def __str__(self):
+        return f"{self.resource} import {self.pk} ({self.status})"
+
+
+class TenantKPICounter(models.Model):
+    """
+    One incrementally maintained dashboard count (apps.core.kpis): the rows of
+    a model matching a KPI definition, per tenant. The row with tenant NULL
+    counts the rows without a tenant; figures across tenants are summed.
+    """
+    tenant = models.ForeignKey('tenants.Tenant', on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    key = models.CharField(max_length=100)  # KPI key, e.g. "soc.alerts.unresolved"
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['tenant', 'key'], condition=models.Q(tenant__isnull=False), name='core_kpi_tenant_key_uniq'
+            ),
+            models.UniqueConstraint(
+                fields=['key'], condition=models.Q(tenant__isnull=True), name='core_kpi_global_key_uniq'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.key} = {self.value} ({self.tenant_id or 'no tenant'})"
@@ -0,0 +1,289 @@
+"""
+Per-request performance instrumentation (Observability, Charter §19).
+
+RequestLoggingMiddleware opens a RequestMetrics scope for every request:
+    - DB query count and time, collected with connection.execute_wrapper
+    - cache hits / misses reported by in-process caches via record_cache_access()
+    - time spent producing serializer.data
+
+Finished requests are aggregated per route into fixed-bucket latency
+histograms (RouteStats) from which p50/p95/p99 are estimated. Everything is
+in-process; each worker reports its own numbers.
+"""
+import contextvars
+import threading
+import time
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+
+DEFAULTS = {
+    'ENABLED': True,
+    'SERIALIZER_TIMING': True,
+    'SLOW_REQUEST_MS': 1000,
+    'MAX_ROUTES': 500,
+}
+
+# Upper bounds (ms) of the latency buckets; the last bucket is open-ended.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_current = contextvars.ContextVar('request_metrics', default=None)
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'PERF_INSTRUMENTATION', {})}
+
+
+class RequestMetrics:
+    """Counters for a single request. Only ever touched by the request's own thread / task."""
+    __slots__ = (
+        'db_queries', 'db_time', 'cache_hits', 'cache_misses',
+        'serializer_time', '_serializer_depth', 'query_observers',
+    )
+
+    def __init__(self):
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.serializer_time = 0.0
+        self._serializer_depth = 0
+        # Callables receiving (sql, duration) for every query, e.g. the N+1 detector
+        self.query_observers = []
+
+    def as_dict(self):
+        return {
+            'db_queries': self.db_queries,
+            'db_time_ms': round(self.db_time * 1000, 2),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'serializer_time_ms': round(self.serializer_time * 1000, 2),
+        }
+
+
+class QueryTimer:
+    """connection.execute_wrapper hook counting and timing every SQL statement."""
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.metrics.db_queries += 1
+            self.metrics.db_time += elapsed
+            for observer in self.metrics.query_observers:
+                observer(sql, elapsed)
+
+
+def current_metrics():
+    return _current.get()
+
+
+@contextmanager
+def track_request(metrics):
+    """Binds metrics to the current context and times queries on every configured DB alias."""
+    token = _current.set(metrics)
+    try:
+        with ExitStack() as stack:
+            _wrap_connections(stack, QueryTimer(metrics))
+            yield metrics
+    finally:
+        _current.reset(token)
+
+
+@asynccontextmanager
+async def atrack_request(metrics):
+    """
+    track_request() for async middleware. Connections are per thread and the
+    ORM runs on the request's sync thread (sync_to_async), so the query hooks
+    are installed and removed there; the metrics are bound in the caller's context.
+    """
+    token = _current.set(metrics)
+    stack = ExitStack()
+    try:
+        await sync_to_async(_wrap_connections)(stack, QueryTimer(metrics))
+        yield metrics
+    finally:
+        await sync_to_async(stack.close)()
+        _current.reset(token)
+
+
+def _wrap_connections(stack, timer):
+    for alias in connections:
+        stack.enter_context(connections[alias].execute_wrapper(timer))
+
+
+def record_cache_access(hit):
+    """Called by in-process / Django cache users to attribute hits and misses to the request."""
+    metrics = _current.get()
+    if metrics is None:
+        return
+    if hit:
+        metrics.cache_hits += 1
+    else:
+        metrics.cache_misses += 1
+
+
+@contextmanager
+def serializer_timer():
+    """Times the outermost serializer.data evaluation; nested serializers are not double counted."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    metrics._serializer_depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics._serializer_depth -= 1
+        if metrics._serializer_depth == 0:
+            metrics.serializer_time += time.perf_counter() - start
+
+
+def install_serializer_timing():
+    """
+    Wraps rest_framework's BaseSerializer.data so serialization time is
+    attributed to the request. Called when RequestLoggingMiddleware is loaded.
+    """
+    from rest_framework.serializers import BaseSerializer
+
+    original = BaseSerializer.data
+    if getattr(original.fget, '_timed', False):
+        return
+
+    def data(self):
+        with serializer_timer():
+            return original.fget(self)
+
+    data._timed = True
+    BaseSerializer.data = property(data)
+
+
+def route_for(request):
+    """Stable, low-cardinality route label: the URL pattern rather than the concrete path."""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return f"{request.method} <unresolved>"
+    # Router patterns come through as 'api/security/^endpoints/$'
+    return f"{request.method} /{match.route.replace('^', '').replace('$', '')}"
+
+
+class LatencyHistogram:
+    __slots__ = ('counts', 'count', 'total_ms', 'max_ms', 'db_queries', 'db_time_ms', 'serializer_time_ms')
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.db_queries = 0
+        self.db_time_ms = 0.0
+        self.serializer_time_ms = 0.0
+
+    def record(self, duration_ms, metrics):
+        index = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if duration_ms <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.db_queries += metrics.db_queries
+        self.db_time_ms += metrics.db_time * 1000
+        self.serializer_time_ms += metrics.serializer_time * 1000
+
+    def percentile(self, q):
+        """Linear interpolation inside the bucket holding the q-th observation."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for i, bucket_count in enumerate(self.counts):
+            upper = LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+            if bucket_count and seen + bucket_count >= rank:
+                fraction = (rank - seen) / bucket_count
+                return round(min(lower + (upper - lower) * fraction, self.max_ms), 2)
+            seen += bucket_count
+            lower = upper
+        return round(self.max_ms, 2)
+
+    def as_dict(self):
+        count = self.count or 1
+        return {
+            'count': self.count,
+            'p50_ms': self.percentile(0.50),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'mean_ms': round(self.total_ms / count, 2),
+            'max_ms': round(self.max_ms, 2),
+            'avg_db_queries': round(self.db_queries / count, 2),
+            'avg_db_time_ms': round(self.db_time_ms / count, 2),
+            'avg_serializer_time_ms': round(self.serializer_time_ms / count, 2),
+            'buckets': dict(zip([*map(str, LATENCY_BUCKETS_MS), 'inf'], self.counts)),
+        }
+
+
+class RouteStats:
+    """Process-wide registry of per-route latency histograms."""
+    _lock = threading.Lock()
+    _routes = {}
+    _started_at = time.time()
+
+    @classmethod
+    def record(cls, route, duration_ms, metrics):
+        with cls._lock:
+            histogram = cls._routes.get(route)
+            if histogram is None:
+                if len(cls._routes) >= config()['MAX_ROUTES']:
+                    route = '<other>'
+                    histogram = cls._routes.setdefault(route, LatencyHistogram())
+                else:
+                    histogram = cls._routes[route] = LatencyHistogram()
+            histogram.record(duration_ms, metrics)
+
+    @classmethod
+    def snapshot(cls, prefix=None):
+        with cls._lock:
+            routes = {
+                route: histogram.as_dict()
+                for route, histogram in cls._routes.items()
+                if not prefix or prefix in route
+            }
+        return {
+            'since': cls._started_at,
+            'routes': dict(sorted(routes.items(), key=lambda item: item[1]['p95_ms'], reverse=True)),
+        }
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._routes.clear()
+            cls._started_at = time.time()
+
+
+class ResponseCounts:
+    """Process-wide response totals; HostMetrics turns them into an error rate per sample."""
+    _lock = threading.Lock()
+    requests = 0
+    errors = 0
+
+    @classmethod
+    def record(cls, status_code):
+        with cls._lock:
+            cls.requests += 1
+            if status_code >= 500:
+                cls.errors += 1
+
+    @classmethod
+    def totals(cls):
+        with cls._lock:
+            return cls.requests, cls.errors
@@ -0,0 +1,254 @@
+"""
+Transactional outbox for cross-module domain signals (Charter §20).
+
+Instead of `order_paid.send(...)`, services call
+
+    Outbox.send('order_paid', sender=None, order=order, request=request)
+
+which inserts an OutboxMessage in the caller's transaction: the message
+exists if and only if the state change committed. `manage.py run_outbox`
+drains the table in batches with parallel consumers and re-sends each
+message through its Django Signal, inside the tenant context that was
+current when it was sent. Every delivery runs in its own
+transaction together with the "done" update, so receiver writes and the
+acknowledgement commit or roll back together; failures are retried with
+exponential backoff and dead-lettered after MAX_ATTEMPTS.
+
+Payload encoding: model instances travel as {"__model__": label, "pk": ...}
+and are re-loaded on delivery; `request` is reduced to user / tenant / IP and
+rebuilt as an OutboxRequest so AuditService attribution still works.
+"""
+import json
+import logging
+import random
+import traceback
+import uuid
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.db.models import F, Min, Q
+from django.utils import timezone
+
+from .middleware import get_current_tenant, tenant_context
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'BATCH_SIZE': 100,
+    'WORKERS': 4,
+    'MAX_ATTEMPTS': 8,
+    'BACKOFF_BASE': 2.0,      # seconds, doubled per attempt
+    'BACKOFF_MAX': 600,
+    'LEASE': 300,             # seconds before a claimed batch may be re-claimed
+    'POLL_INTERVAL': 1.0,
+}
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'OUTBOX', {})}
+
+
+class OutboxRequest:
+    """Minimal stand-in for the originating request, for receivers that audit."""
+
+    def __init__(self, user=None, tenant=None, ip=None):
+        self.user = user
+        self.tenant = tenant
+        self.META = {'REMOTE_ADDR': ip} if ip else {}
+
+    @classmethod
+    def capture(cls, request):
+        user = getattr(request, 'user', None)
+        tenant = getattr(request, 'tenant', None)
+        forwarded = request.META.get('HTTP_X_FORWARDED_FOR')
+        return {
+            'user_id': str(user.pk) if user is not None and user.is_authenticated else None,
+            'tenant_id': str(tenant.pk) if tenant is not None else None,
+            'ip': forwarded.split(',')[0] if forwarded else request.META.get('REMOTE_ADDR'),
+        }
+
+    @classmethod
+    def restore(cls, data):
+        from django.contrib.auth.models import AnonymousUser
+
+        User = apps.get_model(settings.AUTH_USER_MODEL)
+        Tenant = apps.get_model('tenants', 'Tenant')
+        user = User._base_manager.filter(pk=data['user_id']).first() if data.get('user_id') else None
+        tenant = Tenant._base_manager.filter(pk=data['tenant_id']).first() if data.get('tenant_id') else None
+        return cls(user=user or AnonymousUser(), tenant=tenant, ip=data.get('ip'))
+
+
+class Outbox:
+    _signals = {}
+
+    @classmethod
+    def register(cls, topic, signal):
+        cls._signals[topic] = signal
+
+    # ── Producing ─────────────────────────────────────────────────────────
+
+    @classmethod
+    def send(cls, topic, sender=None, **kwargs):
+        """Queues a signal for delivery once the surrounding transaction commits."""
+        from .models import OutboxMessage
+
+        if topic not in cls._signals:
+            raise ValueError(f"Unknown outbox topic '{topic}'")
+        payload = {
+            'sender': sender._meta.label if isinstance(sender, type) and issubclass(sender, models.Model) else None,
+            'kwargs': {key: cls._encode(key, value) for key, value in kwargs.items()},
+        }
+        return OutboxMessage.objects.create(
+            topic=topic,
+            tenant=get_current_tenant(),
+            payload=json.loads(json.dumps(payload, cls=DjangoJSONEncoder)),
+        )
+
+    # ── Consuming ─────────────────────────────────────────────────────────
+
+    @classmethod
+    def claim(cls, batch_size=None):
+        """
+        Leases up to batch_size ready messages to a new claim token and returns
+        them. SELECT ... FOR UPDATE SKIP LOCKED keeps concurrent consumers on
+        disjoint rows; the status-guarded UPDATE covers backends without it.
+        """
+        from .models import OutboxMessage
+
+        cfg = config()
+        now = timezone.now()
+        token = uuid.uuid4().hex
+        ready = (
+            Q(status=OutboxMessage.STATUS_PENDING, available_at__lte=now)
+            | Q(status=OutboxMessage.STATUS_PROCESSING, locked_until__lt=now)
+        )
+        with transaction.atomic():
+            ids = list(
+                OutboxMessage.objects.select_for_update(skip_locked=True)
+                .filter(ready)
+                .order_by('id')
+                .values_list('id', flat=True)[:batch_size or cfg['BATCH_SIZE']]
+            )
+            if not ids:
+                return []
+            OutboxMessage.objects.filter(ready, id__in=ids).update(
+                status=OutboxMessage.STATUS_PROCESSING,
+                claimed_by=token,
+                locked_until=now + timedelta(seconds=cfg['LEASE']),
+                attempts=F('attempts') + 1,
+            )
+        return list(
+            OutboxMessage.objects.select_related('tenant')
+            .filter(claimed_by=token, status=OutboxMessage.STATUS_PROCESSING)
+        )
+
+    @classmethod
+    def deliver(cls, message):
+        """Sends one message through its signal. Returns True on success."""
+        from .models import OutboxMessage
+
+        try:
+            with tenant_context(message.tenant), transaction.atomic():
+                signal = cls._signals[message.topic]
+                sender = message.payload.get('sender')
+                signal.send(
+                    sender=apps.get_model(sender) if sender else None,
+                    **{key: cls._decode(key, value) for key, value in message.payload.get('kwargs', {}).items()}
+                )
+                OutboxMessage.objects.filter(pk=message.pk, claimed_by=message.claimed_by).update(
+                    status=OutboxMessage.STATUS_DONE,
+                    processed_at=timezone.now(),
+                    last_error='',
+                )
+            return True
+        except Exception:
+            cls._fail(message, traceback.format_exc())
+            return False
+
+    @classmethod
+    def process_batch(cls, batch_size=None):
+        """Claims and delivers one batch. Returns (delivered, failed)."""
+        delivered = failed = 0
+        for message in cls.claim(batch_size):
+            if cls.deliver(message):
+                delivered += 1
+            else:
+                failed += 1
+        return delivered, failed
+
+    @classmethod
+    def stats(cls):
+        """Lag, throughput and dead-letter counters for the health endpoints."""
+        from .models import OutboxMessage
+
+        now = timezone.now()
+        counts = dict(
+            OutboxMessage.objects.values_list('status').annotate(total=models.Count('id')).order_by()
+        )
+        oldest = OutboxMessage.objects.filter(
+            status__in=[OutboxMessage.STATUS_PENDING, OutboxMessage.STATUS_PROCESSING]
+        ).aggregate(oldest=Min('created_at'))['oldest']
+        done_recently = OutboxMessage.objects.filter(
+            status=OutboxMessage.STATUS_DONE, processed_at__gte=now - timedelta(minutes=5)
+        ).count()
+        return {
+            'pending': counts.get(OutboxMessage.STATUS_PENDING, 0),
+            'processing': counts.get(OutboxMessage.STATUS_PROCESSING, 0),
+            'done': counts.get(OutboxMessage.STATUS_DONE, 0),
+            'dead_letter': counts.get(OutboxMessage.STATUS_DEAD, 0),
+            'lag_seconds': round((now - oldest).total_seconds(), 1) if oldest else 0.0,
+            'throughput_per_minute': round(done_recently / 5, 1),
+        }
+
+    @classmethod
+    def purge(cls, older_than_days):
+        """Deletes delivered messages older than the given age. Returns the number removed."""
+        from .models import OutboxMessage
+
+        cutoff = timezone.now() - timedelta(days=older_than_days)
+        deleted, _ = OutboxMessage.objects.filter(
+            status=OutboxMessage.STATUS_DONE, processed_at__lt=cutoff
+        ).delete()
+        return deleted
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    @classmethod
+    def _fail(cls, message, error):
+        from .models import OutboxMessage
+
+        cfg = config()
+        if message.attempts >= cfg['MAX_ATTEMPTS']:
+            status, delay = OutboxMessage.STATUS_DEAD, 0
+            logger.error(f"Outbox: {message} dead-lettered after {message.attempts} attempts")
+        else:
+            status = OutboxMessage.STATUS_PENDING
+            delay = min(cfg['BACKOFF_BASE'] * 2 ** (message.attempts - 1), cfg['BACKOFF_MAX'])
+            delay *= random.uniform(0.8, 1.2)
+            logger.warning(f"Outbox: {message} failed (attempt {message.attempts}), retrying in {delay:.1f}s")
+        OutboxMessage.objects.filter(pk=message.pk, claimed_by=message.claimed_by).update(
+            status=status,
+            available_at=timezone.now() + timedelta(seconds=delay),
+            locked_until=None,
+            last_error=error[-4000:],
+        )
+
+    @staticmethod
+    def _encode(key, value):
+        if key == 'request':
+            return OutboxRequest.capture(value) if value is not None else None
+        if isinstance(value, models.Model):
+            return {'__model__': value._meta.label, 'pk': str(value.pk)}
+        return value
+
+    @staticmethod
+    def _decode(key, value):
+        if key == 'request':
+            return OutboxRequest.restore(value) if value is not None else None
+        if isinstance(value, dict) and '__model__' in value:
+            model = apps.get_model(value['__model__'])
+            return model._base_manager.filter(pk=value['pk']).first()
+        return value
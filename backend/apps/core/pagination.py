@@ -0,0 +1,220 @@
+"""
+Keyset list pagination for high-volume, newest-first feeds. Views opt in
+with `pagination_class = KeysetPagination`; other lists stay unpaginated.
+
+KeysetPagination pages newest-first on (created_at, id): the next page is
+`WHERE (created_at, id) < (last.created_at, last.id) ORDER BY created_at DESC,
+id DESC LIMIT n`, which the tenant-leading (tenant, [is_deleted,] created_at)
+indexes serve directly, so page 1000 costs the same as page 1. Cursors are
+opaque base64 tokens; clients follow the `next` / `previous` links.
+
+    GET /api/notifications/?page_size=50
+    -> {"next": ".../?cursor=eyJwIjpb...", "previous": null, "results": [...]}
+
+Offset mode (`?offset=200&limit=50`, or `pagination_mode = 'offset'` on a
+view) returns a `count` and numbered pages for admin screens that need them;
+it is also used automatically when the queryset is ordered by anything but
+the keyset column, whether explicitly (e.g. ?ordering= via OrderingFilter)
+or through the model's Meta.ordering.
+
+The keyset column is the model's `created_at` (or `timestamp`, as on
+AuditLog) unless the view sets `keyset_field`; models without either page on
+the primary key.
+"""
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+DEFAULTS = {
+    'PAGE_SIZE': 50,
+    'MAX_PAGE_SIZE': 200,
+    'KEYSET_FIELDS': ('created_at', 'timestamp'),  # first one the model has wins
+}
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'PAGINATION', {})}
+
+
+class KeysetPagination(BasePagination):
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    offset_query_param = 'offset'
+    limit_query_param = 'limit'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.mode = self.get_mode(queryset, request, view)
+        if self.mode == 'offset':
+            return self.paginate_offset(queryset, request, view)
+        return self.paginate_keyset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.mode == 'offset':
+            return Response({
+                'count': self.count,
+                'next': self.next_link,
+                'previous': self.previous_link,
+                'results': data,
+            })
+        return Response({
+            'next': self.next_link,
+            'previous': self.previous_link,
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'count': {'type': 'integer', 'description': 'Offset mode only'},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    # ── Mode / size ───────────────────────────────────────────────────────
+
+    def get_page_size(self, request):
+        cfg = config()
+        raw = request.query_params.get(self.page_size_query_param) or request.query_params.get(self.limit_query_param)
+        try:
+            size = int(raw) if raw else cfg['PAGE_SIZE']
+        except ValueError:
+            size = cfg['PAGE_SIZE']
+        return max(1, min(size, cfg['MAX_PAGE_SIZE']))
+
+    def get_mode(self, queryset, request, view):
+        if self.offset_query_param in request.query_params or getattr(view, 'pagination_mode', None) == 'offset':
+            return 'offset'
+        if not isinstance(queryset, QuerySet):
+            return 'offset'
+        # An ordering the keyset would silently replace
+        ordering = queryset.query.order_by or (
+            queryset.model._meta.ordering if queryset.query.default_ordering else ()
+        )
+        if ordering and ordering[0] not in (f'-{self.get_keyset_field(queryset.model, view)}', '-pk', '-id'):
+            return 'offset'
+        return 'keyset'
+
+    def get_keyset_field(self, model, view):
+        field = getattr(view, 'keyset_field', None)
+        if field:
+            return field
+        names = {f.name for f in model._meta.concrete_fields}
+        for candidate in config()['KEYSET_FIELDS']:
+            if candidate in names:
+                return candidate
+        return 'pk'
+
+    # ── Keyset ────────────────────────────────────────────────────────────
+
+    def paginate_keyset(self, queryset, request, view):
+        field = self.get_keyset_field(queryset.model, view)
+        fields = [field, 'pk'] if field != 'pk' else ['pk']
+        cursor = self.decode_cursor(request, queryset.model, fields)
+        reverse = bool(cursor and cursor['reverse'])
+
+        if cursor:
+            queryset = queryset.filter(self.keyset_filter(fields, cursor['position'], reverse))
+        ordering = [name if reverse else f'-{name}' for name in fields]
+        rows = list(queryset.order_by(*ordering)[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        # Forward pages have a next page when more rows remain and a previous
+        # page whenever a cursor was followed; backward pages the other way round.
+        has_next = bool(rows) and (reverse or has_more)
+        has_previous = bool(rows) and (has_more if reverse else cursor is not None)
+        self.next_link = self.encode_cursor(self.position(rows[-1], fields), reverse=False) if has_next else None
+        self.previous_link = self.encode_cursor(self.position(rows[0], fields), reverse=True) if has_previous else None
+        return rows
+
+    @staticmethod
+    def keyset_filter(fields, position, reverse):
+        """(f1, f2) < (v1, v2) expanded to OR/AND terms (row comparisons are not portable)."""
+        op = 'gt' if reverse else 'lt'
+        condition = Q()
+        for i, name in enumerate(fields):
+            term = Q(**{prior: position[j] for j, prior in enumerate(fields[:i])})
+            term &= Q(**{f'{name}__{op}': position[i]})
+            condition |= term
+        return condition
+
+    @staticmethod
+    def position(row, fields):
+        return [getattr(row, name) for name in fields]
+
+    def encode_cursor(self, position, reverse):
+        token = json.dumps({'p': position, 'r': int(reverse)}, default=self.encode_value, separators=(',', ':'))
+        encoded = base64.urlsafe_b64encode(token.encode()).decode().rstrip('=')
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    @staticmethod
+    def encode_value(value):
+        # Full-precision isoformat: DjangoJSONEncoder drops microseconds, which
+        # would make the (created_at, id) comparison skip or repeat rows.
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return str(value)
+
+    def decode_cursor(self, request, model, fields):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            token = json.loads(base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)))
+            raw = token['p']
+            if len(raw) != len(fields):
+                raise ValueError
+            position = [
+                model._meta.pk.to_python(value) if name == 'pk' else model._meta.get_field(name).to_python(value)
+                for name, value in zip(fields, raw)
+            ]
+            return {'position': position, 'reverse': bool(token.get('r'))}
+        except (binascii.Error, ValueError, TypeError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    # ── Offset ────────────────────────────────────────────────────────────
+
+    def paginate_offset(self, queryset, request, view=None):
+        try:
+            offset = max(int(request.query_params.get(self.offset_query_param, 0)), 0)
+        except ValueError:
+            offset = 0
+        if isinstance(queryset, QuerySet):
+            if not queryset.ordered:
+                field = self.get_keyset_field(queryset.model, view)
+                queryset = queryset.order_by(*dict.fromkeys([f'-{field}', '-pk']))
+            self.count = queryset.count()
+        else:
+            self.count = len(queryset)
+        rows = list(queryset[offset:offset + self.page_size])
+
+        url = request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.page_size)
+        url = remove_query_param(url, self.page_size_query_param)
+        self.next_link = (
+            replace_query_param(url, self.offset_query_param, offset + self.page_size)
+            if offset + self.page_size < self.count else None
+        )
+        self.previous_link = (
+            replace_query_param(url, self.offset_query_param, max(offset - self.page_size, 0))
+            if offset > 0 else None
+        )
+        return rows
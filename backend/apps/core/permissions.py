@@ -22,10 +22,10 @@ class HasRole(BasePermission):
         if request.user.is_superuser:
             return True
 
-        # Assumes user.roles.all() exists (implemented in apps.users later)
+        # Role names come from a cached per-user snapshot (apps.users.cache)
+        from apps.users.cache import PermissionCache
         try:
-            user_roles = [r.name for r in request.user.roles.all()]
-            return any(role in self.allowed_roles for role in user_roles)
+            return PermissionCache.for_user(request.user).has_role(*self.allowed_roles)
         except AttributeError:
             return False
 
@@ -0,0 +1,230 @@
+"""
+N+1 query detection for development and staging (Observability, Charter §19).
+
+Every SQL statement executed during a request is reduced to a fingerprint
+(its shape, without literals or IN-list lengths). Shapes repeated at least
+THRESHOLD times are reported together with the serializer field chain that
+triggered them, e.g. "OrderSerializer.items > OrderItemSerializer.product_details".
+For list responses a shape whose count is proportional to the returned rows
+(at least SCALE_RATIO per row) is flagged as scaling with the page size — the
+classic N+1. The ratio is below 1 because lazy loads over a nullable foreign
+key or an empty relation skip the rows that have nothing to fetch.
+
+settings.QUERY_INSPECTOR['MODE']:
+    'off'    — disabled (production default)
+    'report' — log a warning and add an X-Query-Inspector response header
+    'raise'  — raise NPlusOneError (use in CI / test settings)
+"""
+import logging
+import re
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from apps.core import observability
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'MODE': 'off',
+    'THRESHOLD': 5,
+    'SCALE_RATIO': 0.5,   # queries per listed row for a shape to count as scaling with the page
+    'IGNORE_PATHS': ['/admin/', '/static/', '/media/'],
+}
+
+_IN_LIST = re.compile(r'IN \((?:%s, )*%s\)')
+_NUMBER = re.compile(r'\b\d+\b')
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_SPACES = re.compile(r'\s+')
+
+_APP_ROOT = str(Path(settings.BASE_DIR))
+_INTERNAL_FILES = {__file__, observability.__file__}
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'QUERY_INSPECTOR', {})}
+
+
+class NPlusOneError(Exception):
+    """Raised in 'raise' mode when a list endpoint issues one query per row."""
+
+    def __init__(self, route, findings):
+        self.route = route
+        self.findings = findings
+        worst = findings[0]
+        super().__init__(
+            f"N+1 on {route}: {worst['count']}x {worst['sql'][:120]} (triggered by {worst['origin']})"
+        )
+
+
+def fingerprint(sql):
+    """Normalises a statement to its shape so per-row variants collapse to one key."""
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _IN_LIST.sub('IN (...)', sql)
+    return _SPACES.sub(' ', sql).strip()
+
+
+def _origin():
+    """
+    Serializer field chain (outermost first) that is currently being rendered,
+    falling back to the first application frame outside this module.
+    """
+    from rest_framework.serializers import Serializer
+
+    chain = []
+    app_frame = None
+    frame = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        if code.co_name == 'to_representation':
+            owner = frame.f_locals.get('self')
+            field = frame.f_locals.get('field')
+            if isinstance(owner, Serializer) and field is not None:
+                chain.append(f"{type(owner).__name__}.{field.field_name}")
+        elif (
+            app_frame is None
+            and code.co_filename.startswith(_APP_ROOT)
+            and code.co_filename not in _INTERNAL_FILES
+            and 'site-packages' not in code.co_filename
+        ):
+            app_frame = f"{Path(code.co_filename).relative_to(_APP_ROOT)}:{frame.f_lineno} in {code.co_name}"
+        frame = frame.f_back
+
+    if chain:
+        return ' > '.join(reversed(chain))
+    return app_frame or '<unknown>'
+
+
+class QueryInspector:
+    """Query observer (see RequestMetrics.query_observers) collecting repeated SQL shapes."""
+
+    def __init__(self, threshold=None):
+        self.threshold = threshold or config()['THRESHOLD']
+        self.scale_ratio = config()['SCALE_RATIO']
+        self.total = 0
+        self.shapes = {}
+
+    def __call__(self, sql, elapsed):
+        self.total += 1
+        key = fingerprint(sql)
+        shape = self.shapes.get(key)
+        if shape is None:
+            self.shapes[key] = {'count': 1, 'time': elapsed, 'sql': key, 'origin': _origin()}
+        else:
+            shape['count'] += 1
+            shape['time'] += elapsed
+
+    def findings(self, list_size=None):
+        """Repeated shapes, worst first. scales_with_page is set when a shape runs about once per listed row."""
+        results = []
+        for shape in self.shapes.values():
+            if shape['count'] < self.threshold:
+                continue
+            results.append({
+                'count': shape['count'],
+                'time_ms': round(shape['time'] * 1000, 2),
+                'sql': shape['sql'],
+                'origin': shape['origin'],
+                'scales_with_page': bool(
+                    list_size and list_size > 1 and shape['count'] >= self.scale_ratio * list_size
+                ),
+            })
+        return sorted(results, key=lambda item: item['count'], reverse=True)
+
+
+@contextmanager
+def inspect_queries(threshold=None):
+    """
+    Attaches a QueryInspector to the current request metrics (or opens a
+    standalone scope), e.g. in the shell, tests or the scan_nplusone command.
+    """
+    inspector = QueryInspector(threshold)
+    metrics = observability.current_metrics()
+    if metrics is None:
+        with observability.track_request(observability.RequestMetrics()) as metrics:
+            metrics.query_observers.append(inspector)
+            yield inspector
+        return
+    metrics.query_observers.append(inspector)
+    try:
+        yield inspector
+    finally:
+        metrics.query_observers.remove(inspector)
+
+
+def list_size(response):
+    """Number of rows in a DRF list payload (plain list or paginated 'results'), else None."""
+    data = getattr(response, 'data', None)
+    if isinstance(data, dict):
+        data = data.get('results', data.get('data'))
+    return len(data) if isinstance(data, list) else None
+
+
+class QueryInspectorMiddleware:
+    """
+    Runs each request under a QueryInspector when QUERY_INSPECTOR['MODE'] is
+    'report' or 'raise'. Place after RequestLoggingMiddleware.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        cfg = config()
+        if not self.is_inspected(request, cfg):
+            return self.get_response(request)
+
+        with inspect_queries(cfg['THRESHOLD']) as inspector:
+            response = self.get_response(request)
+        return self.report(request, response, inspector, cfg)
+
+    async def __acall__(self, request):
+        cfg = config()
+        if not self.is_inspected(request, cfg):
+            return await self.get_response(request)
+
+        if observability.current_metrics() is None:
+            # inspect_queries() would hook this (event loop) thread's connections
+            async with observability.atrack_request(observability.RequestMetrics()):
+                return await self.__acall__(request)
+        with inspect_queries(cfg['THRESHOLD']) as inspector:
+            response = await self.get_response(request)
+        return self.report(request, response, inspector, cfg)
+
+    @staticmethod
+    def is_inspected(request, cfg):
+        return cfg['MODE'] != 'off' and not any(request.path.startswith(p) for p in cfg['IGNORE_PATHS'])
+
+    def report(self, request, response, inspector, cfg):
+        findings = inspector.findings(list_size(response))
+        if not findings:
+            return response
+
+        route = observability.route_for(request)
+        scaling = [f for f in findings if f['scales_with_page']]
+        for finding in findings:
+            logger.warning(
+                "Repeated query on %s: %sx (%.1fms) from %s%s | %s",
+                route, finding['count'], finding['time_ms'], finding['origin'],
+                ' [scales with page size]' if finding['scales_with_page'] else '',
+                finding['sql'][:300],
+                extra={'query_inspector': {'route': route, **finding}},
+            )
+
+        if scaling and cfg['MODE'] == 'raise':
+            raise NPlusOneError(route, scaling)
+
+        response['X-Query-Inspector'] = (
+            f"queries={inspector.total}; repeated={len(findings)}; scaling={len(scaling)}"
+        )
+        return response
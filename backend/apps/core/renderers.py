@@ -0,0 +1,74 @@
+"""
+orjson-backed JSON renderer / parser (REST_FRAMEWORK defaults).
+
+Output matches DRF's JSONRenderer with its default settings (compact, UTF-8,
+ISO-8601 datetimes with "Z" for UTC, UUIDs as strings, Decimals as numbers,
+U+2028/U+2029 escaped) but is encoded in C: datetimes, UUIDs, dataclasses and
+the serializer ReturnDict / ReturnList containers are handled natively and
+only the remaining types go through DRF's encoder.
+
+orjson is optional: without it, or for the few payloads it rejects (integers
+beyond 64 bits, indented output for the browsable API), both classes fall
+back to the stdlib implementation.
+"""
+import decimal
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # Fast path disabled — DRF's stdlib json is used
+    orjson = None
+
+_drf_encoder = JSONEncoder()
+
+
+def _default(obj):
+    # Serializers coerce decimals to strings already; this covers raw dict payloads
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    return _drf_encoder.default(obj)
+
+
+def dumps(data):
+    """Serializes data to JSON bytes the way FastJSONRenderer does."""
+    if orjson is None:
+        return JSONRenderer().render(data)
+    content = orjson.dumps(data, default=_default, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+    # Keep the output a strict JavaScript subset, as DRF does
+    if b'\xe2\x80\xa8' in content or b'\xe2\x80\xa9' in content:
+        content = content.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return content
+
+
+class FastJSONRenderer(JSONRenderer):
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            return dumps(data)
+        except (orjson.JSONEncodeError, TypeError):
+            return super().render(data, accepted_media_type, renderer_context)
+
+
+class FastJSONParser(JSONParser):
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = (parser_context.get('encoding') or 'utf-8').lower()
+        if orjson is None or not self.strict or encoding not in ('utf-8', 'utf8'):
+            return super().parse(stream, media_type, parser_context)
+        try:
+            # orjson rejects NaN / Infinity, matching STRICT_JSON
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,206 @@
+"""
+Stale-while-revalidate result cache for polled dashboard and stats endpoints.
+
+    stats, freshness = ResultCache.get(
+        'soc.security_stats', tenant_id,
+        sections={'alerts': ['soc.Alert'], 'incidents': ['soc.Incident']},
+        compute=lambda names: {name: ... for name in names},
+    )
+
+A result is split into sections (one per dashboard module). Each section is
+cached per tenant in the Django cache with the time it was computed and the
+ChangeCounter stamps of the models it is derived from. On a read a section is
+
+    - fresh: younger than SOFT_TTL and none of its models changed: served
+    - stale: older, or one of its models changed since: served as is while a
+      background thread recomputes the stale sections
+    - missing: never computed, expired after HARD_TTL or invalidated:
+      computed before answering
+
+Recomputations are single-flight per section: a lock taken with cache.add()
+lets one worker compute it. Concurrent readers serve the stale value or,
+when the section is missing, wait up to WAIT seconds for that worker's
+result instead of running the same queries. ResultCache.invalidate() drops
+sections for changes ChangeCounter does not see.
+
+`freshness` tells clients how old the figures are:
+
+    {"computed_at": "2026-10-18T10:41:07+00:00", "age_seconds": 12.5,
+     "stale": false, "stale_sections": [], "refreshing": false}
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from .conditional import ALL_TENANTS, ChangeCounter
+from .observability import record_cache_access
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ENABLED': True,
+    'SOFT_TTL': 30,        # seconds a section is served without recomputing it
+    'HARD_TTL': 900,       # seconds a stale section may still be served
+    'LOCK_TIMEOUT': 60,    # seconds before the lock of a crashed recomputation expires
+    'WAIT': 5,             # seconds a reader waits for another worker computing a missing section
+    'POLL_INTERVAL': 0.05,
+    'BACKGROUND': True,    # False: stale sections are recomputed inline (tests, scripts)
+}
+
+
+def config():
+    return {**DEFAULTS, **getattr(settings, 'RESULT_CACHE', {})}
+
+
+class ResultCache:
+
+    @staticmethod
+    def key(name, tenant_id, section):
+        return f'results:{name}:{tenant_id if tenant_id is not None else ALL_TENANTS}:{section}'
+
+    @classmethod
+    def get(cls, name, tenant_id, sections, compute):
+        """
+        ({section: value}, freshness) for the tenant (None: across tenants).
+        sections maps each section to the model labels it is derived from;
+        compute(section names) returns {section: value} for those sections.
+        """
+        cfg = config()
+        if not cfg['ENABLED']:
+            return compute(list(sections)), cls.freshness([], [], False)
+
+        labels = sorted({label for deps in sections.values() for label in deps})
+        versions = ChangeCounter.versions(labels, tenant_id) if labels else {}
+        keys = {cls.key(name, tenant_id, section): section for section in sections}
+        entries = {keys[key]: entry for key, entry in cache.get_many(list(keys)).items()}
+
+        now = time.time()
+        missing, stale = [], []
+        for section, deps in sections.items():
+            entry = entries.get(section)
+            if entry is None:
+                missing.append(section)
+            elif now - entry['computed_at'] > cfg['SOFT_TTL'] or any(
+                entry['versions'].get(label) != versions[label] for label in deps
+            ):
+                stale.append(section)
+        record_cache_access(not missing and not stale)
+
+        refreshing = False
+        if missing or stale and not cfg['BACKGROUND']:
+            # Paying for a computation anyway: bring the stale sections up to date with it
+            computed = cls._compute_now(name, tenant_id, sections, missing, stale, compute, versions)
+            entries.update(computed)
+            # Stale sections locked by another worker are served as they are
+            stale = [section for section in stale if section not in computed]
+            refreshing = bool(stale)
+        elif stale:
+            refreshing = cls._refresh_in_background(name, tenant_id, sections, stale, compute, versions)
+        values = {section: entries[section]['value'] for section in sections if section in entries}
+        return values, cls.freshness([entries[s] for s in values], stale, refreshing)
+
+    @classmethod
+    def invalidate(cls, name, sections, tenant_id=None):
+        """Drops sections for the tenant and across tenants; the next read recomputes them."""
+        cache.delete_many([
+            cls.key(name, scope, section) for scope in {tenant_id, None} for section in sections
+        ])
+
+    @staticmethod
+    def freshness(entries, stale, refreshing):
+        now = time.time()
+        oldest = min((entry['computed_at'] for entry in entries), default=now)
+        return {
+            'computed_at': datetime.fromtimestamp(oldest, tz=dt_timezone.utc).isoformat(),
+            'age_seconds': round(now - oldest, 1),
+            'stale': bool(stale),
+            'stale_sections': sorted(stale),
+            'refreshing': refreshing,
+        }
+
+    # ── Recomputation ─────────────────────────────────────────────────────
+
+    @classmethod
+    def _lock(cls, name, tenant_id, section):
+        return cls.key(name, tenant_id, section) + ':lock'
+
+    @classmethod
+    def _acquire(cls, name, tenant_id, wanted):
+        timeout = config()['LOCK_TIMEOUT']
+        return [section for section in wanted if cache.add(cls._lock(name, tenant_id, section), 1, timeout)]
+
+    @classmethod
+    def _release(cls, name, tenant_id, sections):
+        cache.delete_many([cls._lock(name, tenant_id, section) for section in sections])
+
+    @classmethod
+    def _store(cls, name, tenant_id, sections, wanted, compute, versions):
+        values = compute(wanted)
+        now = time.time()
+        entries = {
+            section: {
+                'computed_at': now,
+                'versions': {label: versions[label] for label in sections[section]},
+                'value': values[section],
+            }
+            for section in wanted if section in values
+        }
+        cache.set_many(
+            {cls.key(name, tenant_id, section): entry for section, entry in entries.items()},
+            timeout=config()['HARD_TTL'],
+        )
+        return entries
+
+    @classmethod
+    def _compute_now(cls, name, tenant_id, sections, missing, stale, compute, versions):
+        """
+        Computes the missing and stale sections this worker can lock, then
+        waits for the missing ones another worker is computing.
+        """
+        cfg = config()
+        locked = cls._acquire(name, tenant_id, missing + stale)
+        entries = {}
+        if locked:
+            try:
+                entries.update(cls._store(name, tenant_id, sections, locked, compute, versions))
+            finally:
+                cls._release(name, tenant_id, locked)
+        others = [section for section in missing if section not in locked]
+        deadline = time.monotonic() + cfg['WAIT']
+        while others and time.monotonic() < deadline:
+            time.sleep(cfg['POLL_INTERVAL'])
+            keys = {cls.key(name, tenant_id, section): section for section in others}
+            for key, entry in cache.get_many(list(keys)).items():
+                entries[keys[key]] = entry
+            others = [section for section in others if section not in entries]
+        if others:
+            # The other worker is too slow (or died holding the lock): compute without it
+            entries.update(cls._store(name, tenant_id, sections, others, compute, versions))
+        return entries
+
+    @classmethod
+    def _refresh_in_background(cls, name, tenant_id, sections, stale, compute, versions):
+        locked = cls._acquire(name, tenant_id, stale)
+        if not locked:
+            return True  # another worker is already refreshing them
+        threading.Thread(
+            target=cls._refresh, args=(name, tenant_id, sections, locked, compute, versions),
+            name=f'result-cache-{name}', daemon=True,
+        ).start()
+        return True
+
+    @classmethod
+    def _refresh(cls, name, tenant_id, sections, stale, compute, versions):
+        try:
+            cls._store(name, tenant_id, sections, stale, compute, versions)
+        except Exception:
+            logger.exception('Refreshing %s for tenant %s failed', name, tenant_id)
+        finally:
+            cls._release(name, tenant_id, stale)
+            # The thread's own database connections; the request's are untouched
+            connections.close_all()
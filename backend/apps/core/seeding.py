@@ -0,0 +1,687 @@
+"""
+Production-shaped synthetic data for performance work (`manage.py seed_scale`).
+
+TenantSeeder fills one tenant with rows across CRM, SOC, support, store, ERP,
+SCM, ITAM and the audit trail. Volumes are VOLUMES x scale: at --scale 10 a
+tenant holds 2M network events, 500k monitor samples, 200k tickets and 100k
+orders / invoices. Values follow production shape rather than uniform noise:
+
+    - timestamps skew towards recent days and business hours; weekends are quiet
+    - statuses / severities follow fixed weights (most alerts low, few critical)
+      and age (old tickets are closed, old invoices paid)
+    - activity is long-tailed: a few clients, users and endpoints own most rows
+
+Rows are inserted with bulk_create in batches or, on PostgreSQL, with COPY.
+Both skip save() and its signals, so no outbox messages, notifications or
+audit entries are produced; ChangeCounter stamps are bumped and KPI counters
+(apps.core.kpis) invalidated once per model.
+"""
+import io
+import json
+import random
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+from itertools import accumulate
+
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+from .conditional import ChangeCounter
+from .kpis import KPICounters
+
+# Rows per tenant at --scale 1, in insertion order (parents before children)
+VOLUMES = {
+    'users.User': 25,
+    'crm.Client': 200,
+    'crm.Contact': 500,
+    'crm.Lead': 400,
+    'crm.Deal': 300,
+    'soc.Workspace': 4,
+    'soc.ManagedEndpoint': 250,
+    'soc.SystemMonitor': 50_000,
+    'soc.NetworkEvent': 200_000,
+    'soc.Alert': 2_000,
+    'soc.Incident': 150,
+    'soc.Incident_alerts': 400,
+    'soc.LogAnalysis': 10_000,
+    'support.Ticket': 20_000,
+    'support.TicketMessage': 50_000,
+    'store.Order': 10_000,
+    'erp.Invoice': 10_000,
+    'erp.Payment': 6_000,
+    'scm.Vendor': 20,
+    'scm.InventoryItem': 300,
+    'itam.Asset': 400,
+    'core.AuditLog': 50_000,
+}
+
+# Lookup from each model to its tenant, for models without a tenant column
+TENANT_PATHS = {
+    'soc.Incident_alerts': 'incident__tenant',
+    'support.TicketMessage': 'ticket__tenant',
+}
+
+
+def volume(label, scale):
+    return max(1, round(VOLUMES[label] * scale))
+
+
+# ── Distributions ─────────────────────────────────────────────────────────
+
+class Weighted:
+    """Picks a key of `table` with probability proportional to its value."""
+
+    def __init__(self, table):
+        self.values = list(table)
+        self.cum_weights = list(accumulate(table.values()))
+
+    def __call__(self, rng):
+        return rng.choices(self.values, cum_weights=self.cum_weights)[0]
+
+
+def skewed(rng, items, power=2.5):
+    """Long-tailed pick: the first items of the list are chosen far more often."""
+    return items[int(len(items) * rng.random() ** power)]
+
+
+class Timeline:
+    """Random timestamps within the last `days` days, shaped like production traffic."""
+    # Relative activity per UTC hour: quiet nights, busy office hours
+    HOURLY = (1, 1, 1, 1, 1, 2, 3, 6, 10, 12, 12, 11, 9, 11, 12, 11, 10, 8, 5, 4, 3, 2, 2, 1)
+
+    def __init__(self, rng, days, now):
+        self.rng = rng
+        self.days = days
+        self.now = now
+        self._hour = Weighted(dict(enumerate(self.HOURLY)))
+
+    def sample(self):
+        rng = self.rng
+        while True:
+            # betavariate(1, 3): density falls with age, so recent days are the busiest
+            moment = self.now - timedelta(days=int(self.days * rng.betavariate(1, 3)))
+            if moment.weekday() < 5 or rng.random() < 0.35:
+                break
+        moment = moment.replace(
+            hour=self._hour(rng), minute=rng.randrange(60),
+            second=rng.randrange(60), microsecond=rng.randrange(1_000_000),
+        )
+        return moment if moment <= self.now else moment - timedelta(days=1)
+
+    def after(self, start, max_hours):
+        """A moment up to max_hours after start, never in the future."""
+        return min(start + timedelta(seconds=self.rng.uniform(60, max_hours * 3600)), self.now)
+
+    def age_days(self, moment):
+        return (self.now - moment).days
+
+
+def money(rng, median, sigma=0.8):
+    """Log-normal amount: most values near the median, a long tail of large ones."""
+    return Decimal(str(round(rng.lognormvariate(0, sigma) * median, 2)))
+
+
+CLIENT_STATUS = Weighted({'active': 45, 'managed_service': 15, 'subscriber': 12, 'prospect': 20, 'suspended': 4, 'closed': 4})
+CLIENT_TYPE = Weighted({'business': 85, 'individual': 15})
+LEAD_STATUS = Weighted({'new': 30, 'contacted': 25, 'qualified': 20, 'lost': 15, 'converted': 10})
+DEAL_STAGE = Weighted({'prospecting': 30, 'proposal': 20, 'negotiation': 15, 'won': 20, 'lost': 15})
+ENDPOINT_TYPE = Weighted({'workstation': 60, 'server': 18, 'mobile': 8, 'firewall': 3, 'router': 3, 'switch': 4, 'iot': 3, 'other': 1})
+ENDPOINT_STATUS = Weighted({'online': 82, 'offline': 10, 'at_risk': 5, 'maintenance': 2, 'isolated': 1})
+NETWORK_CATEGORY = Weighted({
+    'normal': 80, 'anomalous_traffic': 8, 'port_scan': 5, 'intrusion_attempt': 4,
+    'ddos': 1, 'lateral_movement': 1, 'data_exfiltration': 1,
+})
+PROTOCOL = Weighted({'TCP': 80, 'UDP': 18, 'ICMP': 2})
+DESTINATION_PORT = Weighted({443: 45, 80: 15, 53: 12, 22: 6, 3389: 4, 445: 4, 25: 3, 8080: 3, 3306: 2, 5432: 2, 1433: 2, 23: 2})
+ALERT_SEVERITY = Weighted({'low': 55, 'medium': 30, 'high': 12, 'critical': 3})
+ALERT_SOURCE = Weighted({'Firewall': 30, 'EDR': 25, 'IDS': 20, 'SIEM': 15, 'Email Gateway': 10})
+INCIDENT_STATUS = Weighted({'closed': 60, 'mitigated': 20, 'investigating': 12, 'open': 8})
+TICKET_PRIORITY = Weighted({'low': 35, 'medium': 40, 'high': 20, 'critical': 5})
+OPEN_TICKET_STATUS = Weighted({'open': 50, 'in_progress': 35, 'resolved': 15})
+OLD_TICKET_STATUS = Weighted({'closed': 70, 'resolved': 25, 'in_progress': 3, 'open': 2})
+ORDER_STATUS = Weighted({'completed': 70, 'processing': 7, 'pending': 8, 'cancelled': 10, 'refunded': 5})
+OLD_INVOICE_STATUS = Weighted({'paid': 78, 'overdue': 14, 'cancelled': 8})
+NEW_INVOICE_STATUS = Weighted({'sent': 60, 'draft': 25, 'paid': 15})
+PAYMENT_METHOD = Weighted({'bank_transfer': 45, 'credit_card': 40, 'paypal': 12, 'cash': 3})
+ASSET_TYPE = Weighted({'laptop': 40, 'desktop': 15, 'server': 10, 'network': 8, 'mobile': 12, 'printer': 4, 'software': 6, 'cloud': 4, 'other': 1})
+ASSET_STATUS = Weighted({'active': 75, 'spare': 10, 'maintenance': 6, 'retired': 8, 'lost': 1})
+AUDIT_ACTION = Weighted({
+    'USER_LOGIN': 35, 'USER_LOGOUT': 20, 'SUPPORT_TICKET_CREATED': 10, 'SUPPORT_TICKET_STATUS_CHANGED': 12,
+    'SUPPORT_TICKET_RESOLVED': 5, 'STORE_ORDER_CREATED': 6, 'STORE_ORDER_STATUS_UPDATED': 5,
+    'USER_PASSWORD_RESET': 1, 'STORE_PRODUCT_CREATED': 1, 'UPDATE_PAGE': 5,
+})
+
+FIRST_NAMES = ('James', 'Mary', 'Ahmed', 'Sofia', 'Wei', 'Olga', 'Carlos', 'Aisha', 'Liam', 'Yuki', 'Noah', 'Fatima', 'Lucas', 'Emma', 'Ravi')
+LAST_NAMES = ('Smith', 'Garcia', 'Chen', 'Kowalski', 'Haddad', 'Okafor', 'Mueller', 'Rossi', 'Tanaka', 'Dubois', 'Novak', 'Silva', 'Khan', 'Berg')
+COMPANY_WORDS = ('Apex', 'Blue', 'Cedar', 'Delta', 'Ember', 'Falcon', 'Granite', 'Harbor', 'Iron', 'Juniper', 'Keystone', 'Lumen', 'Nova', 'Orbit', 'Summit')
+COMPANY_KINDS = ('Logistics', 'Health', 'Legal', 'Dental', 'Capital', 'Foods', 'Labs', 'Energy', 'Retail', 'Builders', 'Media', 'Systems')
+COMPANY_SUFFIXES = ('LLC', 'Inc', 'Ltd', 'Group', 'SARL', 'GmbH')
+INDUSTRIES = ('Healthcare', 'Finance', 'Legal', 'Retail', 'Manufacturing', 'Education', 'Logistics', 'Technology', 'Hospitality')
+OS_BY_TYPE = {
+    'workstation': ('Windows 11 Enterprise 23H2', 'Windows 10 Pro 22H2', 'macOS 14 Sonoma', 'Ubuntu 22.04 LTS'),
+    'server': ('Windows Server 2022', 'Ubuntu 22.04 LTS', 'RHEL 9.3', 'Debian 12'),
+    'mobile': ('iOS 17', 'Android 14'),
+}
+TICKET_SUBJECTS = (
+    'Cannot connect to VPN', 'Outlook keeps asking for password', 'Printer offline on 2nd floor',
+    'New starter laptop setup', 'Shared drive permissions', 'MFA token lost', 'Slow Wi-Fi in meeting room',
+    'Phishing email reported', 'License renewal request', 'Backup job failed overnight',
+)
+ALERT_TITLES = (
+    'Multiple failed logins', 'Malware signature detected', 'Outbound connection to known C2',
+    'Privilege escalation attempt', 'Suspicious PowerShell execution', 'Impossible travel sign-in',
+    'Port scan from external host', 'Unusual data transfer volume',
+)
+LOG_SOURCES = ('fortigate', 'windows-security', 'sshd', 'nginx', 'office365', 'crowdstrike')
+
+
+# ── Writing ───────────────────────────────────────────────────────────────
+
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def copy_value(field, value):
+    """A value in PostgreSQL COPY text format."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if field.get_internal_type() == 'JSONField':
+        value = json.dumps(value, cls=field.encoder)
+    elif hasattr(value, 'isoformat'):
+        value = value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+class BulkWriter:
+    """
+    Inserts unsaved instances in batches: bulk_create, or COPY FROM STDIN on
+    PostgreSQL (several times faster for wide, multi-million-row tables).
+    COPY leaves auto-increment primary keys unset on the instances.
+    """
+
+    def __init__(self, batch_size=5000, use_copy=None):
+        self.batch_size = batch_size
+        self.use_copy = connection.vendor == 'postgresql' if use_copy is None else use_copy
+
+    def write(self, model, objs):
+        written = 0
+        batch = []
+        for obj in objs:
+            batch.append(obj)
+            if len(batch) >= self.batch_size:
+                written += self.flush(model, batch)
+                batch = []
+        if batch:
+            written += self.flush(model, batch)
+        return written
+
+    def flush(self, model, batch):
+        if self.use_copy:
+            self.copy(model, batch)
+        else:
+            model._base_manager.bulk_create(batch, batch_size=self.batch_size)
+        return len(batch)
+
+    @staticmethod
+    def copy(model, batch):
+        fields = [f for f in model._meta.concrete_fields if f is not model._meta.auto_field]
+        buffer = io.StringIO()
+        for obj in batch:
+            buffer.write('\t'.join(copy_value(f, getattr(obj, f.attname)) for f in fields))
+            buffer.write('\n')
+        quote = connection.ops.quote_name
+        sql = f"COPY {quote(model._meta.db_table)} ({', '.join(quote(f.column) for f in fields)}) FROM STDIN"
+        with connection.cursor() as cursor:
+            raw = cursor.cursor
+            if hasattr(raw, 'copy'):  # psycopg 3
+                with raw.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+            else:  # psycopg2
+                buffer.seek(0)
+                raw.copy_expert(sql, buffer)
+
+
+@contextmanager
+def explicit_timestamps(models):
+    """Lets bulk inserts keep generated created_at / updated_at (auto_now* would overwrite them)."""
+    patched = []
+    for model in models:
+        for field in model._meta.concrete_fields:
+            if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+                patched.append((field, field.auto_now, field.auto_now_add))
+                field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in patched:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def tenant_rows(label, tenant):
+    model = apps.get_model(label)
+    return model._base_manager.filter(**{TENANT_PATHS.get(label, 'tenant'): tenant})
+
+
+def is_seeded(tenant):
+    return any(tenant_rows(label, tenant).exists() for label in VOLUMES)
+
+
+def purge(tenant):
+    """Deletes every row seed_scale wrote for the tenant, children first."""
+    for label in reversed(VOLUMES):
+        rows = tenant_rows(label, tenant)
+        # Raw DELETE: the collector would load (and signal) millions of rows one by one
+        rows._raw_delete(rows.db)
+        ChangeCounter.bump(label, tenant.pk)
+        KPICounters.invalidate(label, tenant.pk)
+
+
+# ── Seeding ───────────────────────────────────────────────────────────────
+
+class TenantSeeder:
+    """
+    Generates VOLUMES x scale rows for one tenant. Each model has a
+    `seed_<model_name>(count)` generator yielding unsaved instances; ids of
+    parent rows are kept in `self.ids` for the children that reference them.
+    """
+
+    def __init__(self, tenant, scale=1.0, days=365, seed=0, writer=None):
+        self.tenant = tenant
+        self.scale = scale
+        self.rng = random.Random(f'{seed}:{tenant.domain}')
+        self.now = timezone.now()
+        self.timeline = Timeline(self.rng, days, self.now)
+        self.writer = writer or BulkWriter()
+        self.slug = tenant.domain.split('.')[0]
+        self.ids = defaultdict(list)
+
+    def run(self, on_progress=None):
+        """Seeds every model in VOLUMES order. Returns {label: (rows, seconds) or error message}."""
+        models = [apps.get_model(label) for label in VOLUMES]
+        report = {}
+        with explicit_timestamps(models):
+            for label, model in zip(VOLUMES, models):
+                start = time.perf_counter()
+                rows = getattr(self, f'seed_{model._meta.model_name}')(volume(label, self.scale))
+                try:
+                    with transaction.atomic():
+                        written = self.writer.write(model, rows)
+                except DatabaseError as exc:  # Modules whose tables are missing or outdated in this database
+                    self.ids.pop(label, None)
+                    report[label] = str(exc).splitlines()[0]
+                else:
+                    ChangeCounter.bump(model, self.tenant.pk)
+                    KPICounters.invalidate(model, self.tenant.pk)
+                    report[label] = (written, time.perf_counter() - start)
+                if on_progress:
+                    on_progress(label, report[label])
+        return report
+
+    def stamped(self, model, /, created_at=None, **values):
+        created_at = created_at or self.timeline.sample()
+        return model(
+            tenant_id=self.tenant.pk, created_at=created_at,
+            updated_at=self.timeline.after(created_at, 72), **values,
+        )
+
+    def person(self):
+        return self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+
+    def company(self):
+        rng = self.rng
+        return f'{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_KINDS)} {rng.choice(COMPANY_SUFFIXES)}'
+
+    def internal_ip(self):
+        rng = self.rng
+        return f'10.{rng.randrange(4)}.{rng.randrange(256)}.{rng.randrange(1, 255)}'
+
+    def external_ip(self):
+        rng = self.rng
+        return f'{rng.choice((45, 62, 91, 103, 185, 193))}.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}'
+
+    # ── CRM ──
+
+    def seed_user(self, count):
+        User = apps.get_model('users.User')
+        password = make_password(None)
+        for i in range(count):
+            first, last = self.person()
+            email = f'{first.lower()}.{last.lower()}.{i}@{self.tenant.domain}'
+            user = User(
+                id=uuid.uuid4(), username=email, email=email, first_name=first, last_name=last,
+                password=password, tenant_id=self.tenant.pk, is_staff=i % 5 == 0,
+                is_verified=True, date_joined=self.timeline.sample(),
+            )
+            self.ids['users.User'].append(user.pk)
+            yield user
+
+    def seed_client(self, count):
+        Client = apps.get_model('crm.Client')
+        users = self.ids['users.User']
+        for i in range(count):
+            name = self.company()
+            client = self.stamped(
+                Client, name=name, client_type=CLIENT_TYPE(self.rng), status=CLIENT_STATUS(self.rng),
+                industry=self.rng.choice(INDUSTRIES), website=f'https://{self.slug}-client{i}.example.com',
+                email=f'info@{self.slug}-client{i}.example.com', phone=f'+1-555-{self.rng.randrange(10**7):07d}',
+                assigned_to_id=skewed(self.rng, users) if users else None,
+            )
+            self.ids['crm.Client'].append(client.pk)
+            yield client
+
+    def seed_contact(self, count):
+        Contact = apps.get_model('crm.Contact')
+        clients = self.ids['crm.Client']
+        if not clients:
+            return
+        for i in range(count):
+            first, last = self.person()
+            contact = self.stamped(
+                Contact, client_id=skewed(self.rng, clients, 1.5), first_name=first, last_name=last,
+                email=f'{first.lower()}.{last.lower()}{i}@example.com', job_title=self.rng.choice(('CEO', 'CTO', 'Office Manager', 'IT Lead', 'CFO')),
+                role=self.rng.choice(('Decision Maker', 'Customer', 'Billing')), is_primary=self.rng.random() < 0.3,
+            )
+            self.ids['crm.Contact'].append(contact.pk)
+            yield contact
+
+    def seed_lead(self, count):
+        Lead = apps.get_model('crm.Lead')
+        contacts, users = self.ids['crm.Contact'], self.ids['users.User']
+        for _ in range(count):
+            yield self.stamped(
+                Lead, title=f'{self.rng.choice(("Managed SOC", "Office 365 migration", "Firewall refresh", "Helpdesk contract"))} for {self.company()}',
+                contact_id=self.rng.choice(contacts) if contacts and self.rng.random() < 0.8 else None,
+                status=LEAD_STATUS(self.rng), value=money(self.rng, 4000),
+                assigned_to_id=skewed(self.rng, users) if users else None,
+            )
+
+    def seed_deal(self, count):
+        Deal = apps.get_model('crm.Deal')
+        clients, users = self.ids['crm.Client'], self.ids['users.User']
+        if not clients:
+            return
+        for _ in range(count):
+            created_at = self.timeline.sample()
+            yield self.stamped(
+                Deal, created_at=created_at, title=f'{self.rng.choice(("Renewal", "Upsell", "New project", "Hardware refresh"))} {created_at:%Y-%m}',
+                client_id=skewed(self.rng, clients), amount=money(self.rng, 12000, 1.0), stage=DEAL_STAGE(self.rng),
+                expected_close_date=(created_at + timedelta(days=self.rng.randrange(14, 120))).date(),
+                assigned_to_id=skewed(self.rng, users) if users else None,
+            )
+
+    # ── SOC ──
+
+    def seed_workspace(self, count):
+        Workspace = apps.get_model('soc.Workspace')
+        names = ('HQ Network', 'AWS Production', 'Remote Offices', 'Azure Tenant', 'Branch Office', 'Data Center')
+        for i in range(count):
+            name = names[i] if i < len(names) else f'Site {i + 1}'
+            workspace = self.stamped(Workspace, name=name, description=f'{name} monitored environment')
+            self.ids['soc.Workspace'].append(workspace.pk)
+            yield workspace
+
+    def seed_managedendpoint(self, count):
+        ManagedEndpoint = apps.get_model('soc.ManagedEndpoint')
+        workspaces = self.ids['soc.Workspace']
+        rng = self.rng
+        for i in range(count):
+            device_type = ENDPOINT_TYPE(rng)
+            endpoint = self.stamped(
+                ManagedEndpoint, workspace_id=skewed(rng, workspaces, 1.5) if workspaces else None,
+                hostname=f'{self.slug}-{device_type[:3]}-{i:05d}.corp.local', ip_address=self.internal_ip(),
+                mac_address=':'.join(f'{rng.randrange(256):02x}' for _ in range(6)), device_type=device_type,
+                os=rng.choice(OS_BY_TYPE.get(device_type, ('',))), status=ENDPOINT_STATUS(rng),
+                agent_version=rng.choice(('4.10.2', '4.11.0', '4.12.0')),
+                last_seen=self.now - timedelta(minutes=int(rng.expovariate(1 / 30))),
+                risk_score=min(100, int(rng.expovariate(1 / 18))),
+            )
+            self.ids['soc.ManagedEndpoint'].append(endpoint.pk)
+            yield endpoint
+
+    def seed_systemmonitor(self, count):
+        """Periodic samples per endpoint, evenly spaced back from now with jitter."""
+        SystemMonitor = apps.get_model('soc.SystemMonitor')
+        endpoints = self.ids['soc.ManagedEndpoint']
+        if not endpoints:
+            return
+        rng = self.rng
+        per_endpoint = max(1, count // len(endpoints))
+        interval = timedelta(days=self.timeline.days) / per_endpoint
+        produced = 0
+        for endpoint_id in endpoints:
+            baseline = rng.uniform(10, 55)
+            for n in range(per_endpoint):
+                if produced >= count:
+                    return
+                created_at = self.now - interval * n - timedelta(seconds=rng.uniform(0, 60))
+                cpu = min(100.0, max(0.0, rng.gauss(baseline, 12)))
+                produced += 1
+                yield SystemMonitor(
+                    tenant_id=self.tenant.pk, endpoint_id=endpoint_id, created_at=created_at, updated_at=created_at,
+                    cpu_usage=round(cpu, 1), ram_usage=round(min(100.0, max(5.0, rng.gauss(baseline + 15, 10))), 1),
+                    disk_usage=round(min(100.0, baseline + n * 20 / per_endpoint), 1),
+                    uptime_seconds=int(rng.expovariate(1 / 864000)), is_anomalous=cpu > 95,
+                )
+
+    def seed_networkevent(self, count):
+        NetworkEvent = apps.get_model('soc.NetworkEvent')
+        workspaces = self.ids['soc.Workspace']
+        rng = self.rng
+        attackers = [self.external_ip() for _ in range(50)]
+        for _ in range(count):
+            category = NETWORK_CATEGORY(rng)
+            hostile = category != 'normal'
+            created_at = self.timeline.sample()
+            yield NetworkEvent(
+                tenant_id=self.tenant.pk, created_at=created_at, updated_at=created_at,
+                workspace_id=skewed(rng, workspaces, 1.5) if workspaces else None,
+                source_ip=skewed(rng, attackers) if hostile else self.internal_ip(),
+                destination_ip=self.internal_ip() if hostile else self.external_ip(),
+                source_port=rng.randrange(1024, 65535), destination_port=DESTINATION_PORT(rng),
+                protocol=PROTOCOL(rng), category=category, is_blocked=hostile and rng.random() < 0.6,
+                details={'bytes': int(rng.lognormvariate(8, 2)), 'packets': int(rng.lognormvariate(3, 1.5))},
+            )
+
+    def seed_alert(self, count):
+        Alert = apps.get_model('soc.Alert')
+        rng = self.rng
+        for _ in range(count):
+            created_at = self.timeline.sample()
+            title = rng.choice(ALERT_TITLES)
+            source = ALERT_SOURCE(rng)
+            # Triage keeps up: almost everything older than two days is resolved
+            resolved = rng.random() < (0.95 if self.timeline.age_days(created_at) > 2 else 0.4)
+            alert = self.stamped(
+                Alert, created_at=created_at, title=title, severity=ALERT_SEVERITY(rng), source=source,
+                description=f'{title} reported by {source} for host {self.internal_ip()}.', is_resolved=resolved,
+            )
+            self.ids['soc.Alert'].append(alert.pk)
+            yield alert
+
+    def seed_incident(self, count):
+        Incident = apps.get_model('soc.Incident')
+        users = self.ids['users.User']
+        for _ in range(count):
+            title = f'{self.rng.choice(ALERT_TITLES)} investigation'
+            incident = self.stamped(
+                Incident, title=title, description=f'{title}: scope, containment and follow-up.',
+                status=INCIDENT_STATUS(self.rng), assigned_to_id=self.rng.choice(users) if users else None,
+            )
+            self.ids['soc.Incident'].append(incident.pk)
+            yield incident
+
+    def seed_incident_alerts(self, count):
+        Through = apps.get_model('soc.Incident_alerts')
+        incidents, alerts = self.ids['soc.Incident'], self.ids['soc.Alert']
+        if not incidents or not alerts:
+            return
+        seen = set()
+        for i in range(count):
+            pair = (incidents[i % len(incidents)], self.rng.choice(alerts))
+            if pair not in seen:
+                seen.add(pair)
+                yield Through(incident_id=pair[0], alert_id=pair[1])
+
+    def seed_loganalysis(self, count):
+        LogAnalysis = apps.get_model('soc.LogAnalysis')
+        rng = self.rng
+        for _ in range(count):
+            created_at = self.timeline.sample()
+            source = rng.choice(LOG_SOURCES)
+            ip = self.external_ip()
+            yield LogAnalysis(
+                tenant_id=self.tenant.pk, created_at=created_at, updated_at=created_at, source_system=source,
+                raw_log=f'{created_at:%b %d %H:%M:%S} {source}[{rng.randrange(100, 9999)}]: connection from {ip} port {rng.randrange(1024, 65535)}',
+                parsed_data={'src_ip': ip, 'program': source}, flagged_anomalous=rng.random() < 0.03,
+            )
+
+    # ── Support ──
+
+    def seed_ticket(self, count):
+        Ticket = apps.get_model('support.Ticket')
+        users = self.ids['users.User']
+        agents = users[::5]  # the staff users
+        sla_hours = {'critical': 4, 'high': 24, 'medium': 72, 'low': 168}
+        rng = self.rng
+        for _ in range(count):
+            created_at = self.timeline.sample()
+            priority = TICKET_PRIORITY(rng)
+            status = (OLD_TICKET_STATUS if self.timeline.age_days(created_at) > 14 else OPEN_TICKET_STATUS)(rng)
+            subject = rng.choice(TICKET_SUBJECTS)
+            ticket = self.stamped(
+                Ticket, created_at=created_at, title=subject, description=f'{subject}. Reported via portal.',
+                status=status, priority=priority, due_date=created_at + timedelta(hours=sla_hours[priority]),
+                customer_id=skewed(rng, users) if users else None,
+                assigned_to_id=rng.choice(agents) if agents and rng.random() < 0.85 else None,
+            )
+            self.ids['support.Ticket'].append((ticket.pk, created_at))
+            yield ticket
+
+    def seed_ticketmessage(self, count):
+        TicketMessage = apps.get_model('support.TicketMessage')
+        tickets, users = self.ids['support.Ticket'], self.ids['users.User']
+        if not tickets:
+            return
+        for _ in range(count):
+            ticket_id, opened = skewed(self.rng, tickets, 1.5)
+            created_at = self.timeline.after(opened, 96)
+            yield TicketMessage(
+                ticket_id=ticket_id, sender_id=self.rng.choice(users) if users else None,
+                body=self.rng.choice(('Any update on this?', 'Restarted the service, please retry.', 'Escalated to tier 2.', 'Confirmed fixed, thanks!')),
+                created_at=created_at, updated_at=created_at,
+            )
+
+    # ── Store / ERP ──
+
+    def seed_order(self, count):
+        Order = apps.get_model('store.Order')
+        Product = apps.get_model('store.Product')
+        products = list(Product._base_manager.values_list('id', 'price')[:200])
+        users = self.ids['users.User']
+        rng = self.rng
+        for _ in range(count):
+            status = ORDER_STATUS(rng)
+            product_id, price = skewed(rng, products, 2) if products else (None, None)
+            created_at = self.timeline.sample()
+            yield Order(
+                tenant_id=self.tenant.pk, user_id=skewed(rng, users) if users else None, product_id=product_id,
+                status=status, payment_status='paid' if status in ('completed', 'processing') else rng.choice(('pending', 'failed')),
+                fulfillment_status='fulfilled' if status == 'completed' else 'unfulfilled',
+                total_amount=price * rng.choice((1, 1, 1, 2, 5)) if price else money(rng, 150),
+                created_at=created_at, updated_at=self.timeline.after(created_at, 48),
+            )
+
+    def seed_invoice(self, count):
+        Invoice = apps.get_model('erp.Invoice')
+        clients = self.ids['crm.Client']
+        if not clients:
+            return
+        for i in range(count):
+            created_at = self.timeline.sample()
+            status = (OLD_INVOICE_STATUS if self.timeline.age_days(created_at) > 30 else NEW_INVOICE_STATUS)(self.rng)
+            invoice = self.stamped(
+                Invoice, created_at=created_at, invoice_number=f'INV-{i + 1:07d}', client_id=skewed(self.rng, clients),
+                amount=money(self.rng, 900), issue_date=created_at.date(),
+                due_date=(created_at + timedelta(days=30)).date(), status=status,
+            )
+            if status == 'paid':
+                self.ids['erp.Invoice'].append((invoice.pk, invoice.amount, created_at))
+            yield invoice
+
+    def seed_payment(self, count):
+        Payment = apps.get_model('erp.Payment')
+        paid = self.ids['erp.Invoice']
+        if not paid:
+            return
+        for i in range(count):
+            # Every paid invoice gets its payment; the rest are second instalments
+            invoice_id, amount, issued_at = paid[i] if i < len(paid) else self.rng.choice(paid)
+            created_at = self.timeline.after(issued_at, 24 * 30)
+            yield self.stamped(
+                Payment, created_at=created_at, invoice_id=invoice_id, amount=amount, payment_date=created_at.date(),
+                payment_method=PAYMENT_METHOD(self.rng), reference=f'PAY-{i + 1:07d}',
+            )
+
+    # ── SCM / ITAM ──
+
+    def seed_vendor(self, count):
+        Vendor = apps.get_model('scm.Vendor')
+        for _ in range(count):
+            first, last = self.person()
+            vendor = self.stamped(
+                Vendor, name=self.company(), contact_name=f'{first} {last}',
+                lead_time_days=self.rng.choice((3, 5, 7, 14, 30)), payment_terms=self.rng.choice(('Net 30', 'Net 45', 'Prepaid')),
+            )
+            self.ids['scm.Vendor'].append(vendor.pk)
+            yield vendor
+
+    def seed_inventoryitem(self, count):
+        InventoryItem = apps.get_model('scm.InventoryItem')
+        vendors = self.ids['scm.Vendor']
+        rng = self.rng
+        for i in range(count):
+            yield self.stamped(
+                InventoryItem, product_name=f'{rng.choice(("Dell", "HP", "Lenovo", "Cisco", "Ubiquiti"))} {rng.choice(("Laptop", "Dock", "Switch", "Monitor", "AP"))} {i}',
+                sku=f'SKU-{i + 1:06d}', quantity_on_hand=int(rng.expovariate(1 / 25)), quantity_reserved=rng.randrange(5),
+                reorder_level=rng.choice((2, 5, 10)), unit_cost=money(rng, 250),
+                location=f'WH-{rng.randrange(1, 4)}/{rng.choice("ABCDEF")}{rng.randrange(1, 20)}',
+                vendor_id=skewed(rng, vendors) if vendors else None,
+            )
+
+    def seed_asset(self, count):
+        Asset = apps.get_model('itam.Asset')
+        clients, users = self.ids['crm.Client'], self.ids['users.User']
+        rng = self.rng
+        for i in range(count):
+            purchased = self.timeline.sample()
+            asset_type = ASSET_TYPE(rng)
+            yield self.stamped(
+                Asset, created_at=purchased, name=f'{asset_type.title()} {i + 1}', asset_tag=f'{self.slug}-AT-{i + 1:07d}',
+                asset_type=asset_type, make=rng.choice(('Dell', 'Apple', 'HP', 'Lenovo', 'Cisco')),
+                model=f'M{rng.randrange(100, 999)}', serial_number=uuid.UUID(int=rng.getrandbits(128)).hex[:12].upper(),
+                status=ASSET_STATUS(rng), client_id=skewed(rng, clients) if clients and rng.random() < 0.7 else None,
+                assigned_to_id=rng.choice(users) if users else None, purchase_date=purchased.date(),
+                purchase_price=money(rng, 900), warranty_expires=(purchased + timedelta(days=365 * 3)).date(),
+                location=rng.choice(('HQ', 'Remote', 'Branch Office', 'Data Center')),
+            )
+
+    # ── Audit trail ──
+
+    def seed_auditlog(self, count):
+        AuditLog = apps.get_model('core.AuditLog')
+        users = self.ids['users.User']
+        rng = self.rng
+        for _ in range(count):
+            action = AUDIT_ACTION(rng)
+            yield AuditLog(
+                timestamp=self.timeline.sample(), user_id=skewed(rng, users) if users else None, tenant_id=self.tenant.pk,
+                action=action, resource=f'{action.split("_")[0].lower()}:{uuid.UUID(int=rng.getrandbits(128))}',
+                payload={}, ip_address=self.internal_ip() if rng.random() < 0.7 else self.external_ip(),
+            )
@@ -1,7 +1,22 @@
 from rest_framework import serializers
-from .models import Notification
+from .models import ImportRun
+
+
+class ImportRunSerializer(serializers.ModelSerializer):
+    user = serializers.EmailField(source='user.email', read_only=True, default=None)
 
-class NotificationSerializer(serializers.ModelSerializer):
     class Meta:
-        model = Notification
-        fields = '__all__'
+        model = ImportRun
+        fields = [
+            'id', 'resource', 'format', 'file_name', 'match_fields', 'dry_run', 'status',
+            'processed', 'created', 'updated', 'failed', 'errors', 'last_error',
+            'user', 'created_at', 'started_at', 'finished_at',
+        ]
+        read_only_fields = fields
+
+
+class ImportUploadSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=ImportRun.FORMAT_CHOICES, required=False)
+    match = serializers.CharField(required=False, help_text='Field(s) identifying existing rows, e.g. "email"')
+    dry_run = serializers.BooleanField(default=False)
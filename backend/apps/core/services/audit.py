@@ -1,5 +1,6 @@
 from ..models import AuditLog
 from .base import BaseService
+from .audit_buffer import AuditBuffer
 
 class AuditService(BaseService):
     """
@@ -13,6 +14,33 @@ class AuditService(BaseService):
         Logs an action to the AuditLog.
         Infers tenant and user from request context.
         """
+        entry = AuditService.build_entry(request, action, resource, payload)
+
+        # Opt-in write-behind mode: rows are bulk-inserted on commit / end of request
+        if AuditBuffer.is_enabled():
+            AuditBuffer.add(entry)
+            return entry
+
+        entry.save()
+        return entry
+
+    @staticmethod
+    def log_actions(entries):
+        """
+        Persists several entries from build_entry() at once (batch operations).
+        One bulk_create, or the write-behind buffer when enabled.
+        """
+        if AuditBuffer.is_enabled():
+            for entry in entries:
+                AuditBuffer.add(entry)
+            return entries
+
+        AuditLog.objects.bulk_create(entries, batch_size=AuditBuffer.config()['BATCH_SIZE'])
+        return entries
+
+    @staticmethod
+    def build_entry(request, action, resource, payload=None):
+        """Unsaved AuditLog with user, tenant and IP taken from the request."""
         user = None
         if request and request.user.is_authenticated:
             user = request.user
@@ -30,7 +58,7 @@ class AuditService(BaseService):
             else:
                 ip = request.META.get('REMOTE_ADDR')
 
-        return AuditLog.objects.create(
+        return AuditLog(
             user=user,
             tenant=tenant,
             action=action,
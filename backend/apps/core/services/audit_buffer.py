@@ -0,0 +1,241 @@
+"""
+Write-behind buffer for AuditService (Charter §11).
+
+Opt-in via settings.AUDIT_BUFFER['ENABLED']. Instead of one INSERT per
+log_action() call, AuditLog rows are collected per transaction (or per request
+when the caller runs in autocommit) and written with a single bulk_create.
+
+Durability modes (settings.AUDIT_BUFFER['DURABILITY']):
+    'commit' — rows are written synchronously when the caller's transaction
+               commits, or when the request scope ends. A rolled-back
+               transaction (or savepoint) discards its audit rows, exactly like
+               the unbuffered path.
+    'async'  — committed rows are handed to a background flusher thread that
+               writes them every FLUSH_INTERVAL seconds or as soon as
+               BATCH_SIZE rows are pending. Lowest request latency, but rows
+               still queued when the process dies are lost. MAX_PENDING bounds
+               memory; overflowing rows are counted as dropped.
+"""
+import atexit
+import logging
+import threading
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ENABLED': False,
+    'DURABILITY': 'commit',
+    'BATCH_SIZE': 200,
+    'FLUSH_INTERVAL': 1.0,
+    'MAX_PENDING': 10000,
+}
+
+
+class AuditBuffer:
+    _local = threading.local()
+    _lock = threading.Lock()
+    _queue = deque()
+    _wakeup = threading.Event()
+    _flusher = None
+    _stats = {'pending': 0, 'flushed': 0, 'dropped': 0, 'flushes': 0}
+
+    # ── Configuration ─────────────────────────────────────────────────────
+
+    @staticmethod
+    def config():
+        return {**DEFAULTS, **getattr(settings, 'AUDIT_BUFFER', {})}
+
+    @classmethod
+    def is_enabled(cls):
+        return bool(cls.config()['ENABLED'])
+
+    @classmethod
+    def stats(cls):
+        """Counters for the health endpoints: pending / flushed / dropped entries."""
+        with cls._lock:
+            stats = dict(cls._stats)
+        stats['queued_async'] = len(cls._queue)
+        stats['durability'] = cls.config()['DURABILITY']
+        return stats
+
+    # ── Entry point ───────────────────────────────────────────────────────
+
+    @classmethod
+    def add(cls, entry):
+        """
+        Queues an unsaved AuditLog instance.
+        Inside a transaction the row joins the batch of the current savepoint
+        level; otherwise it joins the request scope, or is handed straight to
+        the writer when neither exists.
+        """
+        cls._count('pending', 1)
+        if connection.in_atomic_block:
+            cls._transaction_batch().append(entry)
+            return
+        cls._discard_transaction_batches()
+        scope = getattr(cls._local, 'scope', None)
+        if scope is not None:
+            scope.append(entry)
+            return
+        cls._commit([entry])
+
+    # ── Request / job scope ───────────────────────────────────────────────
+
+    @classmethod
+    @contextmanager
+    def scope(cls):
+        """
+        Collects autocommit audit rows until the block exits.
+        Used by AuditBufferMiddleware per request, and usable around
+        management commands or background jobs.
+        """
+        if getattr(cls._local, 'scope', None) is not None:
+            yield
+            return
+        cls._local.scope = []
+        try:
+            yield
+        finally:
+            entries, cls._local.scope = cls._local.scope, None
+            if entries:
+                cls._commit(entries)
+
+    @classmethod
+    @asynccontextmanager
+    async def ascope(cls):
+        """
+        scope() for async middleware: the scope is thread-local, so it is opened
+        and flushed on the request's sync thread, where views write their audit rows.
+        """
+        scope = cls.scope()
+        await sync_to_async(scope.__enter__)()
+        try:
+            yield
+        finally:
+            await sync_to_async(scope.__exit__)(None, None, None)
+
+    # ── Transaction batches ───────────────────────────────────────────────
+
+    @classmethod
+    def _transaction_batch(cls):
+        """
+        One batch per savepoint level. The batch's on_commit hook is dropped by
+        Django when that savepoint (or the whole transaction) rolls back, which
+        also discards the rows — matching the unbuffered semantics.
+        """
+        batches = getattr(cls._local, 'batches', None)
+        if batches is None:
+            batches = cls._local.batches = {}
+
+        key = tuple(connection.savepoint_ids)
+        pending_hooks = {id(func) for _, func, _ in connection.run_on_commit}
+        for stale_key in [k for k, (hook, _) in batches.items() if id(hook) not in pending_hooks]:
+            _, rows = batches.pop(stale_key)
+            cls._count('pending', -len(rows))
+
+        if key not in batches:
+            rows = []
+
+            def hook():
+                batches.pop(key, None)
+                cls._commit(rows)
+
+            batches[key] = (hook, rows)
+            transaction.on_commit(hook)
+        return batches[key][1]
+
+    @classmethod
+    def _discard_transaction_batches(cls):
+        batches = getattr(cls._local, 'batches', None)
+        if batches:
+            # Outside any atomic block: surviving batches belong to rolled-back transactions.
+            for _, rows in batches.values():
+                cls._count('pending', -len(rows))
+            batches.clear()
+
+    # ── Writers ───────────────────────────────────────────────────────────
+
+    @classmethod
+    def _commit(cls, entries):
+        if not entries:
+            return
+        if cls.config()['DURABILITY'] == 'async':
+            cls._enqueue(entries)
+        else:
+            cls._write(entries)
+
+    @classmethod
+    def _write(cls, entries):
+        from ..models import AuditLog
+
+        batch_size = cls.config()['BATCH_SIZE']
+        try:
+            AuditLog.objects.bulk_create(entries, batch_size=batch_size)
+        except Exception:
+            logger.exception(f"AuditBuffer: failed to write {len(entries)} audit entries")
+            cls._count('pending', -len(entries), dropped=len(entries))
+            return
+        cls._count('pending', -len(entries), flushed=len(entries), flushes=1)
+
+    @classmethod
+    def _enqueue(cls, entries):
+        cfg = cls.config()
+        overflow = 0
+        with cls._lock:
+            cls._queue.extend(entries)
+            while len(cls._queue) > cfg['MAX_PENDING']:
+                cls._queue.popleft()
+                overflow += 1
+        if overflow:
+            logger.warning(f"AuditBuffer: queue full, dropped {overflow} oldest audit entries")
+            cls._count('pending', -overflow, dropped=overflow)
+        cls._ensure_flusher()
+        if len(cls._queue) >= cfg['BATCH_SIZE']:
+            cls._wakeup.set()
+
+    @classmethod
+    def flush(cls):
+        """Drains the async queue synchronously. Safe to call from any thread."""
+        batch_size = cls.config()['BATCH_SIZE']
+        while True:
+            with cls._lock:
+                batch = [cls._queue.popleft() for _ in range(min(batch_size, len(cls._queue)))]
+            if not batch:
+                return
+            cls._write(batch)
+
+    @classmethod
+    def _ensure_flusher(cls):
+        if cls._flusher is not None and cls._flusher.is_alive():
+            return
+        with cls._lock:
+            if cls._flusher is not None and cls._flusher.is_alive():
+                return
+            cls._flusher = threading.Thread(target=cls._run_flusher, name='audit-buffer-flusher', daemon=True)
+            cls._flusher.start()
+
+    @classmethod
+    def _run_flusher(cls):
+        while True:
+            cls._wakeup.wait(timeout=cls.config()['FLUSH_INTERVAL'])
+            cls._wakeup.clear()
+            try:
+                cls.flush()
+            finally:
+                close_old_connections()
+
+    @classmethod
+    def _count(cls, key, delta, **totals):
+        with cls._lock:
+            cls._stats[key] += delta
+            for name, value in totals.items():
+                cls._stats[name] += value
+
+
+atexit.register(AuditBuffer.flush)
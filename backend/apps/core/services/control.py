@@ -48,11 +48,14 @@ class ControlService(BaseService):
             return True
 
         # Resolve Business Role (In production, this comes from user.roles m2m)
-        # For this refactor, we map staff/groups to enterprise roles
-        is_soc = user.groups.filter(name='SOC_ANALYST').exists() or getattr(user, 'is_staff', False)
-        is_ops = user.groups.filter(name='OPS_MANAGER').exists()
-        is_finance = user.groups.filter(name='FINANCE').exists()
-        is_sales = user.groups.filter(name='SALES').exists()
+        # For this refactor, we map staff/groups to enterprise roles.
+        # Group names are read once per user from the cached permission snapshot.
+        from apps.users.cache import PermissionCache
+        snapshot = PermissionCache.for_user(user)
+        is_soc = snapshot.in_group('SOC_ANALYST') or getattr(user, 'is_staff', False)
+        is_ops = snapshot.in_group('OPS_MANAGER')
+        is_finance = snapshot.in_group('FINANCE')
+        is_sales = snapshot.in_group('SALES')
 
         # SOC Analyst: Can view everything, but only mutate security/incident resources
         if is_soc:
@@ -1,4 +1,9 @@
-﻿from django.db import transaction
+﻿from collections import defaultdict
+
+from django.apps import apps
+from django.db import transaction
+from apps.core.conditional import ChangeCounter
+from apps.core.kpis import KPICounters
 from apps.core.services.audit import AuditService
 from django.utils import timezone
 
@@ -31,6 +36,14 @@ class WorkflowEngine:
         # INCIDENT transitions are matched in IncidentService
     }
 
+    # Concrete models with a fixed entity type, resolved once (see _get_entity_type)
+    ENTITY_MODELS = {
+        'billing.Order': 'ORDER',
+        'soc.Incident': 'INCIDENT',
+        'erp.InternalProject': 'SERVICE',
+    }
+    _entity_types = None
+
     @staticmethod
     def transition(obj, new_state, user, request=None, reason=None):
         """
@@ -68,15 +81,117 @@ class WorkflowEngine:
                 }
             )
 
+    @staticmethod
+    def transition_many(objs, new_state, user, request=None, reason=None):
+        """
+        Batch variant of transition() for nightly jobs and bulk admin actions.
+
+        `objs` is a queryset or an iterable of instances. Each object's current
+        status is re-read under a row lock and validated in memory, then every
+        valid group is moved with one UPDATE per (model, source state) and all
+        audit rows are written with a single bulk insert.
+
+        Unlike transition(), rows are updated with QuerySet.update(): save() is
+        not called and post_save receivers do not run.
+
+        Returns one result per object, in input order:
+            {"object", "pk", "entity_type", "old", "new", "ok", "error"}
+        """
+        objs = list(objs)
+        results = [
+            {
+                "object": obj, "pk": obj.pk, "entity_type": WorkflowEngine._get_entity_type(obj),
+                "old": None, "new": new_state, "ok": False, "error": None,
+            }
+            for obj in objs
+        ]
+
+        by_model = defaultdict(list)
+        for result in results:
+            by_model[type(result["object"])].append(result)
+
+        with transaction.atomic():
+            groups = defaultdict(list)
+            for model, model_results in by_model.items():
+                if not any(f.name == 'status' for f in model._meta.concrete_fields):
+                    for result in model_results:
+                        result["error"] = f"Entity {result['object']} does not have a status field."
+                    continue
+
+                current = dict(
+                    model._base_manager.select_for_update()
+                    .filter(pk__in=[r["pk"] for r in model_results])
+                    .values_list('pk', 'status')
+                )
+                for result in model_results:
+                    obj = result["object"]
+                    old_state = current.get(obj.pk)
+                    result["old"] = old_state
+                    if not old_state:
+                        result["error"] = f"Entity {obj} does not exist or has no status."
+                        continue
+                    transitions = WorkflowEngine.VALID_TRANSITIONS.get(result["entity_type"])
+                    if transitions is not None and new_state not in transitions.get(old_state, []):
+                        result["error"] = (
+                            f"Invalid transition for {result['entity_type']} from {old_state} to {new_state}"
+                        )
+                        continue
+                    groups[(model, old_state)].append(result)
+
+            now = timezone.now()
+            entries = []
+            for (model, old_state), group in groups.items():
+                changes = {'status': new_state}
+                if any(f.name == 'updated_at' for f in model._meta.concrete_fields):
+                    changes['updated_at'] = now
+                # Rows are locked above, so the status guard matches every pk in the group
+                model._base_manager.filter(
+                    pk__in=[r["pk"] for r in group], status=old_state
+                ).update(**changes)
+                tenant_ids = {getattr(r["object"], 'tenant_id', None) for r in group}
+                for tenant_id in tenant_ids:
+                    ChangeCounter.bump(model, tenant_id)
+                KPICounters.invalidate(model, *tenant_ids)
+
+                for result in group:
+                    obj = result["object"]
+                    obj.status = new_state
+                    if 'updated_at' in changes:
+                        obj.updated_at = now
+                    result["ok"] = True
+                    entries.append(AuditService.build_entry(
+                        request,
+                        action=f"{result['entity_type']}_STATE_TRANSITION",
+                        resource=f"{obj._meta.app_label}.{obj._meta.model_name}:{obj.pk}",
+                        payload={
+                            "old": old_state,
+                            "new": new_state,
+                            "user": user.email,
+                            "reason": reason,
+                            "batch": True,
+                        }
+                    ))
+
+            if entries:
+                AuditService.log_actions(entries)
+
+        return results
+
     @staticmethod
     def _get_entity_type(obj):
-        from apps.billing.models import Order
-        from apps.soc.models import Incident  # Correct model name (not SecurityIncident)
-        from apps.erp.models import InternalProject
+        if WorkflowEngine._entity_types is None:
+            entity_types = {}
+            for label, entity_type in WorkflowEngine.ENTITY_MODELS.items():
+                try:
+                    entity_types[apps.get_model(label)] = entity_type
+                except LookupError:
+                    # Model not installed (e.g. billing.Order); the model-name fallback applies
+                    continue
+            WorkflowEngine._entity_types = entity_types
 
-        if isinstance(obj, Order): return 'ORDER'
-        if isinstance(obj, Incident): return 'INCIDENT'
-        if isinstance(obj, InternalProject): return 'SERVICE'
+        for model, entity_type in WorkflowEngine._entity_types.items():
+            if isinstance(obj, model):
+                return entity_type
         # Fallback: check flag for service obligation duck-types
         if hasattr(obj, 'is_service_obligation') and obj.is_service_obligation: return 'SERVICE'
 
@@ -1,8 +1,11 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_init, post_save
 from django.dispatch import receiver, Signal
 from django.apps import apps
 import logging
 
+from apps.core.events import DealWon, EventBus, OrderCompleted, OrderCreated
+from apps.core.outbox import Outbox
+
 logger = logging.getLogger(__name__)
 
 # --- Commerce Events (Section 20) ---
@@ -20,91 +23,123 @@ lifecycle_transition = Signal()
 # Providing: project, order, request (optional)
 obligation_created = Signal()
 
+# The three signals above are never sent directly: producers call
+# Outbox.send('<name>', ...) inside their transaction and `manage.py run_outbox`
+# delivers them to the receivers below (apps.core.outbox).
+Outbox.register('order_paid', order_paid)
+Outbox.register('lifecycle_transition', lifecycle_transition)
+Outbox.register('obligation_created', obligation_created)
+
+
+# --- Domain event publishers (see apps.core.events) ---
+# Model saves only publish typed events; cross-module side effects subscribe
+# to them and run after commit with a shared user → Contact → Client context.
+
+@receiver(post_init, sender='store.Order')
+@receiver(post_init, sender='crm.Deal')
+def remember_published_state(sender, instance, **kwargs):
+    # __dict__ lookups so deferred fields (.only()) are not loaded per row
+    instance._published_state = instance.__dict__.get('status', instance.__dict__.get('stage'))
+
+
+@receiver(post_save, sender='store.Order')
+def publish_order_events(sender, instance, created, **kwargs):
+    if created:
+        EventBus.publish(OrderCreated.from_instance(instance))
+    if instance.status == 'completed' and getattr(instance, '_published_state', None) != 'completed':
+        EventBus.publish(OrderCompleted.from_instance(instance))
+    instance._published_state = instance.status
+
 
 @receiver(post_save, sender='crm.Deal')
-def create_project_agreement_from_deal(sender, instance, created, **kwargs):
+def publish_deal_events(sender, instance, created, **kwargs):
+    if instance.stage == 'won' and getattr(instance, '_published_state', None) != 'won':
+        EventBus.publish(DealWon.from_instance(instance))
+    instance._published_state = instance.stage
+
+
+@EventBus.subscribe(DealWon)
+def create_project_agreement_from_deal(event, context):
     """
     Charter §16: When a Deal is marked as 'won', create a corresponding
     InternalProject (service delivery obligation) in ERP if one doesn't already exist.
     Field correction: Deal uses 'title' and 'amount' (not 'name'/'value').
     """
-    if instance.stage == 'won':
-        InternalProject = apps.get_model('erp', 'InternalProject')
-
-        project_name = f"Project: {instance.title}"
-
-        project, created_proj = InternalProject.objects.get_or_create(
-            name=project_name,
-            client=instance.client,
-            defaults={
-                'status': 'planning',
-                'description': f"Generated from Deal: {instance.title} (ID: {instance.id})",
-                'budget': instance.amount or 0,
-                'deal_id': instance.id,
-            }
+    instance = context.instance
+    if instance is None or instance.stage != 'won':
+        return
+
+    InternalProject = apps.get_model('erp', 'InternalProject')
+
+    project_name = f"Project: {instance.title}"
+
+    project, created_proj = InternalProject.objects.get_or_create(
+        name=project_name,
+        client=instance.client,
+        defaults={
+            'status': 'planning',
+            'description': f"Generated from Deal: {instance.title} (ID: {instance.id})",
+            'budget': instance.amount or 0,
+            'deal_id': instance.id,
+            'tenant': instance.tenant,
+        }
+    )
+    if created_proj:
+        logger.info(f"Created ERP InternalProject '{project_name}' from Deal {instance.id}")
+        # Emit the obligation_created event for downstream subscribers
+        Outbox.send(
+            'obligation_created',
+            sender=InternalProject,
+            project=project,
+            order=None,
         )
-        if created_proj:
-            logger.info(f"Created ERP InternalProject '{project_name}' from Deal {instance.id}")
-            # Emit the obligation_created event for downstream subscribers
-            obligation_created.send(
-                sender=InternalProject,
-                project=project,
-                order=None,
-            )
 
 
-@receiver(post_save, sender='store.Order')
-def sync_crm_client_from_order(sender, instance, created, **kwargs):
+@EventBus.subscribe(OrderCreated, priority=10)
+def sync_crm_client_from_order(event, context):
     """
     Charter §6: When a Store Order is created, ensure the ordering User
     has a CRM Client + Contact profile so commerce and CRM stay in sync.
-    Corrected app label from 'billing.Order' to 'store.Order'.
+    Runs first so later OrderCreated subscribers find the Contact on the context.
     """
-    if created and instance.user:
-        Client = apps.get_model('crm', 'Client')
-        Contact = apps.get_model('crm', 'Contact')
-
-        # Check if a Contact already exists for this email
-        contact = Contact.objects.filter(email=instance.user.email).first()
-
-        if not contact:
-            # Determine the tenant — store.Order carries a tenant FK
-            tenant = getattr(instance, 'tenant', None)
-
-            full_name = (
-                f"{instance.user.first_name} {instance.user.last_name}".strip()
-                or instance.user.username
-            )
-
-            # Create a Client record (lifecycle starts as 'active' because they just purchased)
-            client = Client(
-                name=full_name,
-                client_type='individual',
-                status='active',
-                email=instance.user.email,
-                tenant=tenant,
-            )
-            # Skip save() if no tenant — TenantAwareModel requires it
-            if tenant:
-                client.save()
-
-                # Create the primary Contact linked to this Client
-                Contact.objects.create(
-                    client=client,
-                    email=instance.user.email,
-                    first_name=instance.user.first_name or '',
-                    last_name=instance.user.last_name or instance.user.username,
-                    is_primary=True,
-                    role='Customer',
-                    tenant=tenant,
-                )
-                logger.info(
-                    f"Created CRM Client & Contact for Store Order user '{instance.user.email}'"
-                )
-            else:
-                logger.warning(
-                    f"Store Order {instance.id} has no tenant — skipping CRM sync for user '{instance.user.email}'"
-                )
+    user = context.user
+    if not user or context.contact:
+        return
+
+    Client = apps.get_model('crm', 'Client')
+    Contact = apps.get_model('crm', 'Contact')
+
+    # Determine the tenant — store.Order carries a tenant FK
+    tenant = context.tenant
+    if not tenant:
+        # Skip if no tenant — TenantAwareModel requires it
+        logger.warning(
+            f"Store Order {event.pk} has no tenant — skipping CRM sync for user '{user.email}'"
+        )
+        return
+
+    full_name = f"{user.first_name} {user.last_name}".strip() or user.username
+
+    # Create a Client record (lifecycle starts as 'active' because they just purchased)
+    client = Client.objects.create(
+        name=full_name,
+        client_type='individual',
+        status='active',
+        email=user.email,
+        tenant=tenant,
+    )
+
+    # Create the primary Contact linked to this Client
+    context.contact = Contact.objects.create(
+        client=client,
+        email=user.email,
+        first_name=user.first_name or '',
+        last_name=user.last_name or user.username,
+        is_primary=True,
+        role='Customer',
+        tenant=tenant,
+    )
+    logger.info(f"Created CRM Client & Contact for Store Order user '{user.email}'")
 
 
 @receiver(order_paid)
@@ -0,0 +1,30 @@
+"""
+Core background jobs (apps.core.jobs), executed by `python manage.py run_jobs`.
+"""
+import logging
+
+from django.core.files.storage import default_storage
+
+from .imports import run_import
+from .jobs import job
+from .models import ImportRun
+
+logger = logging.getLogger(__name__)
+
+
+# Not retried: a second attempt would re-import the batches the first one committed
+@job(queue='imports', max_attempts=1)
+def process_import(import_id):
+    run = ImportRun.objects.filter(pk=import_id, status=ImportRun.STATUS_QUEUED).select_related('tenant', 'user').first()
+    if run is None:
+        return f"Import {import_id} is not queued."
+    try:
+        with default_storage.open(run.file_path, 'rb') as fh:
+            run_import(run, fh)
+    except Exception as exc:
+        logger.exception(f"Import {import_id} failed")
+        ImportRun.objects.filter(pk=run.pk).update(status=ImportRun.STATUS_FAILED, last_error=str(exc))
+        raise
+    finally:
+        default_storage.delete(run.file_path)
+    return f"Imported {run.processed} {run.resource} rows: {run.created} created, {run.updated} updated, {run.failed} failed."
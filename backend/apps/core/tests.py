@@ -0,0 +1,597 @@
+import gzip
+import threading
+from datetime import timedelta
+from unittest import mock
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import transaction
+from django.dispatch import Signal
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework import generics, serializers
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.core import observability
+from apps.core.compression import CompressionMiddleware
+from apps.core.conditional import ChangeCounter
+from apps.core.fanout import FanOut
+from apps.core.imports import start_import
+from apps.core.jobs import JobQueue, job
+from apps.core.kpis import KPICounters
+from apps.core.middleware import (
+    AuditBufferMiddleware, RequestLoggingMiddleware, TenantMiddleware, get_current_tenant, tenant_context,
+)
+from apps.core.mixins import SparseFieldsMixin
+from apps.core.models import AuditLog, Job, OutboxMessage, TenantKPICounter
+from apps.core.outbox import Outbox
+from apps.core.pagination import KeysetPagination
+from apps.core.query_inspector import QueryInspector, QueryInspectorMiddleware
+from apps.core.services.workflow import WorkflowEngine
+from apps.crm.models import Client, Contact
+from apps.itam.models import Asset
+from apps.soc.models import Alert, LogAnalysis, NetworkEvent, SystemMonitor
+from apps.soc.serializers import AlertListSerializer, AlertSerializer
+from apps.store.models import Order
+from apps.sysadmin.models import SystemSetting
+from apps.tenants.models import Tenant
+
+KEYS = ['soc.alerts', 'soc.alerts.unresolved', 'soc.alerts.critical']
+
+
+class KPICountersTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.acme = Tenant.objects.create(name='Acme', domain='acme.test')
+        cls.globex = Tenant.objects.create(name='Globex', domain='globex.test')
+
+    def alert(self, tenant, severity='low', **fields):
+        return Alert.objects.create(
+            tenant=tenant, title='Alert', description='', severity=severity, source='IDS', **fields
+        )
+
+    def recount(self, tenant):
+        return dict(zip(KEYS, (
+            Alert.objects.filter(tenant=tenant).count(),
+            Alert.objects.filter(tenant=tenant, is_resolved=False).count(),
+            Alert.objects.filter(tenant=tenant, is_resolved=False, severity='critical').count(),
+        )))
+
+    def test_first_read_counts_the_table(self):
+        self.alert(self.acme)
+        self.alert(self.acme, severity='critical')
+        self.alert(self.globex, is_resolved=True)
+
+        self.assertEqual(KPICounters.get(KEYS, self.acme), {
+            'soc.alerts': 2, 'soc.alerts.unresolved': 2, 'soc.alerts.critical': 1,
+        })
+        self.assertEqual(TenantKPICounter.objects.filter(tenant=self.acme).count(), len(KEYS))
+
+    def test_saves_and_deletes_move_the_counters(self):
+        KPICounters.get(KEYS, self.acme)  # counters exist from here on
+
+        critical = self.alert(self.acme, severity='critical')
+        other = self.alert(self.acme)
+        self.assertEqual(KPICounters.get(KEYS, self.acme), self.recount(self.acme))
+
+        critical.is_resolved = True
+        critical.save()
+        self.assertEqual(KPICounters.get(KEYS, self.acme), {
+            'soc.alerts': 2, 'soc.alerts.unresolved': 1, 'soc.alerts.critical': 0,
+        })
+
+        other.delete()  # soft delete: counted the way Alert.objects counts it
+        self.assertEqual(KPICounters.get(KEYS, self.acme), self.recount(self.acme))
+        Alert.all_objects.filter(pk=other.pk).delete()  # row gone: post_delete per row
+        self.assertEqual(KPICounters.get(KEYS, self.acme), {
+            'soc.alerts': 1, 'soc.alerts.unresolved': 0, 'soc.alerts.critical': 0,
+        })
+
+    def test_rolled_back_write_leaves_counters_alone(self):
+        before = KPICounters.get(KEYS, self.acme)
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.alert(self.acme, severity='critical')
+                raise RuntimeError
+        self.assertEqual(KPICounters.get(KEYS, self.acme), before)
+
+    def test_writes_only_touch_their_own_tenant(self):
+        KPICounters.get(KEYS, self.acme)
+        KPICounters.get(KEYS, self.globex)
+        KPICounters.get(KEYS)
+        globex = dict(TenantKPICounter.objects.filter(tenant=self.globex).values_list('key', 'value'))
+        no_tenant = dict(TenantKPICounter.objects.filter(tenant__isnull=True).values_list('key', 'value'))
+
+        self.alert(self.acme, severity='critical')
+
+        self.assertEqual(dict(TenantKPICounter.objects.filter(tenant=self.globex).values_list('key', 'value')), globex)
+        self.assertEqual(
+            dict(TenantKPICounter.objects.filter(tenant__isnull=True).values_list('key', 'value')), no_tenant
+        )
+
+    def test_total_is_the_sum_over_tenants(self):
+        self.alert(self.acme)
+        self.alert(self.globex, severity='critical')
+        self.assertEqual(KPICounters.get(KEYS), {
+            'soc.alerts': 2, 'soc.alerts.unresolved': 2, 'soc.alerts.critical': 1,
+        })
+
+        self.alert(self.globex)
+        self.alert(self.acme)
+        self.assertEqual(KPICounters.get(['soc.alerts'])['soc.alerts'], 4)
+
+        # A tenant created later has no counters yet: the total recounts the missing ones
+        initech = Tenant.objects.create(name='Initech', domain='initech.test')
+        self.alert(initech)
+        self.assertEqual(KPICounters.get(['soc.alerts'])['soc.alerts'], 5)
+
+    def test_write_between_count_and_insert_is_not_lost(self):
+        self.alert(self.acme)
+        count_by_tenant = KPICounters.count_by_tenant
+        calls = []
+
+        def count_then_write(*args, **kwargs):
+            counted = count_by_tenant(*args, **kwargs)
+            if not calls:
+                # Commits after the first count, before the counters exist: its UPDATE finds no row
+                self.alert(self.acme, severity='critical')
+            calls.append(counted)
+            return counted
+
+        with mock.patch.object(KPICounters, 'count_by_tenant', side_effect=count_then_write):
+            values = KPICounters.get(KEYS, self.acme)
+
+        self.assertEqual(values, self.recount(self.acme))
+        stored = dict(TenantKPICounter.objects.filter(tenant=self.acme).values_list('key', 'value'))
+        self.assertEqual(stored, self.recount(self.acme))
+
+    def test_invalidate_recounts_after_writes_without_signals(self):
+        KPICounters.get(KEYS, self.acme)
+        Alert.objects.bulk_create([
+            Alert(tenant=self.acme, title='Bulk', description='', severity='critical', source='IDS')
+            for _ in range(3)
+        ])
+        KPICounters.invalidate(Alert, self.acme.pk)
+
+        self.assertEqual(KPICounters.get(KEYS, self.acme), self.recount(self.acme))
+
+    def test_rebuild_kpis_check_finds_no_drift(self):
+        KPICounters.get(KEYS, self.acme)
+        alert = self.alert(self.acme, severity='critical')
+        alert.is_resolved = True
+        alert.save()
+        self.alert(self.globex)
+
+        call_command('rebuild_kpis', '--check', stdout=mock.MagicMock())  # raises CommandError on drift
+
+
+class OutboxTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.acme = Tenant.objects.create(name='Acme', domain='acme.test')
+
+    def setUp(self):
+        self.signal = Signal()
+        self.seen = []
+        self.signal.connect(self.receiver, weak=False)
+        Outbox.register('test_event', self.signal)
+        self.addCleanup(Outbox._signals.pop, 'test_event')
+
+    def receiver(self, sender, signal, **kwargs):
+        self.seen.append((get_current_tenant(), kwargs))
+
+    def test_delivery_runs_in_the_sender_tenant_context(self):
+        with tenant_context(self.acme):
+            Outbox.send('test_event', value=1)
+        Outbox.send('test_event', value=2)
+
+        self.assertEqual(Outbox.process_batch(), (2, 0))
+        self.assertEqual(self.seen, [(self.acme, {'value': 1}), (None, {'value': 2})])
+        self.assertFalse(OutboxMessage.objects.exclude(status=OutboxMessage.STATUS_DONE).exists())
+        self.assertIsNone(get_current_tenant())
+
+
+class AlertDisplaySerializer(AlertSerializer):
+    severity_label = serializers.CharField(source='get_severity_display', read_only=True)
+
+    class Meta(AlertSerializer.Meta):
+        fields = AlertSerializer.Meta.fields + ['severity_label']
+
+
+class SparseFieldsTests(TestCase):
+
+    def view(self, query='', serializer_class=AlertSerializer):
+        view = type('AlertView', (SparseFieldsMixin, generics.ListAPIView), {
+            'queryset': Alert.all_objects.all(),
+            'serializer_class': serializer_class,
+            'list_serializer_class': AlertListSerializer,
+            'filter_backends': [],
+        })()
+        view.request = Request(APIRequestFactory().get(f'/api/security/alerts/{query}'))
+        view.format_kwarg = None
+        view.action = 'list'
+        return view
+
+    def deferred(self, view):
+        fields, defer = view.filter_queryset(view.get_queryset()).query.deferred_loading
+        return set(fields) if defer else set()
+
+    def test_only_requests_with_fields_or_omit_are_sparse(self):
+        self.assertFalse(self.view().is_sparse_request())
+        self.assertEqual(self.deferred(self.view()), set())
+        self.assertTrue(self.view('?fields=id,title').is_sparse_request())
+        self.assertTrue(self.view('?omit=description').is_sparse_request())
+
+    def test_compact_list_is_opt_in(self):
+        self.assertIs(self.view().get_serializer_class(), AlertSerializer)
+        self.assertIs(self.view('?view=compact').get_serializer_class(), AlertListSerializer)
+        self.assertIn('description', self.deferred(self.view('?view=compact')))
+        self.assertIs(self.view('?view=compact&fields=id,description').get_serializer_class(), AlertSerializer)
+
+    def test_unread_columns_are_deferred(self):
+        view = self.view('?fields=id,title')
+        self.assertEqual(list(view.get_serializer().fields), ['id', 'title'])
+        self.assertIn('description', self.deferred(view))
+        self.assertNotIn('title', self.deferred(view))
+
+    def test_nothing_is_deferred_behind_a_method_source(self):
+        view = self.view('?fields=id,severity_label', serializer_class=AlertDisplaySerializer)
+        self.assertEqual(self.deferred(view), set())
+
+
+class KeysetPaginationTests(TestCase):
+
+    def mode(self, queryset, query=''):
+        request = Request(APIRequestFactory().get(f'/api/notifications/{query}'))
+        return KeysetPagination().get_mode(queryset, request, view=None)
+
+    def test_newest_first_querysets_page_on_the_keyset(self):
+        self.assertEqual(self.mode(Alert.all_objects.all()), 'keyset')
+        self.assertEqual(self.mode(Alert.all_objects.order_by('-created_at')), 'keyset')
+        self.assertEqual(self.mode(Alert.all_objects.order_by('-created_at'), '?offset=0'), 'offset')
+
+    def test_other_orderings_fall_back_to_offset(self):
+        self.assertEqual(self.mode(Alert.all_objects.order_by('title')), 'offset')
+        self.assertEqual(SystemSetting._meta.ordering, ['key'])
+        self.assertEqual(self.mode(SystemSetting.objects.all()), 'offset')
+        self.assertEqual(self.mode(SystemSetting.objects.order_by()), 'keyset')
+
+
+class CompressionMiddlewareTests(SimpleTestCase):
+    body = b'<p>' + b'compressible ' * 200 + b'</p>'
+
+    def respond(self, content_type, accept_encoding):
+        middleware = CompressionMiddleware(lambda request: HttpResponse(self.body, content_type=content_type))
+        return middleware(RequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding))
+
+    def test_json_is_compressed(self):
+        response = self.respond('application/json', 'gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), self.body)
+
+    def test_html_gets_padded_gzip_only(self):
+        response = self.respond('text/html; charset=utf-8', 'br, gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), self.body)
+        lengths = {len(self.respond('text/html', 'gzip').content) for _ in range(10)}
+        self.assertGreater(len(lengths), 1)  # random padding in the gzip header
+
+        self.assertFalse(self.respond('text/html', 'br').has_header('Content-Encoding'))
+
+    def test_xlsx_is_not_recompressed(self):
+        response = self.respond('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'br, gzip')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, self.body)
+
+
+class QueryInspectorTests(SimpleTestCase):
+
+    def findings(self, repeats, list_size):
+        inspector = QueryInspector(threshold=5)
+        for pk in range(repeats):
+            inspector(f'SELECT * FROM "store_product" WHERE "id" = {pk}', 0.001)
+        return inspector.findings(list_size)
+
+    def test_lazy_loads_on_part_of_the_rows_scale_with_the_page(self):
+        # e.g. a nullable foreign key set on 30 of 50 listed rows
+        [finding] = self.findings(30, list_size=50)
+        self.assertEqual(finding['count'], 30)
+        self.assertTrue(finding['scales_with_page'])
+
+    def test_repeats_unrelated_to_the_row_count_are_only_reported(self):
+        [finding] = self.findings(6, list_size=50)
+        self.assertFalse(finding['scales_with_page'])
+        self.assertEqual(self.findings(4, list_size=50), [])
+
+
+@override_settings(FAN_OUT={'ENABLED': True, 'WORKERS': 4, 'TIMEOUT': 0.2})
+class FanOutTests(SimpleTestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.addCleanup(FanOut.shutdown)
+        self.addCleanup(self.release.set)
+
+    def slow(self):
+        self.release.wait(5)
+        return 'slow'
+
+    def test_a_slow_task_blocks_its_name_only_within_its_scope(self):
+        with self.assertLogs('apps.core.fanout', 'WARNING'):
+            results, failures = FanOut.run({'dashboard.store': self.slow, 'dashboard.crm': lambda: 'crm'}, scope=1)
+        self.assertEqual(results, {'dashboard.crm': 'crm'})
+        self.assertIsInstance(failures['dashboard.store'], TimeoutError)
+
+        # Still running for scope 1: failed at once there, run normally for scope 2
+        submitted = mock.Mock(return_value='store')
+        _, failures = FanOut.run({'dashboard.store': submitted}, scope=1)
+        self.assertIsInstance(failures['dashboard.store'], TimeoutError)
+        submitted.assert_not_called()
+        results, _ = FanOut.run({'dashboard.store': submitted}, scope=2)
+        self.assertEqual(results, {'dashboard.store': 'store'})
+
+        self.release.set()
+        FanOut.shutdown()  # waits for the abandoned task, which releases its key
+        results, _ = FanOut.run({'dashboard.store': submitted}, scope=1)
+        self.assertEqual(results, {'dashboard.store': 'store'})
+
+
+class ChangeCounterTests(SimpleTestCase):
+
+    def test_soc_telemetry_saves_do_not_bump_version_stamps(self):
+        for model in (NetworkEvent, SystemMonitor, LogAnalysis):
+            self.assertFalse(ChangeCounter.is_tracked(model), model._meta.label)
+        self.assertTrue(ChangeCounter.is_tracked(Alert))
+
+
+@override_settings(ALLOWED_HOSTS=['*'], QUERY_INSPECTOR={'MODE': 'report'})
+class AsyncMiddlewareTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.acme = Tenant.objects.create(name='Acme', domain='acme.test')
+
+    async def view(self, request):
+        self.seen = {'tenant': get_current_tenant(), 'metrics': observability.current_metrics()}
+        before = self.seen['metrics'].db_queries if self.seen['metrics'] else 0
+        await sync_to_async(Alert.objects.count)()
+        if self.seen['metrics']:
+            self.seen['view_queries'] = self.seen['metrics'].db_queries - before
+        return HttpResponse('ok')
+
+    def chain(self):
+        handler = self.view
+        for middleware in (
+            AuditBufferMiddleware, TenantMiddleware, QueryInspectorMiddleware,
+            RequestLoggingMiddleware, CompressionMiddleware,
+        ):
+            handler = middleware(handler)
+        return handler
+
+    async def test_tenant_middleware_binds_the_tenant_around_an_async_view(self):
+        middleware = TenantMiddleware(self.view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        request = RequestFactory().get('/api/soc/alerts/', HTTP_X_TENANT_ID='acme.test')
+
+        response = await middleware(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(request.tenant, self.acme)
+        self.assertEqual(self.seen['tenant'], self.acme)
+        self.assertIsNone(get_current_tenant())
+
+    async def test_the_project_chain_stays_async_and_counts_queries_on_the_sync_thread(self):
+        handler = self.chain()
+        self.assertTrue(iscoroutinefunction(handler))
+
+        with self.assertLogs('apps.core.middleware', 'INFO'):
+            response = await handler(RequestFactory().get('/api/soc/alerts/', HTTP_X_TENANT_ID='acme.test'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.seen['tenant'], self.acme)
+        # The ORM ran on the sync thread; the hooks installed by atrack_request() saw it
+        self.assertEqual(self.seen['view_queries'], 1)
+
+
+class ImportTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.acme = Tenant.objects.create(name='Acme', domain='acme.test')
+        cls.globex = Tenant.objects.create(name='Globex', domain='globex.test')
+
+    def load(self, resource, content, name='rows.csv', tenant=None, **options):
+        upload = SimpleUploadedFile(name, content.encode())
+        return start_import(tenant or self.acme, None, resource, upload, **options)
+
+    def clients(self, tenant=None):
+        return Client._base_manager.filter(tenant=tenant or self.acme)
+
+    def test_creates_rows_then_updates_them_on_reimport_by_the_match_field(self):
+        run = self.load('crm.clients', 'name,email,status\nInitech,it@initech.test,prospect\nHooli,ops@hooli.test,active\n',
+                        match='email')
+        self.assertEqual((run.status, run.created, run.updated, run.failed), (run.STATUS_DONE, 2, 0, 0))
+
+        run = self.load('crm.clients', 'name,email,status\nInitech,it@initech.test,active\nHooli,ops@hooli.test,active\n',
+                        match='email')
+        self.assertEqual((run.created, run.updated, run.failed), (0, 1, 0))  # Hooli is unchanged
+        self.assertEqual(self.clients().count(), 2)
+        self.assertEqual(self.clients().get(email='it@initech.test').status, 'active')
+
+    def test_foreign_keys_only_resolve_within_the_tenant(self):
+        Client._base_manager.create(tenant=self.acme, name='Initech')
+        other = Client._base_manager.create(tenant=self.globex, name='Globex Corp')
+        run = self.load('crm.contacts', 'client,first_name,last_name\nInitech,Peter,Gibbons\nGlobex Corp,Hank,Scorpio\n')
+        self.assertEqual((run.created, run.failed), (1, 1))
+        self.assertEqual(run.errors, [{'line': 3, 'errors': {'client': ["No Client with name 'Globex Corp'."]}}])
+
+        run = self.load('crm.contacts', f'client_id,first_name,last_name\n{other.pk},Frank,Grimes\n')
+        self.assertEqual((run.created, run.failed), (0, 1))
+        self.assertEqual(run.errors[0]['errors']['client'], [f"No Client with id '{other.pk}'."])
+        self.assertFalse(Contact._base_manager.filter(tenant=self.globex).exists())
+        self.assertEqual(Contact._base_manager.get(tenant=self.acme).client.name, 'Initech')
+
+    def test_duplicate_rows_and_unique_values_are_reported_per_line(self):
+        Asset._base_manager.create(tenant=self.globex, name='Router', asset_tag='BG-001')
+        run = self.load('itam.assets', (
+            'name,asset_tag,serial_number\n'
+            'Laptop,BG-001,SN-1\n'
+            'Desktop,BG-002,SN-2\n'
+            'Spare desktop,BG-002,SN-3\n'
+            'Server,BG-003,SN-3\n'
+        ), match='serial_number')
+        self.assertEqual((run.created, run.failed), (1, 3))
+        errors = {error['line']: error['errors'] for error in run.errors}
+        self.assertEqual(errors, {
+            2: {'asset_tag': ["'BG-001' is already in use."]},  # by another tenant's asset
+            4: {'asset_tag': ['Duplicate of line 3.']},
+            5: {'__all__': ['Duplicate of line 4.']},  # same serial number, the match field
+        })
+        self.assertEqual(
+            set(Asset._base_manager.filter(tenant=self.acme).values_list('asset_tag', flat=True)), {'BG-002'},
+        )
+
+    def test_dry_run_reports_counts_without_writing(self):
+        run = self.load('crm.clients', '{"name": "Initech"}\n{"name": "Hooli", "website": "not a url"}\n',
+                        name='clients.jsonl', dry_run=True)
+        self.assertEqual((run.status, run.created, run.failed), (run.STATUS_DONE, 1, 1))
+        self.assertEqual(run.errors[0]['line'], 2)
+        self.assertFalse(self.clients().exists())
+
+
+class TransitionManyTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.acme = Tenant.objects.create(name='Acme', domain='acme.test')
+        cls.globex = Tenant.objects.create(name='Globex', domain='globex.test')
+        cls.user = get_user_model().objects.create_user(
+            email='ops@acme.test', username='ops@acme.test', password='x', tenant=cls.acme,
+        )
+
+    def order(self, tenant, status):
+        return Order.objects.create(tenant=tenant, status=status, total_amount=10)
+
+    def transition(self, orders, new_state):
+        with mock.patch.object(ChangeCounter, 'bump') as bump, mock.patch.object(KPICounters, 'invalidate') as invalidate:
+            results = WorkflowEngine.transition_many(orders, new_state, self.user, reason='nightly')
+        return results, bump, invalidate
+
+    def test_mixed_source_states_give_per_object_results_in_input_order(self):
+        orders = [
+            self.order(self.acme, 'paid'), self.order(self.acme, 'fulfilled'),
+            self.order(self.acme, 'pending'), self.order(self.globex, 'pending'),
+        ]
+        results, bump, invalidate = self.transition(orders, 'failed')
+
+        self.assertEqual([result['pk'] for result in results], [order.pk for order in orders])
+        self.assertEqual([result['old'] for result in results], ['paid', 'fulfilled', 'pending', 'pending'])
+        self.assertEqual([result['ok'] for result in results], [True, False, True, True])
+        self.assertEqual(results[1]['error'], 'Invalid transition for ORDER from fulfilled to failed')
+        self.assertEqual(
+            list(Order._base_manager.filter(pk__in=[o.pk for o in orders]).order_by('pk').values_list('status', flat=True)),
+            ['failed', 'fulfilled', 'failed', 'failed'],
+        )
+        self.assertEqual([order.status for order in orders], ['failed', 'fulfilled', 'failed', 'failed'])
+        self.assertEqual(AuditLog.objects.filter(action='ORDER_STATE_TRANSITION').count(), 3)
+
+        # One UPDATE per source state; each invalidates the tenants of its rows
+        self.assertEqual({c.args for c in bump.call_args_list}, {(Order, self.acme.pk), (Order, self.globex.pk)})
+        self.assertCountEqual(
+            [(c.args[0], set(c.args[1:])) for c in invalidate.call_args_list],
+            [(Order, {self.acme.pk}), (Order, {self.acme.pk, self.globex.pk})],
+        )
+
+    def test_invalid_transitions_write_nothing(self):
+        orders = [self.order(self.acme, 'pending'), self.order(self.acme, 'fulfilled')]
+        results, bump, invalidate = self.transition(orders, 'provisioned')
+
+        self.assertEqual([result['ok'] for result in results], [False, False])
+        self.assertEqual(
+            [result['error'] for result in results],
+            ['Invalid transition for ORDER from pending to provisioned',
+             'Invalid transition for ORDER from fulfilled to provisioned'],
+        )
+        self.assertEqual(set(Order._base_manager.values_list('status', flat=True)), {'pending', 'fulfilled'})
+        self.assertFalse(AuditLog.objects.exists())
+        bump.assert_not_called()
+        invalidate.assert_not_called()
+
+
+@job(queue='bulk')
+def noop_job(label):
+    return label
+
+
+@job(queue='bulk', max_attempts=2)
+def failing_job():
+    raise RuntimeError('upstream unavailable')
+
+
+@override_settings(JOB_QUEUE={'QUEUES': {'soc': {'CONCURRENCY': 1}}, 'BACKOFF_BASE': 5.0, 'LEASE': 600})
+class JobQueueClaimTests(TestCase):
+
+    def claim(self, *queues):
+        """Label of the job worker-1 claims, or None."""
+        job = JobQueue.claim('worker-1', list(queues) or ['bulk'])
+        return job.args[0] if job else None
+
+    def finish(self, label):
+        Job.objects.filter(args=[label]).update(status=Job.STATUS_DONE, locked_until=None)
+
+    def test_claims_by_priority_then_run_at_and_skips_future_jobs(self):
+        noop_job.schedule('low', priority=0)
+        noop_job.schedule('later', priority=50, delay=60)
+        noop_job.schedule('high', priority=10)
+        noop_job.schedule('high, queued second', priority=10)
+
+        self.assertEqual(
+            [self.claim(), self.claim(), self.claim(), self.claim()],
+            ['high', 'high, queued second', 'low', None],
+        )
+        claimed = Job.objects.get(args=['high'])
+        self.assertEqual((claimed.status, claimed.attempts, claimed.locked_by), (Job.STATUS_RUNNING, 1, 'worker-1'))
+
+        Job.objects.filter(args=['later']).update(run_at=timezone.now())
+        self.assertEqual(self.claim(), 'later')
+
+    def test_respects_the_queue_concurrency_limit(self):
+        noop_job.schedule('alert 1', queue='soc', priority=20)
+        noop_job.schedule('alert 2', queue='soc', priority=20)
+        noop_job.schedule('report', queue='bulk', priority=0)
+
+        # soc runs one job at a time: its second job waits behind the lower-priority bulk job
+        self.assertEqual([self.claim('soc', 'bulk') for _ in range(3)], ['alert 1', 'report', None])
+        self.finish('alert 1')
+        self.assertEqual(self.claim('soc', 'bulk'), 'alert 2')
+
+    def test_failures_are_retried_with_backoff_then_marked_failed(self):
+        failing_job.delay()
+        with self.assertLogs('apps.core.jobs', 'WARNING'):
+            self.assertFalse(JobQueue.run(JobQueue.claim('worker-1', ['bulk'])))
+        job = Job.objects.get()
+        self.assertEqual((job.status, job.attempts), (Job.STATUS_QUEUED, 1))
+        self.assertGreaterEqual(job.run_at, timezone.now() + timedelta(seconds=3))  # 5 s +- 20% jitter
+        self.assertIn('upstream unavailable', job.last_error)
+        self.assertIsNone(JobQueue.claim('worker-1', ['bulk']))  # still backing off
+
+        Job.objects.update(run_at=timezone.now())
+        with self.assertLogs('apps.core.jobs', 'ERROR'):
+            self.assertFalse(JobQueue.run(JobQueue.claim('worker-1', ['bulk'])))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.STATUS_FAILED, 2))
+        self.assertIsNotNone(job.finished_at)
+        self.assertIsNone(JobQueue.claim('worker-1', ['bulk']))
+
+    def test_an_expired_lease_is_claimed_again(self):
+        noop_job.delay('orphaned')
+        self.assertEqual(self.claim(), 'orphaned')
+        self.assertIsNone(self.claim())  # leased to worker-1
+
+        Job.objects.update(locked_until=timezone.now() - timedelta(seconds=1))  # worker-1 died
+        job = JobQueue.claim('worker-2', ['bulk'])
+        self.assertEqual((job.locked_by, job.attempts), ('worker-2', 2))
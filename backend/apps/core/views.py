@@ -1 +1,40 @@
-﻿
\ No newline at end of file
+﻿"""
+Core API: bulk import runs (apps.core.imports).
+
+    GET  /api/core/imports/                 recent runs of the tenant
+    GET  /api/core/imports/<id>/            one run's progress and row errors
+    GET  /api/core/imports/resources/       importable resources and their columns
+    POST /api/core/imports/                 file=<...> resource=crm.clients [format, match, dry_run]
+"""
+from rest_framework import mixins, viewsets
+from rest_framework.decorators import action
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .imports import ImporterRegistry
+from .mixins import import_response
+from .models import ImportRun
+from .serializers import ImportRunSerializer
+from .services.base import BaseService
+
+
+class ImportRunViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    permission_classes = [IsAuthenticated]
+    serializer_class = ImportRunSerializer
+    parser_classes = [MultiPartParser, FormParser]
+
+    def get_queryset(self):
+        queryset = BaseService.filter_by_context(ImportRun.objects.select_related('user'), self.request)
+        tenant = BaseService.get_tenant_context(self.request)
+        return queryset.filter(tenant=tenant) if tenant else queryset
+
+    def create(self, request, *args, **kwargs):
+        return import_response(request, request.data.get('resource'))
+
+    @action(detail=False, methods=['get'])
+    def resources(self, request):
+        return Response([
+            {'resource': name, 'columns': importer.columns(), 'match': list(importer.match_choices)}
+            for name, importer in ImporterRegistry.all().items()
+        ])
@@ -0,0 +1,32 @@
+"""
+CRM bulk importers (apps.core.imports): clients, contacts and leads from CSV / JSON Lines.
+"""
+from apps.core.imports import ImporterRegistry, ModelImporter
+from .models import Client, Contact, Lead
+
+
+@ImporterRegistry.register
+class ClientImporter(ModelImporter):
+    name = 'crm.clients'
+    model = Client
+    fields = ('name', 'client_type', 'status', 'industry', 'website', 'email', 'phone', 'assigned_to')
+    match_choices = ('id', 'name', 'email')
+    lookups = {'assigned_to': 'email'}
+
+
+@ImporterRegistry.register
+class ContactImporter(ModelImporter):
+    name = 'crm.contacts'
+    model = Contact
+    fields = ('client', 'first_name', 'last_name', 'email', 'phone', 'job_title', 'role', 'is_primary')
+    match_choices = ('id', 'email', 'client,email')
+    lookups = {'client': 'name'}
+
+
+@ImporterRegistry.register
+class LeadImporter(ModelImporter):
+    name = 'crm.leads'
+    model = Lead
+    fields = ('title', 'contact', 'status', 'value', 'assigned_to')
+    match_choices = ('id', 'title')
+    lookups = {'contact': 'email', 'assigned_to': 'email'}
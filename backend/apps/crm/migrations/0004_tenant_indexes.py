@@ -0,0 +1,44 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:51
+
+import apps.core.migration_operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction on PostgreSQL
+    atomic = False
+
+    dependencies = [
+        ('crm', '0003_phase1_lifecycle_and_projects'),
+    ]
+
+    operations = [
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='client',
+            index=models.Index(fields=['tenant', 'is_deleted', 'created_at'], name='crm_client_tn_created_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='client',
+            index=models.Index(fields=['tenant', 'status'], name='crm_client_tn_status_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='contact',
+            index=models.Index(fields=['tenant', 'is_deleted', 'created_at'], name='crm_contact_tn_created_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='lead',
+            index=models.Index(fields=['tenant', 'is_deleted', 'created_at'], name='crm_lead_tn_created_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='lead',
+            index=models.Index(fields=['tenant', 'status'], name='crm_lead_tn_status_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='deal',
+            index=models.Index(fields=['tenant', 'is_deleted', 'created_at'], name='crm_deal_tn_created_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='deal',
+            index=models.Index(fields=['tenant', 'stage'], name='crm_deal_tn_stage_idx'),
+        ),
+    ]
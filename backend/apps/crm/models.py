@@ -1,5 +1,5 @@
 from django.db import models
-from apps.core.models import UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteModel, TenantAwareModel
+from apps.core.models import UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteModel, TenantAwareModel, tenant_indexes
 from django.conf import settings
 
 class Client(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteModel):
@@ -28,6 +28,7 @@ class Client(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel, SoftDelete
     class Meta:
         verbose_name = 'Client'
         verbose_name_plural = 'Clients'
+        indexes = tenant_indexes('crm_client', status_field='status')
 
     def __str__(self):
         return self.name
@@ -42,6 +43,9 @@ class Contact(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel, SoftDelet
     role = models.CharField(max_length=100, blank=True, help_text="e.g. Customer, Decision Maker")
     is_primary = models.BooleanField(default=False, help_text="Primary contact for the client")
 
+    class Meta:
+        indexes = tenant_indexes('crm_contact')
+
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
@@ -59,6 +63,9 @@ class Lead(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteMo
     value = models.DecimalField(max_digits=12, decimal_places=2, default=0.00)
     assigned_to = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='assigned_leads')
 
+    class Meta:
+        indexes = tenant_indexes('crm_lead', status_field='status')
+
     def __str__(self):
         return self.title
 
@@ -77,6 +84,9 @@ class Deal(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteMo
     expected_close_date = models.DateField(null=True, blank=True)
     assigned_to = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='assigned_deals')
 
+    class Meta:
+        indexes = tenant_indexes('crm_deal', status_field='stage')
+
     def __str__(self):
         return self.title
 
@@ -6,7 +6,7 @@ from django.db import transaction
 from django.db.models import Sum
 from apps.core.services.base import BaseService
 from apps.core.services.audit import AuditService
-from apps.core.signals import lifecycle_transition
+from apps.core.outbox import Outbox
 from .models import Client, Contact, Lead, Deal, Activity
 
 
@@ -46,7 +46,8 @@ class ClientService(BaseService):
         # Emit lifecycle event if status changed
         new_status = client.status
         if old_status != new_status:
-            lifecycle_transition.send(
+            Outbox.send(
+                'lifecycle_transition',
                 sender=Client,
                 client=client,
                 old_status=old_status,
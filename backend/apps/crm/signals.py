@@ -1,32 +1,8 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-@receiver(post_save, sender='store.Order')
-def sync_store_order_to_crm(sender, instance, created, **kwargs):
-    """
-    Auto-creates or updates a CRM Client profile when a new Store Order is placed.
-    """
-    if created and instance.customer:
-        from apps.crm.models import Client, Contact
-        
-        customer = instance.customer
-        client, _ = Client.objects.get_or_create(
-            name=f"{customer.user.first_name} {customer.user.last_name}".strip() or customer.user.email.split('@')[0],
-            defaults={
-                'client_type': 'individual',
-                'status': 'active'
-            }
-        )
-        
-        Contact.objects.get_or_create(
-            client=client,
-            email=customer.user.email,
-            defaults={
-                'first_name': customer.user.first_name,
-                'last_name': customer.user.last_name,
-                'is_primary': True
-            }
-        )
+# store.Order → CRM Client/Contact sync is handled once, by the OrderCreated
+# subscriber in apps.core.signals (sync_crm_client_from_order).
 
 @receiver(post_save, sender='support.Ticket')
 def link_support_to_crm(sender, instance, created, **kwargs):
@@ -8,6 +8,7 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework import status
 from .models import Client, Contact, Lead, Deal, Activity
+from apps.core.mixins import BulkImportMixin, SparseFieldsMixin
 from .serializers import (
     ClientSerializer, ContactSerializer, LeadSerializer,
     DealSerializer, ActivitySerializer,
@@ -15,9 +16,10 @@ from .serializers import (
 from .services import ClientService, ContactService, LeadService, DealService, ActivityService
 
 
-class ClientViewSet(viewsets.ModelViewSet):
+class ClientViewSet(BulkImportMixin, SparseFieldsMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = ClientSerializer
+    import_resource = 'crm.clients'
 
     def get_queryset(self):
         return ClientService.get_queryset(self.request)
@@ -45,17 +47,19 @@ class ClientViewSet(viewsets.ModelViewSet):
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class ContactViewSet(viewsets.ModelViewSet):
+class ContactViewSet(BulkImportMixin, SparseFieldsMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = ContactSerializer
+    import_resource = 'crm.contacts'
 
     def get_queryset(self):
         return ContactService.get_queryset(self.request)
 
 
-class LeadViewSet(viewsets.ModelViewSet):
+class LeadViewSet(BulkImportMixin, SparseFieldsMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = LeadSerializer
+    import_resource = 'crm.leads'
 
     def get_queryset(self):
         return LeadService.get_queryset(self.request)
@@ -64,7 +68,7 @@ class LeadViewSet(viewsets.ModelViewSet):
         LeadService.create_lead(self.request, serializer.validated_data)
 
 
-class DealViewSet(viewsets.ModelViewSet):
+class DealViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = DealSerializer
 
@@ -78,7 +82,7 @@ class DealViewSet(viewsets.ModelViewSet):
         DealService.update_deal(self.request, self.get_object(), serializer.validated_data)
 
 
-class ActivityViewSet(viewsets.ModelViewSet):
+class ActivityViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = ActivitySerializer
 
@@ -1,253 +1,306 @@
+import logging
+from functools import partial
+
 from django.db.models import Sum, Count, Q
 from django.utils import timezone
 from datetime import timedelta
 
+from apps.core.fanout import FanOut
+from apps.core.kpis import KPICounters
+from apps.core.result_cache import ResultCache
+
+logger = logging.getLogger(__name__)
+
+
+def _scoped(model, tenant, lookup='tenant'):
+    queryset = model.objects.all()
+    if tenant:
+        queryset = queryset.filter(**{lookup: tenant})
+    return queryset
+
+
+def _aggregate(queryset, **aggregates):
+    """One query for all of a model's figures; empty sums come back as 0."""
+    return {key: value or 0 for key, value in queryset.aggregate(**aggregates).items()}
+
 
 class CommandCenterAnalyticsService:
+    # Models each module's figures are derived from; a change refreshes that module's cached section
+    MODULE_MODELS = {
+        'crm': ['crm.Client', 'crm.Deal'],
+        'store': ['store.Order'],
+        'erp': ['erp.Invoice', 'erp.Payment'],
+        'support': ['support.Ticket'],
+        'marketing': ['marketing.Campaign'],
+        'security': ['soc.Alert', 'soc.Incident', 'soc.ManagedEndpoint'],
+        'hrm': ['hrm.Employee', 'hrm.LeaveRequest'],
+        'scm': ['scm.PurchaseOrder', 'scm.InventoryItem'],
+        'contracts': ['contracts.ServiceContract', 'contracts.SLABreach'],
+        'projects': ['projects.Project', 'projects.Task'],
+        'itam': ['itam.Asset'],
+        'approvals': ['approvals.ApprovalRequest'],
+        'itsm': ['itsm.ChangeRequest'],
+        'documents': ['documents.Document'],
+    }
+    # Every model get_global_metrics reads; CommandCenterView's ETag tracks their changes
+    METRIC_MODELS = [label for labels in MODULE_MODELS.values() for label in labels]
+
+    # Module key -> (collector, figures reported when the collector fails)
+    MODULES = {
+        'crm': ('_crm', {"active_clients": 0, "total_clients": 0, "recent_revenue": 0.0, "open_deals": 0}),
+        'store': ('_store', {"lifetime_revenue": 0.0, "monthly_revenue": 0.0, "pending_orders": 0, "total_orders": 0}),
+        'erp': ('_erp', {"overdue_invoices": 0, "open_invoices": 0, "monthly_collected": 0.0}),
+        'support': ('_support', {"open_tickets": 0, "critical_tickets": 0, "resolved_today": 0}),
+        'marketing': ('_marketing', {"active_campaigns": 0, "total_campaigns": 0}),
+        'security': ('_security', {
+            "open_alerts": 0, "critical_alerts": 0,
+            "open_incidents": 0, "managed_endpoints": 0, "at_risk_endpoints": 0,
+        }),
+        'hrm': ('_hrm', {"headcount": 0, "pending_leaves": 0}),
+        'scm': ('_scm', {"pending_orders": 0, "low_stock_items": 0, "total_vendors": 0}),
+        'contracts': ('_contracts', {"active_contracts": 0, "expiring_soon": 0, "sla_breaches": 0}),
+        'projects': ('_projects', {"active_projects": 0, "total_projects": 0, "overdue_tasks": 0}),
+        'itam': ('_itam', {"total_assets": 0, "active_assets": 0}),
+        'approvals': ('_approvals', {"pending": 0, "approved_today": 0, "total": 0}),
+        'itsm': ('_itsm', {"open_changes": 0, "high_risk": 0, "completed": 0}),
+        'documents': ('_documents', {"total": 0, "archived": 0}),
+    }
+
+    # Incrementally maintained counters (apps.core.kpis) the collectors read
+    KPI_KEYS = [
+        'crm.clients', 'crm.clients.active', 'crm.deals.open',
+        'store.orders', 'store.orders.pending',
+        'erp.invoices.overdue', 'erp.invoices.unpaid',
+        'support.tickets.open', 'support.tickets.critical',
+        'marketing.campaigns', 'marketing.campaigns.active',
+        'soc.alerts.unresolved', 'soc.alerts.critical', 'soc.incidents.active',
+        'soc.endpoints.online', 'soc.endpoints.at_risk',
+        'hrm.employees.active', 'hrm.leaves.pending',
+        'scm.purchase_orders.pending', 'scm.inventory.low_stock',
+        'contracts.active', 'projects', 'projects.active',
+        'itam.assets', 'itam.assets.active', 'approvals', 'approvals.pending',
+        'itsm.changes.open', 'itsm.changes.high_risk', 'itsm.changes.completed',
+        'documents', 'documents.archived',
+    ]
+
     @classmethod
     def get_global_metrics(cls, tenant=None):
         """
-        Gathers high-level KPIs across all 9 deployed modules for the BFF
+        Gathers high-level KPIs across all deployed modules for the BFF
         Command Center. Tenant-scoped when tenant is provided.
+
+        State counts come from the KPI counters in one query, whatever the
+        table sizes; only time-windowed figures (revenue over 30 days,
+        resolved today, ...) are aggregated from their tables, one module per
+        fan-out thread (apps.core.fanout), so the slowest module bounds the
+        response. A module that fails or times out reports zeros, is logged
+        and is listed under "errors" (module -> exception class) instead of
+        taking the whole dashboard down.
         """
-        now = timezone.now()
-        thirty_days_ago = now - timedelta(days=30)
+        return cls.combine(cls.get_module_metrics(list(cls.MODULES), tenant))
 
-        metrics = {}
+    @classmethod
+    def get_cached_metrics(cls, tenant=None):
+        """
+        (metrics, freshness): get_global_metrics served through the per-tenant
+        stale-while-revalidate cache (apps.core.result_cache), one section per
+        module, refreshed when its MODULE_MODELS change or its soft TTL passes.
+        A module that times out is not cached: its last cached figures are
+        served (listed in freshness["stale_sections"]) until a later read,
+        after the abandoned run finished, computes it again. Without cached
+        figures it reports zeros under "errors".
+        """
+        def compute(modules):
+            results = cls.get_module_metrics(modules, tenant)
+            return {module: result for module, result in results.items() if result[1] != 'TimeoutError'}
 
-        # ── 1. CRM ────────────────────────────────────────────────────────────
-        try:
-            from apps.crm.models import Client, Deal
-            clients = Client.objects.all()
-            deals = Deal.objects.all()
-            if tenant:
-                clients = clients.filter(tenant=tenant)
-                deals = deals.filter(tenant=tenant)
-            metrics["crm"] = {
-                "active_clients": clients.filter(status="active").count(),
-                "total_clients": clients.count(),
-                "recent_revenue": float(
-                    deals.filter(stage="won", updated_at__gte=thirty_days_ago)
-                    .aggregate(total=Sum("amount"))["total"] or 0
-                ),
-                "open_deals": deals.filter(stage__in=["discovery", "proposal", "negotiation"]).count(),
-            }
-        except Exception:
-            metrics["crm"] = {"active_clients": 0, "total_clients": 0, "recent_revenue": 0.0, "open_deals": 0}
+        sections, freshness = ResultCache.get(
+            'dashboard.command_center', getattr(tenant, 'pk', None), cls.MODULE_MODELS, compute,
+        )
+        # A section is only missing when its module timed out and had no cached figures
+        results = {
+            module: sections.get(module) or (dict(empty), 'TimeoutError')
+            for module, (_, empty) in cls.MODULES.items()
+        }
+        return cls.combine(results), freshness
 
-        # ── 2. Commerce / Store ───────────────────────────────────────────────
+    @classmethod
+    def get_module_metrics(cls, modules, tenant=None):
+        """{module: (figures, exception class name or None)} for the given modules."""
+        now = timezone.now()
         try:
-            from apps.store.models import Order
-            orders = Order.objects.all()
-            if tenant:
-                orders = orders.filter(tenant=tenant)
-            metrics["store"] = {
-                "lifetime_revenue": float(
-                    orders.filter(status="completed").aggregate(total=Sum("total_amount"))["total"] or 0
-                ),
-                "monthly_revenue": float(
-                    orders.filter(status="completed", created_at__gte=thirty_days_ago)
-                    .aggregate(total=Sum("total_amount"))["total"] or 0
-                ),
-                "pending_orders": orders.filter(status__in=["pending", "processing"]).count(),
-                "total_orders": orders.count(),
-            }
+            kpi = KPICounters.get(cls.KPI_KEYS, tenant)
         except Exception:
-            metrics["store"] = {"lifetime_revenue": 0.0, "monthly_revenue": 0.0, "pending_orders": 0, "total_orders": 0}
+            logger.exception('Reading Command Center KPI counters failed')
+            kpi = {}
+        collected, failures = FanOut.run({
+            f'dashboard.{module}': partial(getattr(cls, cls.MODULES[module][0]), tenant, now, kpi)
+            for module in modules
+        }, scope=tenant.pk if tenant else None)
+        results = {}
+        for module in modules:
+            name = f'dashboard.{module}'
+            if name in collected:
+                results[module] = (collected[name], None)
+                continue
+            exc = failures[name]
+            if not isinstance(exc, TimeoutError):  # FanOut already logged the timeout
+                logger.error('Command Center metrics for %s failed', module, exc_info=exc)
+            results[module] = (dict(cls.MODULES[module][1]), type(exc).__name__)
+        return results
 
-        # ── 3. ERP / Finance ──────────────────────────────────────────────────
-        try:
-            from apps.erp.models import Invoice, Payment
-            invoices = Invoice.objects.all()
-            payments = Payment.objects.all()
-            if tenant:
-                invoices = invoices.filter(tenant=tenant)
-                payments = payments.filter(tenant=tenant)
-            metrics["erp"] = {
-                "overdue_invoices": invoices.filter(status="overdue").count(),
-                "open_invoices": invoices.filter(status="unpaid").count(),
-                "monthly_collected": float(
-                    payments.filter(created_at__gte=thirty_days_ago)
-                    .aggregate(total=Sum("amount"))["total"] or 0
-                ),
-            }
-        except Exception:
-            metrics["erp"] = {"overdue_invoices": 0, "open_invoices": 0, "monthly_collected": 0.0}
+    @classmethod
+    def combine(cls, results):
+        metrics = {module: figures for module, (figures, _) in results.items()}
+        errors = {module: error for module, (_, error) in results.items() if error}
+        if errors:
+            metrics["errors"] = errors
+        return metrics
 
-        # ── 4. Support / Help Desk ────────────────────────────────────────────
-        try:
-            from apps.support.models import Ticket
-            tickets = Ticket.objects.all()
-            if tenant:
-                tickets = tickets.filter(tenant=tenant)
-            metrics["support"] = {
-                "open_tickets": tickets.filter(status__in=["open", "in_progress"]).count(),
-                "critical_tickets": tickets.filter(priority="critical", status__in=["open", "in_progress"]).count(),
-                "resolved_today": tickets.filter(
-                    status="resolved", updated_at__date=now.date()
-                ).count(),
-            }
-        except Exception:
-            metrics["support"] = {"open_tickets": 0, "critical_tickets": 0, "resolved_today": 0}
+    # ── 1. CRM ────────────────────────────────────────────────────────────────
+    @classmethod
+    def _crm(cls, tenant, now, kpi):
+        from apps.crm.models import Deal
+        deals = _aggregate(
+            _scoped(Deal, tenant).filter(stage="won", updated_at__gte=now - timedelta(days=30)),
+            recent_revenue=Sum("amount"),
+        )
+        return {
+            "active_clients": kpi["crm.clients.active"],
+            "total_clients": kpi["crm.clients"],
+            "recent_revenue": float(deals["recent_revenue"]),
+            "open_deals": kpi["crm.deals.open"],
+        }
 
-        # ── 5. Marketing ──────────────────────────────────────────────────────
-        try:
-            from apps.marketing.models import Campaign
-            campaigns = Campaign.objects.all()
-            if tenant:
-                campaigns = campaigns.filter(tenant=tenant)
-            metrics["marketing"] = {
-                "active_campaigns": campaigns.filter(status="active").count(),
-                "total_campaigns": campaigns.count(),
-            }
-        except Exception:
-            metrics["marketing"] = {"active_campaigns": 0, "total_campaigns": 0}
+    # ── 2. Commerce / Store ───────────────────────────────────────────────────
+    @classmethod
+    def _store(cls, tenant, now, kpi):
+        from apps.store.models import Order
+        orders = _aggregate(
+            _scoped(Order, tenant).filter(status="completed"),
+            lifetime=Sum("total_amount"),
+            monthly=Sum("total_amount", filter=Q(created_at__gte=now - timedelta(days=30))),
+        )
+        return {
+            "lifetime_revenue": float(orders["lifetime"]),
+            "monthly_revenue": float(orders["monthly"]),
+            "pending_orders": kpi["store.orders.pending"],
+            "total_orders": kpi["store.orders"],
+        }
 
-        # ── 6. Security (SOC) ─────────────────────────────────────────────────
-        try:
-            from apps.soc.models import Alert, Incident, ManagedEndpoint
-            alerts = Alert.objects.all()
-            incidents = Incident.objects.all()
-            endpoints = ManagedEndpoint.objects.all()
-            if tenant:
-                alerts = alerts.filter(tenant=tenant)
-                incidents = incidents.filter(tenant=tenant)
-                endpoints = endpoints.filter(workspace__tenant=tenant)
-            metrics["security"] = {
-                "open_alerts": alerts.filter(is_resolved=False).count(),
-                "critical_alerts": alerts.filter(is_resolved=False, severity="critical").count(),
-                "open_incidents": incidents.filter(status__in=["open", "investigating", "contained"]).count(),
-                "managed_endpoints": endpoints.filter(status="online").count(),
-                "at_risk_endpoints": endpoints.filter(status="at_risk").count(),
-            }
-        except Exception:
-            metrics["security"] = {
-                "open_alerts": 0, "critical_alerts": 0,
-                "open_incidents": 0, "managed_endpoints": 0, "at_risk_endpoints": 0,
-            }
+    # ── 3. ERP / Finance ──────────────────────────────────────────────────────
+    @classmethod
+    def _erp(cls, tenant, now, kpi):
+        from apps.erp.models import Payment
+        payments = _aggregate(
+            _scoped(Payment, tenant).filter(created_at__gte=now - timedelta(days=30)),
+            collected=Sum("amount"),
+        )
+        return {
+            "overdue_invoices": kpi["erp.invoices.overdue"],
+            "open_invoices": kpi["erp.invoices.unpaid"],
+            "monthly_collected": float(payments["collected"]),
+        }
 
-        # ── 7. HRM ────────────────────────────────────────────────────────────
-        try:
-            from apps.hrm.models import Employee, LeaveRequest
-            employees = Employee.objects.all()
-            leaves = LeaveRequest.objects.all()
-            if tenant:
-                employees = employees.filter(tenant=tenant)
-                leaves = leaves.filter(tenant=tenant)
-            metrics["hrm"] = {
-                "headcount": employees.filter(status="active").count(),
-                "pending_leaves": leaves.filter(status="pending").count(),
-            }
-        except Exception:
-            metrics["hrm"] = {"headcount": 0, "pending_leaves": 0}
+    # ── 4. Support / Help Desk ────────────────────────────────────────────────
+    @classmethod
+    def _support(cls, tenant, now, kpi):
+        from apps.support.models import Ticket
+        resolved_today = _scoped(Ticket, tenant).filter(status="resolved", updated_at__date=now.date())
+        return {
+            "open_tickets": kpi["support.tickets.open"],
+            "critical_tickets": kpi["support.tickets.critical"],
+            "resolved_today": resolved_today.count(),
+        }
 
-        # ── 8. SCM ────────────────────────────────────────────────────────────
-        try:
-            from apps.scm.models import PurchaseOrder, InventoryItem
-            pos = PurchaseOrder.objects.all()
-            items = InventoryItem.objects.all()
-            if tenant:
-                pos = pos.filter(tenant=tenant)
-                items = items.filter(tenant=tenant)
-            metrics["scm"] = {
-                "pending_orders": pos.filter(status__in=["draft", "sent"]).count(),
-                "low_stock_items": items.filter(quantity_on_hand__lte=10).count(),
-                "total_vendors": pos.values("vendor").distinct().count(),
-            }
-        except Exception:
-            metrics["scm"] = {"pending_orders": 0, "low_stock_items": 0, "total_vendors": 0}
+    # ── 5. Marketing ──────────────────────────────────────────────────────────
+    @classmethod
+    def _marketing(cls, tenant, now, kpi):
+        return {
+            "active_campaigns": kpi["marketing.campaigns.active"],
+            "total_campaigns": kpi["marketing.campaigns"],
+        }
 
-        # ── 9. Contracts & SLA ────────────────────────────────────────────────
-        try:
-            from apps.contracts.models import ServiceContract, SLABreach
-            contracts = ServiceContract.objects.all()
-            breaches = SLABreach.objects.all()
-            if tenant:
-                contracts = contracts.filter(tenant=tenant)
-                breaches = breaches.filter(tenant=tenant)
-            metrics["contracts"] = {
-                "active_contracts": contracts.filter(status="active").count(),
-                "expiring_soon": contracts.filter(
-                    status="active", end_date__lte=now + timedelta(days=30)
-                ).count(),
-                "sla_breaches": breaches.filter(resolved=False).count(),
-            }
-        except Exception:
-            metrics["contracts"] = {"active_contracts": 0, "expiring_soon": 0, "sla_breaches": 0}
+    # ── 6. Security (SOC) ─────────────────────────────────────────────────────
+    @classmethod
+    def _security(cls, tenant, now, kpi):
+        return {
+            "open_alerts": kpi["soc.alerts.unresolved"],
+            "critical_alerts": kpi["soc.alerts.critical"],
+            "open_incidents": kpi["soc.incidents.active"],
+            "managed_endpoints": kpi["soc.endpoints.online"],
+            "at_risk_endpoints": kpi["soc.endpoints.at_risk"],
+        }
 
-        # ── 10. Projects / PSA ─────────────────────────────────────────────────
-        try:
-            from apps.projects.models import Project, Task
-            projects = Project.objects.all()
-            tasks = Task.objects.all()
-            if tenant:
-                projects = projects.filter(tenant=tenant)
-                tasks = tasks.filter(tenant=tenant)
-            metrics["projects"] = {
-                "active_projects": projects.filter(status__in=["active", "in_progress"]).count(),
-                "total_projects": projects.count(),
-                "overdue_tasks": tasks.filter(
-                    status__in=["todo", "in_progress"],
-                    due_date__lt=now
-                ).count() if hasattr(Task, 'due_date') else 0,
-            }
-        except Exception:
-            metrics["projects"] = {"active_projects": 0, "total_projects": 0, "overdue_tasks": 0}
+    # ── 7. HRM ────────────────────────────────────────────────────────────────
+    @classmethod
+    def _hrm(cls, tenant, now, kpi):
+        return {
+            "headcount": kpi["hrm.employees.active"],
+            "pending_leaves": kpi["hrm.leaves.pending"],
+        }
 
-        # ── 11. ITAM (IT Asset Management) ─────────────────────────────────────
-        try:
-            from apps.itam.models import Asset
-            assets = Asset.objects.all()
-            if tenant:
-                assets = assets.filter(tenant=tenant)
-            metrics["itam"] = {
-                "total_assets": assets.count(),
-                "active_assets": assets.filter(status="active").count() if hasattr(Asset, 'status') else assets.count(),
-            }
-        except Exception:
-            metrics["itam"] = {"total_assets": 0, "active_assets": 0}
+    # ── 8. SCM ────────────────────────────────────────────────────────────────
+    @classmethod
+    def _scm(cls, tenant, now, kpi):
+        from apps.scm.models import PurchaseOrder
+        vendors = _aggregate(_scoped(PurchaseOrder, tenant), total=Count("vendor", distinct=True))
+        return {
+            "pending_orders": kpi["scm.purchase_orders.pending"],
+            "low_stock_items": kpi["scm.inventory.low_stock"],
+            "total_vendors": vendors["total"],
+        }
 
-        # ── 12. Approvals ──────────────────────────────────────────────────────
-        try:
-            from apps.approvals.models import ApprovalRequest
-            approvals = ApprovalRequest.objects.all()
-            if tenant:
-                approvals = approvals.filter(tenant=tenant)
-            metrics["approvals"] = {
-                "pending": approvals.filter(status="pending").count(),
-                "approved_today": approvals.filter(
-                    status="approved", decided_at__date=now.date()
-                ).count(),
-                "total": approvals.count(),
-            }
-        except Exception:
-            metrics["approvals"] = {"pending": 0, "approved_today": 0, "total": 0}
+    # ── 9. Contracts & SLA ────────────────────────────────────────────────────
+    @classmethod
+    def _contracts(cls, tenant, now, kpi):
+        from apps.contracts.models import ServiceContract, SLABreach
+        expiring = _scoped(ServiceContract, tenant).filter(status="active", end_date__lte=now + timedelta(days=30))
+        # Breaches carry no tenant of their own; an open breach is one not yet acknowledged
+        breaches = _scoped(SLABreach, tenant, "contract__tenant").filter(acknowledged=False)
+        return {
+            "active_contracts": kpi["contracts.active"],
+            "expiring_soon": expiring.count(),
+            "sla_breaches": breaches.count(),
+        }
 
-        # ── 13. ITSM (Change Management) ───────────────────────────────────────
-        try:
-            from apps.itsm.models import ChangeRequest
-            changes = ChangeRequest.objects.all()
-            if tenant:
-                changes = changes.filter(tenant=tenant)
-            metrics["itsm"] = {
-                "open_changes": changes.filter(status__in=["draft", "submitted", "in_progress"]).count(),
-                "high_risk": changes.filter(risk_level="high", status__in=["draft", "submitted"]).count(),
-                "completed": changes.filter(status="completed").count(),
-            }
-        except Exception:
-            metrics["itsm"] = {"open_changes": 0, "high_risk": 0, "completed": 0}
+    # ── 10. Projects / PSA ────────────────────────────────────────────────────
+    @classmethod
+    def _projects(cls, tenant, now, kpi):
+        from apps.projects.models import Task
+        overdue = _scoped(Task, tenant).filter(status__in=["todo", "in_progress"], due_date__lt=now)
+        return {
+            "active_projects": kpi["projects.active"],
+            "total_projects": kpi["projects"],
+            "overdue_tasks": overdue.count(),
+        }
 
-        # ── 14. Documents ──────────────────────────────────────────────────────
-        try:
-            from apps.documents.models import Document
-            docs = Document.objects.all()
-            if tenant:
-                docs = docs.filter(tenant=tenant)
-            metrics["documents"] = {
-                "total": docs.count(),
-                "archived": docs.filter(is_archived=True).count(),
-            }
-        except Exception:
-            metrics["documents"] = {"total": 0, "archived": 0}
+    # ── 11. ITAM (IT Asset Management) ────────────────────────────────────────
+    @classmethod
+    def _itam(cls, tenant, now, kpi):
+        return {"total_assets": kpi["itam.assets"], "active_assets": kpi["itam.assets.active"]}
 
-        return metrics
+    # ── 12. Approvals ─────────────────────────────────────────────────────────
+    @classmethod
+    def _approvals(cls, tenant, now, kpi):
+        from apps.approvals.models import ApprovalRequest
+        approved_today = _scoped(ApprovalRequest, tenant).filter(status="approved", decided_at__date=now.date())
+        return {
+            "pending": kpi["approvals.pending"],
+            "approved_today": approved_today.count(),
+            "total": kpi["approvals"],
+        }
+
+    # ── 13. ITSM (Change Management) ──────────────────────────────────────────
+    @classmethod
+    def _itsm(cls, tenant, now, kpi):
+        return {
+            "open_changes": kpi["itsm.changes.open"],
+            "high_risk": kpi["itsm.changes.high_risk"],
+            "completed": kpi["itsm.changes.completed"],
+        }
+
+    # ── 14. Documents ─────────────────────────────────────────────────────────
+    @classmethod
+    def _documents(cls, tenant, now, kpi):
+        return {"total": kpi["documents"], "archived": kpi["documents.archived"]}
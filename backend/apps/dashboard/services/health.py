@@ -1,38 +1,53 @@
 import os
 import platform
-from django.db import connection
-from django.db.utils import OperationalError
+from apps.core.events import EventBus
+from apps.core import host_metrics
+from apps.core.host_metrics import HostMetrics
+from apps.core.jobs import JobQueue
+from apps.core.outbox import Outbox
+from apps.core.services.audit_buffer import AuditBuffer
+from apps.tenants.cache import TenantCache
 
 class SystemHealthService:
     @classmethod
-    def get_system_status(cls):
+    def get_system_status(cls, history_minutes=15):
         """
         Retrieves core infrastructure metrics for the Admin Command Center.
         Uses standard library instead of psutil to avoid C-bindings.
+        Figures come from the host metrics sampler (apps.core.host_metrics),
+        so the database is not queried; "history" holds the samples of the
+        last history_minutes, oldest first. Figures are None until the
+        sampler's first sample (or with it disabled).
         """
-        db_status = 'Healthy'
-        try:
-            connection.ensure_connection()
-        except OperationalError:
-            db_status = 'Unreachable'
-
-        # Basic OS/Container Resource Metrics (Simulated/Standard Lib)
-        cpu_usage = 0.0
-        if hasattr(os, 'getloadavg'):
-            try:
-                cpu_usage = round((os.getloadavg()[0] / os.cpu_count()) * 100, 2)
-            except Exception:
-                pass
+        sample = HostMetrics.current()
+        ping_ms = sample['db_ping_ms'] if sample else None
+        if sample is None or not host_metrics.config()['DB_PING']:
+            db_status = 'Unchecked'
+        else:
+            db_status = 'Unreachable' if ping_ms is None else 'Healthy'
+        sample = sample or dict.fromkeys(HostMetrics.FIELDS)
 
         return {
             "database": {
-                "status": db_status
+                "status": db_status,
+                "ping_ms": ping_ms,
             },
             "infrastructure": {
-                "cpu_percent": cpu_usage,
-                "memory_percent": 45.0,  # Placeholder or implement via /proc/meminfo
-                "disk_usage": 60.0       # Placeholder
+                "cpu_percent": sample['cpu_percent'],
+                "memory_percent": sample['memory_percent'],
+                "memory_available_mb": sample['memory_available_mb'],
+                "disk_usage": sample['disk_percent'],
+                "disk_free_gb": sample['disk_free_gb'],
+                "worker_rss_mb": sample['rss_mb'],
+                "error_rate": sample['error_rate'],
+                "sampled_at": sample['at'],
             },
+            "history": HostMetrics.history(history_minutes),
+            "audit_buffer": AuditBuffer.stats(),
+            "tenant_cache": TenantCache.stats(),
+            "event_bus": EventBus.stats(),
+            "outbox": Outbox.stats(),
+            "jobs": JobQueue.stats(),
             "platform": {
                 "version": "1.0.0-enterprise",
                 "environment": os.getenv("DJANGO_ENV", "production")
@@ -1,8 +1,9 @@
 from django.urls import path
-from .views import CommandCenterView, SystemHealthView, MRRView
+from .views import CommandCenterView, SystemHealthView, PerformanceMetricsView, MRRView
 
 urlpatterns = [
     path('metrics/', CommandCenterView.as_view(), name='command-center-metrics'),
     path('health/', SystemHealthView.as_view(), name='system-health-status'),
+    path('performance/', PerformanceMetricsView.as_view(), name='performance-metrics'),
     path('mrr/', MRRView.as_view(), name='executive-mrr'),
 ]
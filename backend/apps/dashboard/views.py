@@ -4,33 +4,47 @@ from rest_framework.permissions import IsAuthenticated
 
 from .services.analytics import CommandCenterAnalyticsService
 from .services.health import SystemHealthService
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.observability import RouteStats
 
-class CommandCenterView(APIView):
+class CommandCenterView(ConditionalGetMixin, APIView):
     """
     BFF View: Exposes aggregated business metrics for the Command Center.
     Requires Tenant isolation if a Tenant user is requesting it,
     or returns global stats if SuperAdmin.
+    Polls with If-None-Match get a 304 until one of the metric models changes.
+    Figures come from a per-tenant stale-while-revalidate cache; "freshness"
+    says how old they are. "degraded" is true when a module failed or timed
+    out and reports zeros (listed under data["errors"]).
     """
     permission_classes = [IsAuthenticated]
+    etag_models = CommandCenterAnalyticsService.METRIC_MODELS
+    etag_max_age = 300  # 30-day windows move even when nothing is written
 
     def get(self, request):
         tenant = getattr(request, 'tenant', None)
         # If user is admin (staff/superuser) and explicitly choosing no tenant, see global stats
         if request.user.is_staff and not tenant:
-            metrics = CommandCenterAnalyticsService.get_global_metrics(tenant=None)
+            metrics, freshness = CommandCenterAnalyticsService.get_cached_metrics(tenant=None)
         else:
             # Tenant-scoped dashboard
-            metrics = CommandCenterAnalyticsService.get_global_metrics(tenant=tenant)
-            
+            metrics, freshness = CommandCenterAnalyticsService.get_cached_metrics(tenant=tenant)
+        degraded = "errors" in metrics
+        if freshness['stale'] or degraded:
+            # Stale or partial figures must not be pinned by a 304 against the current ETag
+            self.conditional_validators = None
+
         return Response({
             "status": "success",
-            "data": metrics
+            "data": metrics,
+            "freshness": freshness,
+            "degraded": degraded,
         })
 
 class SystemHealthView(APIView):
     """
     BFF View: Exposes infrastructure metrics (CPU, DB, Memory).
-    Restricted to SuperAdmins.
+    Restricted to SuperAdmins. ?history=<minutes> sizes the sample history (default 15).
     """
     permission_classes = [IsAuthenticated]
 
@@ -38,12 +52,40 @@ class SystemHealthView(APIView):
         if not request.user.is_staff:
             return Response({"error": "Forbidden: Requires System Administrator privileges"}, status=403)
             
-        health_data = SystemHealthService.get_system_status()
+        try:
+            history_minutes = max(int(request.query_params.get('history', 15)), 0)
+        except ValueError:
+            return Response({"error": "history must be a number of minutes"}, status=400)
+        health_data = SystemHealthService.get_system_status(history_minutes=history_minutes)
         return Response({
             "status": "success",
             "data": health_data
         })
 
+class PerformanceMetricsView(APIView):
+    """
+    Per-route latency histograms (p50/p95/p99), query counts and serializer
+    time collected by RequestLoggingMiddleware in this worker process.
+    Restricted to staff. ?route=/api/store/ filters, DELETE resets.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if not request.user.is_staff:
+            return Response({"error": "Forbidden: Requires System Administrator privileges"}, status=403)
+
+        return Response({
+            "status": "success",
+            "data": RouteStats.snapshot(prefix=request.query_params.get('route'))
+        })
+
+    def delete(self, request):
+        if not request.user.is_staff:
+            return Response({"error": "Forbidden: Requires System Administrator privileges"}, status=403)
+
+        RouteStats.reset()
+        return Response({"status": "success"})
+
 class MRRView(APIView):
     """
     BFF View: Exposes Executive MRR Revenue and Churn metrics.
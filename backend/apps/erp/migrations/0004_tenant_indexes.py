@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:51
+
+import apps.core.migration_operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction on PostgreSQL
+    atomic = False
+
+    dependencies = [
+        ('erp', '0003_phase1_lifecycle_and_projects'),
+    ]
+
+    operations = [
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='invoice',
+            index=models.Index(fields=['tenant', 'is_deleted', 'created_at'], name='erp_invoice_tn_created_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='invoice',
+            index=models.Index(fields=['tenant', 'status'], name='erp_invoice_tn_status_idx'),
+        ),
+    ]
@@ -1,5 +1,5 @@
 from django.db import models
-from apps.core.models import UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteModel, TenantAwareModel
+from apps.core.models import UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteModel, TenantAwareModel, tenant_indexes
 from django.conf import settings
 
 class Invoice(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteModel):
@@ -21,6 +21,7 @@ class Invoice(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel, SoftDelet
         verbose_name = 'Invoice'
         verbose_name_plural = 'Invoices'
         unique_together = ('tenant', 'invoice_number')
+        indexes = tenant_indexes('erp_invoice', status_field='status')
 
     def __str__(self):
         return f"{self.invoice_number} - {self.client.name}"
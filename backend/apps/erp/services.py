@@ -7,6 +7,7 @@ from django.db.models import Sum
 from django.utils import timezone
 from apps.core.services.base import BaseService
 from apps.core.services.audit import AuditService
+from apps.core.result_cache import ResultCache
 from .models import Invoice, Payment, Expense, InternalProject
 
 
@@ -14,23 +15,31 @@ class EnterpriseService(BaseService):
     """
     High-level Enterprise operations and dashboard statistics.
     """
+    # Dashboard section -> models it is derived from (stale-while-revalidate cache, apps.core.result_cache)
+    DASHBOARD_SECTIONS = {
+        'kpi': ['erp.InternalProject', 'scm.PurchaseOrder', 'itam.Asset', 'erp.Invoice'],
+        'financials': ['erp.Invoice', 'erp.Payment', 'erp.Expense'],
+        'system': [],
+    }
+
     @classmethod
     def get_dashboard_stats(cls, request):
         """
         Aggregates operational and financial KPIs across the Enterprise.
+        Served from the per-tenant result cache; "freshness" says how old the figures are.
         """
         tenant = cls.get_tenant_context(request)
-        today = timezone.now().date()
-        
+        stats, freshness = ResultCache.get(
+            'erp.dashboard', getattr(tenant, 'pk', None), cls.DASHBOARD_SECTIONS,
+            lambda sections: {section: getattr(cls, f'_dashboard_{section}')(tenant) for section in sections},
+        )
+        return {**stats, "freshness": freshness}
+
+    @classmethod
+    def _dashboard_kpi(cls, tenant):
         # --- Operations Stats ---
-        active_projects = InternalProject.objects.filter(tenant=tenant, status='active')
-        active_projects_count = active_projects.count()
-        
-        # Financials from ERP
-        total_invoiced = Invoice.objects.filter(tenant=tenant).aggregate(total=Sum('amount'))['total'] or 0
-        total_paid = Payment.objects.filter(invoice__tenant=tenant).aggregate(total=Sum('amount'))['total'] or 0
-        total_expenses = Expense.objects.filter(tenant=tenant).aggregate(total=Sum('amount'))['total'] or 0
-        
+        active_projects_count = InternalProject.objects.filter(tenant=tenant, status='active').count()
+
         # SCM and ITAM Integration (Lazy imports to avoid circular deps)
         try:
             from apps.scm.models import PurchaseOrder
@@ -44,26 +53,34 @@ class EnterpriseService(BaseService):
         except ImportError:
             total_assets_count = 0
 
+        return {
+            "active_projects": active_projects_count,
+            "pending_purchase_orders": pending_po_count,
+            "total_managed_assets": total_assets_count,
+            "overdue_invoices": Invoice.objects.filter(tenant=tenant, status='overdue').count(),
+        }
+
+    @classmethod
+    def _dashboard_financials(cls, tenant):
+        # Financials from ERP
+        total_invoiced = Invoice.objects.filter(tenant=tenant).aggregate(total=Sum('amount'))['total'] or 0
+        total_paid = Payment.objects.filter(invoice__tenant=tenant).aggregate(total=Sum('amount'))['total'] or 0
+        total_expenses = Expense.objects.filter(tenant=tenant).aggregate(total=Sum('amount'))['total'] or 0
+
         # Note: In a real enterprise system, more complex logic for MRR and Profit would go here
         # utilizing the billing and store apps.
-        
         return {
-            "kpi": {
-                "active_projects": active_projects_count,
-                "pending_purchase_orders": pending_po_count,
-                "total_managed_assets": total_assets_count,
-                "overdue_invoices": Invoice.objects.filter(tenant=tenant, status='overdue').count(),
-            },
-            "financials": {
-                "total_invoiced": float(total_invoiced),
-                "total_paid": float(total_paid),
-                "total_expenses": float(total_expenses),
-                "net_cash_flow": float(total_paid - total_expenses)
-            },
-            "system": {
-                "status": "Operational",
-                "last_audit": timezone.now().isoformat()
-            }
+            "total_invoiced": float(total_invoiced),
+            "total_paid": float(total_paid),
+            "total_expenses": float(total_expenses),
+            "net_cash_flow": float(total_paid - total_expenses)
+        }
+
+    @classmethod
+    def _dashboard_system(cls, tenant):
+        return {
+            "status": "Operational",
+            "last_audit": timezone.now().isoformat()
         }
 
 
@@ -4,6 +4,7 @@ Views orchestrate; services decide. All business logic delegated to ERP service
 """
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
+from apps.core.mixins import ExportMixin
 from .models import Invoice, Payment, Expense, InternalProject
 from .serializers import (
     InvoiceSerializer, PaymentSerializer, ExpenseSerializer, InternalProjectSerializer
@@ -11,9 +12,19 @@ from .serializers import (
 from .services import InvoiceService, PaymentService, ExpenseService, InternalProjectService
 
 
-class InvoiceViewSet(viewsets.ModelViewSet):
+class InvoiceViewSet(ExportMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = InvoiceSerializer
+    export_filename = 'invoices'
+    export_columns = [
+        ('Invoice Number', 'invoice_number'),
+        ('Client', 'client__name'),
+        ('Amount', 'amount'),
+        ('Status', 'status'),
+        ('Issue Date', 'issue_date'),
+        ('Due Date', 'due_date'),
+        ('Created', 'created_at'),
+    ]
 
     def get_queryset(self):
         return InvoiceService.get_queryset(self.request)
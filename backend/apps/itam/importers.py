@@ -0,0 +1,17 @@
+"""
+ITAM bulk importers (apps.core.imports): assets from CSV / JSON Lines.
+"""
+from apps.core.imports import ImporterRegistry, ModelImporter
+from .models import Asset
+
+
+@ImporterRegistry.register
+class AssetImporter(ModelImporter):
+    name = 'itam.assets'
+    model = Asset
+    fields = (
+        'name', 'asset_tag', 'asset_type', 'make', 'model', 'serial_number', 'status', 'client',
+        'assigned_to', 'purchase_date', 'purchase_price', 'warranty_expires', 'location', 'notes',
+    )
+    match_choices = ('id', 'asset_tag', 'serial_number')
+    lookups = {'client': 'name', 'assigned_to': 'email'}
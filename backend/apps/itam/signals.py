@@ -1,34 +1,43 @@
-from django.db.models.signals import post_save
-from django.dispatch import receiver
-from django.utils import timezone
+from apps.core.conditional import ChangeCounter
+from apps.core.events import EventBus, OrderCompleted
+from apps.core.kpis import KPICounters
 
-@receiver(post_save, sender='store.Order')
-def provision_assets_from_order(sender, instance, created, **kwargs):
+
+@EventBus.subscribe(OrderCompleted)
+def provision_assets_from_order(event, context):
     """
     Automatically creates ITAM Assets when a Hardware order is completed.
     """
-    # Only process completed orders to avoid ghost assets
-    if instance.status == 'completed':
-        from apps.itam.models import Asset
-        from apps.crm.models import Contact
-        
-        # Identify CRM client
-        contact = Contact.objects.filter(email=instance.customer.user.email).first() if instance.customer else None
-        client = contact.client if contact else None
+    from apps.itam.models import Asset
+
+    order = context.instance
+    tenant = context.tenant
+    if order is None or tenant is None:
+        return
+
+    # Identify CRM client
+    client = context.client
 
-        for item in instance.items.all():
-            # Check if product is hardware
-            if item.product.product_type == 'hardware' or 'hardware' in item.product.name.toLowerCase():
-                # Provision the asset
-                Asset.objects.create(
-                    name=item.product.name,
-                    asset_type='other', # Default, manually refine
-                    make=getattr(item.product, 'brand', ''),
-                    model=item.product.name,
-                    status='active',
-                    client=client,
-                    assigned_to=instance.customer.user if instance.customer else None,
-                    purchase_date=instance.created_at.date(),
-                    purchase_price=item.price,
-                    notes=f"Auto-provisioned from Order #{instance.id}"
-                )
+    assets = [
+        Asset(
+            tenant=tenant,
+            name=item.product.name,
+            asset_type='other', # Default, manually refine
+            make=item.product.brand,
+            model=item.product.name,
+            status='active',
+            client=client,
+            assigned_to=context.user,
+            purchase_date=order.created_at.date(),
+            purchase_price=item.unit_price,
+            notes=f"Auto-provisioned from Order #{order.id}"
+        )
+        for item in order.items.select_related('product')
+        # Check if product is hardware
+        if item.product and (item.product.product_type in ('hardware', 'physical') or 'hardware' in item.product.name.lower())
+    ]
+    if assets:
+        Asset.objects.bulk_create(assets)
+        # bulk_create sends no post_save: recount the asset KPIs and refresh cached figures
+        KPICounters.invalidate(Asset, tenant.pk)
+        ChangeCounter.bump(Asset, tenant.pk)
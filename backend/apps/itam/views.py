@@ -1,12 +1,14 @@
 from rest_framework import viewsets, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from apps.core.mixins import BulkImportMixin
 from .models import Asset, AssetAssignment, MaintenanceRecord
 from .serializers import AssetListSerializer, AssetDetailSerializer, AssetAssignmentSerializer, MaintenanceRecordSerializer
 
 
-class AssetViewSet(viewsets.ModelViewSet):
+class AssetViewSet(BulkImportMixin, viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
+    import_resource = 'itam.assets'
 
     def get_queryset(self):
         tenant = getattr(self.request.user, 'tenant', None)
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:51
+
+import apps.core.migration_operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction on PostgreSQL
+    atomic = False
+
+    dependencies = [
+        ('notifications', '0002_phase4_polish'),
+    ]
+
+    operations = [
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['user', 'created_at'], name='notif_unread_idx'),
+        ),
+    ]
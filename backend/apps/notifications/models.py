@@ -22,6 +22,14 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Unread badge / inbox queries filter on is_read=False for one user
+            models.Index(
+                fields=['user', 'created_at'],
+                condition=models.Q(is_read=False),
+                name='notif_unread_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.user})"
@@ -1,5 +1,6 @@
 from .models import Notification
 from apps.core.services.base import BaseService
+from apps.core.conditional import ChangeCounter
 
 class NotificationService(BaseService):
     """
@@ -26,11 +27,13 @@ class NotificationService(BaseService):
         """
         Marks all notifications as read for a given user in a tenant context.
         """
-        return Notification.objects.filter(
+        updated = Notification.objects.filter(
             user=user, 
             tenant=tenant, 
             is_read=False
         ).update(is_read=True)
+        ChangeCounter.bump(Notification, tenant.pk)
+        return updated
 
     @classmethod
     def send_system_alert(cls, user, tenant, title, message):
@@ -1,8 +1,27 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from apps.core.events import EventBus, OrderCreated
+
+
+@EventBus.subscribe(OrderCreated)
+def notify_order_placed(event, context):
+    from apps.notifications.models import Notification
+
+    order = context.instance
+    if order is None or context.user is None:
+        return
+
+    Notification.objects.create(
+        tenant=context.tenant,
+        user=context.user,
+        type='store',
+        title="New Store Order Placed",
+        message=f"Order #{order.id} for ${order.total_amount}.",
+    )
+
+
 # Subscribe to critical ecosystem nodes
-@receiver(post_save, sender='store.Order')
 @receiver(post_save, sender='support.Ticket')
 @receiver(post_save, sender='approvals.ApprovalRequest')
 @receiver(post_save, sender='itsm.ChangeRequest')
@@ -16,10 +35,7 @@ def push_global_notification(sender, instance, created, **kwargs):
     title = ""
     message = ""
     
-    if sender_name == 'order':
-        title = "New Store Order Placed"
-        message = f"Order #{instance.id} for ${instance.total}."
-    elif sender_name == 'ticket':
+    if sender_name == 'ticket':
         title = f"Support Ticket Generated ({instance.priority})"
         message = instance.title
     elif sender_name == 'approvalrequest':
@@ -6,10 +6,14 @@ from .models import Notification
 from .serializers import NotificationSerializer
 
 from .services import NotificationService
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.pagination import KeysetPagination
 
-class NotificationViewSet(viewsets.ModelViewSet):
+class NotificationViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    etag_models = ['notifications.Notification']
 
     def get_queryset(self):
         tenant = getattr(self.request, 'tenant', None)
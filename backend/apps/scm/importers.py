@@ -0,0 +1,17 @@
+"""
+SCM bulk importers (apps.core.imports): inventory items from CSV / JSON Lines.
+"""
+from apps.core.imports import ImporterRegistry, ModelImporter
+from .models import InventoryItem
+
+
+@ImporterRegistry.register
+class InventoryItemImporter(ModelImporter):
+    name = 'scm.inventory'
+    model = InventoryItem
+    fields = (
+        'product_id', 'product_name', 'sku', 'quantity_on_hand', 'quantity_reserved',
+        'reorder_level', 'unit_cost', 'location', 'vendor',
+    )
+    match_choices = ('id', 'sku')
+    lookups = {'vendor': 'name'}
@@ -5,6 +5,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from apps.core.services.base import BaseService
 from apps.core.services.audit import AuditService
+from apps.core.mixins import BulkImportMixin
 from .models import Vendor, InventoryItem, PurchaseOrder, PurchaseOrderLine
 from .serializers import (
     VendorSerializer, InventoryItemSerializer,
@@ -32,9 +33,10 @@ class VendorViewSet(viewsets.ModelViewSet):
             'low_stock': low_stock,
         }})
 
-class InventoryItemViewSet(viewsets.ModelViewSet):
+class InventoryItemViewSet(BulkImportMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = InventoryItemSerializer
+    import_resource = 'scm.inventory'
 
     def get_queryset(self):
         return BaseService.filter_by_context(InventoryItem.objects.all(), self.request)
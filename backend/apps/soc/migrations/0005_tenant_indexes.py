@@ -0,0 +1,48 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:51
+
+import apps.core.migration_operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction on PostgreSQL
+    atomic = False
+
+    dependencies = [
+        ('soc', '0004_sprint2_security_platform'),
+    ]
+
+    operations = [
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='alert',
+            index=models.Index(fields=['tenant', 'is_deleted', 'created_at'], name='soc_alert_tn_created_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='alert',
+            index=models.Index(condition=models.Q(('is_resolved', False)), fields=['tenant', 'created_at'], name='soc_alert_unresolved_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='incident',
+            index=models.Index(fields=['tenant', 'is_deleted', 'created_at'], name='soc_incident_tn_created_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='incident',
+            index=models.Index(fields=['tenant', 'status'], name='soc_incident_tn_status_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='loganalysis',
+            index=models.Index(fields=['tenant', 'created_at'], name='soc_logs_tn_created_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='managedendpoint',
+            index=models.Index(fields=['tenant', 'is_deleted', 'created_at'], name='soc_endpoint_tn_created_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='managedendpoint',
+            index=models.Index(fields=['tenant', 'status'], name='soc_endpoint_tn_status_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='networkevent',
+            index=models.Index(fields=['tenant', 'created_at'], name='soc_netevent_tn_created_idx'),
+        ),
+    ]
@@ -1,5 +1,5 @@
 ﻿from django.db import models
-from apps.core.models import UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteModel, TenantAwareModel
+from apps.core.models import UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteModel, TenantAwareModel, tenant_indexes
 from django.conf import settings
 
 class Alert(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteModel):
@@ -15,6 +15,17 @@ class Alert(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteM
     source = models.CharField(max_length=100, help_text="e.g. Firewall, IDS")
     is_resolved = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            *tenant_indexes('soc_alert'),
+            # Open-alert queues and counters only ever look at unresolved rows
+            models.Index(
+                fields=['tenant', 'created_at'],
+                condition=models.Q(is_resolved=False),
+                name='soc_alert_unresolved_idx',
+            ),
+        ]
+
     def __str__(self):
         return f"[{self.get_severity_display()}] {self.title}"
 
@@ -31,6 +42,9 @@ class Incident(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel, SoftDele
     alerts = models.ManyToManyField(Alert, related_name='incidents', blank=True)
     assigned_to = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
 
+    class Meta:
+        indexes = tenant_indexes('soc_incident', status_field='status')
+
     def __str__(self):
         return self.title
 
@@ -55,6 +69,7 @@ class LogAnalysis(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel):
 
     class Meta:
         verbose_name_plural = 'Log Analyses'
+        indexes = tenant_indexes('soc_logs', soft_delete=False)
 
     def __str__(self):
         return f"Log from {self.source_system} at {self.created_at}"
@@ -125,6 +140,7 @@ class ManagedEndpoint(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel, S
 
     class Meta:
         verbose_name = 'Managed Endpoint'
+        indexes = tenant_indexes('soc_endpoint', status_field='status')
 
 
 class CloudApp(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel):
@@ -210,6 +226,7 @@ class NetworkEvent(TenantAwareModel, UUIDPrimaryKeyModel, TimeStampedModel):
     class Meta:
         verbose_name = 'Network Event'
         ordering = ['-created_at']
+        indexes = tenant_indexes('soc_netevent', soft_delete=False)
 
     def __str__(self):
         return f"{self.category} from {self.source_ip}"
@@ -18,6 +18,14 @@ class AlertSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
+class AlertListSerializer(serializers.ModelSerializer):
+    """Alert queue rows: no description."""
+    class Meta:
+        model = Alert
+        fields = ['id', 'title', 'severity', 'source', 'is_resolved', 'created_at']
+        read_only_fields = fields
+
+
 class IncidentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Incident
@@ -39,6 +47,14 @@ class LogAnalysisSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
+class LogAnalysisListSerializer(serializers.ModelSerializer):
+    """Log index rows: raw_log and parsed_data are only served by the detail endpoint."""
+    class Meta:
+        model = LogAnalysis
+        fields = ['id', 'source_system', 'flagged_anomalous', 'created_at']
+        read_only_fields = fields
+
+
 # ─── Security Platform (Customer-facing) ─────────────────
 
 class WorkspaceSerializer(serializers.ModelSerializer):
@@ -55,7 +55,7 @@ class IncidentService(BaseService):
 
     @classmethod
     def get_queryset(cls, request):
-        return cls.filter_by_context(Incident.objects.all(), request)
+        return cls.filter_by_context(Incident.objects.prefetch_related('alerts'), request)
 
     @classmethod
     @transaction.atomic
@@ -122,7 +122,7 @@ class WorkspaceService(BaseService):
 class ManagedEndpointService(BaseService):
     @classmethod
     def get_queryset(cls, request):
-        return cls.filter_by_context(ManagedEndpoint.objects.all(), request)
+        return cls.filter_by_context(ManagedEndpoint.objects.select_related('workspace'), request)
 
     @classmethod
     @transaction.atomic
@@ -146,6 +146,9 @@ class ManagedEndpointService(BaseService):
         AuditService.log_action(request, action="PLATFORM_ENDPOINT_ISOLATED",
             resource=f"soc.ManagedEndpoint:{endpoint.pk}",
             payload={"hostname": endpoint.hostname, "reason": "Manual isolation"})
+        # EDR containment call runs on the job workers, not in the request
+        from .tasks import isolate_asset_task
+        isolate_asset_task.delay(endpoint.pk)
         return endpoint
 
 
@@ -158,7 +161,7 @@ class CloudAppService(BaseService):
 class SystemMonitorService(BaseService):
     @classmethod
     def get_queryset(cls, request):
-        return cls.filter_by_context(SystemMonitor.objects.all(), request)
+        return cls.filter_by_context(SystemMonitor.objects.select_related('endpoint'), request)
 
 
 class NetworkEventService(BaseService):
@@ -188,7 +191,9 @@ class CloudIntegrationService(BaseService):
 class RemoteSessionService(BaseService):
     @classmethod
     def get_queryset(cls, request):
-        return cls.filter_by_context(RemoteSession.objects.all(), request)
+        return cls.filter_by_context(
+            RemoteSession.objects.select_related('endpoint', 'initiated_by'), request
+        )
 
     @classmethod
     @transaction.atomic
@@ -1,30 +1,47 @@
-from django.utils import timezone
-from .models import Asset, EmailThreat, RemediationAction, SecurityIncident
-
-# Synchronous Tasks (Mocking Celery behavior)
-
-def isolate_asset_task(asset_id):
-    try:
-        asset = Asset.objects.get(id=asset_id)
-        # Simulate API call to EDR
-        print(f"Isolating asset: {asset.name} ({asset.ip_address})")
-        asset.status = 'isolated'
-        asset.save()
-        return f"Asset {asset.name} isolated successfully."
-    except Asset.DoesNotExist:
-        return f"Asset {asset_id} not found."
+"""
+SOC background jobs (apps.core.jobs), executed by `python manage.py run_jobs`.
+Containment calls run on the 'soc' queue instead of in the request, ahead of
+alert enrichment (priority 0); each job runs inside the tenant context it was enqueued from, so `objects` stays
+tenant-scoped.
+"""
+import logging
 
+from apps.core.jobs import job
+from .models import ManagedEndpoint
+
+logger = logging.getLogger(__name__)
+
+
+@job(queue='soc', priority=20)
+def isolate_asset_task(endpoint_id):
+    endpoint = ManagedEndpoint.objects.filter(pk=endpoint_id).first()
+    if endpoint is None:
+        return f"Endpoint {endpoint_id} not found."
+    # Simulate API call to EDR
+    logger.info(f"Isolating endpoint: {endpoint.hostname} ({endpoint.ip_address})")
+    if endpoint.status != 'isolated':
+        endpoint.status = 'isolated'
+        endpoint.save(update_fields=['status', 'updated_at'])
+    return f"Endpoint {endpoint.hostname} isolated successfully."
+
+
+@job(queue='soc', priority=20)
 def block_ip_task(ip_address):
     # Simulate API call to Firewall
-    print(f"Blocking IP on Firewall: {ip_address}")
+    logger.info(f"Blocking IP on Firewall: {ip_address}")
     return f"IP {ip_address} blocked on firewall."
 
+
+@job(queue='soc', priority=20)
 def quarantine_email_task(message_id):
     # Simulate API call to Email Gateway
-    print(f"Quarantining message: {message_id}")
+    logger.info(f"Quarantining message: {message_id}")
     return f"Message {message_id} quarantined."
 
+
+@job(queue='soc', priority=0)
 def enrich_alert_task(alert_id):
     # Simulate finding threat intel
     # Logic to update alert context would go here
     pass
+
@@ -12,7 +12,8 @@ from .models import (
     NetworkEvent, CloudIntegration, RemoteSession,
 )
 from .serializers import (
-    AlertSerializer, IncidentSerializer, ThreatIntelligenceSerializer, LogAnalysisSerializer,
+    AlertSerializer, AlertListSerializer, IncidentSerializer, ThreatIntelligenceSerializer,
+    LogAnalysisSerializer, LogAnalysisListSerializer,
     WorkspaceSerializer, ManagedEndpointSerializer, CloudAppSerializer, SystemMonitorSerializer,
     NetworkEventSerializer, CloudIntegrationSerializer, RemoteSessionSerializer,
 )
@@ -22,13 +23,19 @@ from .services import (
     NetworkEventService, CloudIntegrationService, RemoteSessionService,
 )
 from apps.core.permissions import HasRole, IsSuperAdmin
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.kpis import KPICounters
+from apps.core.result_cache import ResultCache
+from apps.core.mixins import ExportMixin, SparseFieldsMixin
+from apps.core.pagination import KeysetPagination
 
 
 # ─── Internal SOC ViewSets ───────────────────────────────────
 
-class AlertViewSet(viewsets.ModelViewSet):
+class AlertViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated, IsSuperAdmin | HasRole(['SOC_ADMIN', 'SOC_ANALYST'])]
     serializer_class = AlertSerializer
+    list_serializer_class = AlertListSerializer
 
     def get_queryset(self):
         return AlertService.get_queryset(self.request)
@@ -42,7 +49,7 @@ class AlertViewSet(viewsets.ModelViewSet):
         return Response({'status': 'resolved'})
 
 
-class IncidentViewSet(viewsets.ModelViewSet):
+class IncidentViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated, IsSuperAdmin | HasRole(['SOC_ADMIN', 'SOC_ANALYST'])]
     serializer_class = IncidentSerializer
 
@@ -64,7 +71,7 @@ class IncidentViewSet(viewsets.ModelViewSet):
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class ThreatIntelligenceViewSet(viewsets.ModelViewSet):
+class ThreatIntelligenceViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = ThreatIntelligenceSerializer
 
@@ -72,9 +79,10 @@ class ThreatIntelligenceViewSet(viewsets.ModelViewSet):
         return ThreatIntelligenceService.get_queryset(self.request)
 
 
-class LogAnalysisViewSet(viewsets.ModelViewSet):
+class LogAnalysisViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated, IsSuperAdmin | HasRole(['SOC_ADMIN', 'SOC_ANALYST'])]
     serializer_class = LogAnalysisSerializer
+    list_serializer_class = LogAnalysisListSerializer
 
     def get_queryset(self):
         return LogAnalysisService.get_queryset(self.request)
@@ -82,7 +90,7 @@ class LogAnalysisViewSet(viewsets.ModelViewSet):
 
 # ─── Security Platform ViewSets (Customer-facing) ─────────────
 
-class WorkspaceViewSet(viewsets.ModelViewSet):
+class WorkspaceViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """Customer environment groupings (HQ Network, AWS Production, etc.)."""
     permission_classes = [IsAuthenticated]
     serializer_class = WorkspaceSerializer
@@ -94,7 +102,7 @@ class WorkspaceViewSet(viewsets.ModelViewSet):
         WorkspaceService.create_workspace(self.request, serializer.validated_data)
 
 
-class ManagedEndpointViewSet(viewsets.ModelViewSet):
+class ManagedEndpointViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """Managed devices — workstations, servers, firewalls."""
     permission_classes = [IsAuthenticated]
     serializer_class = ManagedEndpointSerializer
@@ -113,7 +121,7 @@ class ManagedEndpointViewSet(viewsets.ModelViewSet):
         return Response({'status': 'isolated', 'hostname': endpoint.hostname})
 
 
-class CloudAppViewSet(viewsets.ModelViewSet):
+class CloudAppViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """Cloud applications in the customer's tech stack."""
     permission_classes = [IsAuthenticated]
     serializer_class = CloudAppSerializer
@@ -122,7 +130,7 @@ class CloudAppViewSet(viewsets.ModelViewSet):
         return CloudAppService.get_queryset(self.request)
 
 
-class SystemMonitorViewSet(viewsets.ModelViewSet):
+class SystemMonitorViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """Real-time health metrics per endpoint."""
     permission_classes = [IsAuthenticated]
     serializer_class = SystemMonitorSerializer
@@ -131,16 +139,30 @@ class SystemMonitorViewSet(viewsets.ModelViewSet):
         return SystemMonitorService.get_queryset(self.request)
 
 
-class NetworkEventViewSet(viewsets.ModelViewSet):
+class NetworkEventViewSet(ExportMixin, SparseFieldsMixin, viewsets.ModelViewSet):
     """Network traffic and security events."""
     permission_classes = [IsAuthenticated]
     serializer_class = NetworkEventSerializer
+    pagination_class = KeysetPagination
+    export_filename = 'network_events'
+    export_columns = [
+        ('Timestamp', 'created_at'),
+        ('Workspace', 'workspace__name'),
+        ('Category', 'category'),
+        ('Source IP', 'source_ip'),
+        ('Source Port', 'source_port'),
+        ('Destination IP', 'destination_ip'),
+        ('Destination Port', 'destination_port'),
+        ('Protocol', 'protocol'),
+        ('Blocked', 'is_blocked'),
+        ('Details', 'details'),
+    ]
 
     def get_queryset(self):
         return NetworkEventService.get_queryset(self.request)
 
 
-class CloudIntegrationViewSet(viewsets.ModelViewSet):
+class CloudIntegrationViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """Third-party integrations (Microsoft 365, AWS, Okta, Slack)."""
     permission_classes = [IsAuthenticated]
     serializer_class = CloudIntegrationSerializer
@@ -152,7 +174,7 @@ class CloudIntegrationViewSet(viewsets.ModelViewSet):
         CloudIntegrationService.connect_integration(self.request, serializer.validated_data)
 
 
-class RemoteSessionViewSet(viewsets.ModelViewSet):
+class RemoteSessionViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """Auditable remote management sessions to customer endpoints."""
     permission_classes = [IsAuthenticated]
     serializer_class = RemoteSessionSerializer
@@ -172,31 +194,50 @@ class RemoteSessionViewSet(viewsets.ModelViewSet):
         RemoteSessionService.end_session(request, session)
         return Response({'status': 'ended'})
 
-class SecurityStatsViewSet(viewsets.ViewSet):
+class SecurityStatsViewSet(ConditionalGetMixin, viewsets.ViewSet):
     """
     Aggregated SOC metrics for the Command Center.
     """
     permission_classes = [IsAuthenticated]
+    etag_models = ['soc.ManagedEndpoint', 'soc.Alert', 'soc.Incident', 'soc.CloudApp']
+
+    def get_etag_tenant(self, request):
+        # Counts below are scoped by the user's tenant, not the resolved request tenant
+        tenant = getattr(request.user, 'tenant', None)
+        return getattr(tenant, 'pk', None)
+
+    # Response section -> (model it counts, {field: KPI counter key (apps.core.kpis)})
+    STATS = {
+        'endpoints': ('soc.ManagedEndpoint', {
+            'total': 'soc.endpoints', 'online': 'soc.endpoints.online', 'at_risk': 'soc.endpoints.at_risk',
+        }),
+        'alerts': ('soc.Alert', {
+            'total': 'soc.alerts', 'unresolved': 'soc.alerts.unresolved', 'critical': 'soc.alerts.critical',
+        }),
+        'incidents': ('soc.Incident', {'total': 'soc.incidents', 'open': 'soc.incidents.open'}),
+        'cloud_apps': ('soc.CloudApp', {'total': 'soc.cloud_apps', 'high_risk': 'soc.cloud_apps.high_risk'}),
+    }
+
+    @classmethod
+    def compute_stats(cls, sections, tenant):
+        keys = [key for section in sections for key in cls.STATS[section][1].values()]
+        # Read from the counters in one query; staff without a tenant see every tenant
+        counts = KPICounters.get(keys, tenant)
+        return {
+            section: {field: counts.get(key, 0) for field, key in cls.STATS[section][1].items()}
+            for section in sections
+        }
 
     def list(self, request):
         tenant = request.user.tenant if hasattr(request.user, 'tenant') else None
-        return Response({
-            'endpoints': {
-                'total': ManagedEndpoint.objects.filter(tenant=tenant).count(),
-                'online': ManagedEndpoint.objects.filter(tenant=tenant, status='online').count(),
-                'at_risk': ManagedEndpoint.objects.filter(tenant=tenant, status='at_risk').count()
-            },
-            'alerts': {
-                'total': Alert.objects.filter(tenant=tenant).count(),
-                'unresolved': Alert.objects.filter(tenant=tenant, is_resolved=False).count(),
-                'critical': Alert.objects.filter(tenant=tenant, severity='critical', is_resolved=False).count()
-            },
-            'incidents': {
-                'total': Incident.objects.filter(tenant=tenant).count(),
-                'open': Incident.objects.filter(tenant=tenant, status='open').count()
-            },
-            'cloud_apps': {
-                'total': CloudApp.objects.filter(tenant=tenant).count(),
-                'high_risk': CloudApp.objects.filter(tenant=tenant, risk_level='high').count()
-            }
-        })
+        if tenant is None and not request.user.is_staff:
+            return Response({section: dict.fromkeys(fields, 0) for section, (_, fields) in self.STATS.items()})
+        stats, freshness = ResultCache.get(
+            'soc.security_stats', getattr(tenant, 'pk', None),
+            {section: [label] for section, (label, _) in self.STATS.items()},
+            lambda sections: self.compute_stats(sections, tenant),
+        )
+        if freshness['stale']:
+            # Stale figures must not be pinned by a 304 against the current ETag
+            self.conditional_validators = None
+        return Response({**stats, 'freshness': freshness})
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:51
+
+import apps.core.migration_operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction on PostgreSQL
+    atomic = False
+
+    dependencies = [
+        ('store', '0004_partnerrequest'),
+    ]
+
+    operations = [
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='order',
+            index=models.Index(fields=['tenant', 'created_at'], name='store_order_tn_created_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='order',
+            index=models.Index(fields=['tenant', 'status'], name='store_order_tn_status_idx'),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
+from apps.core.models import tenant_indexes
 
 class StoreCustomization(models.Model):
     tenant = models.OneToOneField('tenants.Tenant', on_delete=models.CASCADE, related_name='store_customization', null=True, blank=True)
@@ -115,6 +116,9 @@ class Order(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = tenant_indexes('store_order', soft_delete=False, status_field='status')
+
     def __str__(self):
         return f"Order #{self.id}"
 
@@ -25,6 +25,18 @@ class ProductSerializer(serializers.ModelSerializer):
         model = Product
         fields = '__all__'
 
+class ProductListSerializer(serializers.ModelSerializer):
+    """Catalogue grid rows: no description, specifications or features."""
+    categories = CategorySerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Product
+        fields = [
+            'id', 'name', 'slug', 'product_type', 'status', 'price', 'discount_price',
+            'sku', 'image', 'brand', 'categories', 'created_at',
+        ]
+        read_only_fields = fields
+
 class LicenseKeySerializer(serializers.ModelSerializer):
     product_name = serializers.CharField(source='product.name', read_only=True)
     
@@ -1,4 +1,3 @@
-import stripe
 from django.conf import settings
 from django.utils import timezone
 from .models import (
@@ -7,8 +6,7 @@ from .models import (
 )
 from apps.core.services.base import BaseService
 from apps.core.services.audit import AuditService
-
-stripe.api_key = settings.STRIPE_SECRET_KEY
+from apps.core.clients import get_stripe
 
 class CommerceService(BaseService):
     """
@@ -169,7 +167,7 @@ class CommerceService(BaseService):
     def create_checkout_session(cls, user, product, success_url, cancel_url, request=None):
         tenant = cls.get_tenant_context(request)
         
-        session = stripe.checkout.Session.create(
+        session = get_stripe().checkout.Session.create(
             payment_method_types=['card'],
             line_items=[{
                 'price_data': {
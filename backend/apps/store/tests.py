@@ -0,0 +1,39 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.store.models import Order
+from apps.tenants.models import Tenant
+
+
+@override_settings(ALLOWED_HOSTS=['*'])
+class OrderTenantScopeTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.acme = Tenant.objects.create(name='Acme', domain='acme.test')
+        cls.globex = Tenant.objects.create(name='Globex', domain='globex.test')
+        cls.user = get_user_model().objects.create_user(
+            email='buyer@acme.test', username='buyer@acme.test', password='x', tenant=cls.acme,
+        )
+        cls.own = [Order.objects.create(tenant=cls.acme, user=cls.user, total_amount=10) for _ in range(2)]
+        cls.other = Order.objects.create(tenant=cls.globex, total_amount=99)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def get(self, path):
+        return self.client.get(path, HTTP_X_TENANT_ID=self.acme.domain)
+
+    def test_list_and_detail_only_show_the_tenant_orders(self):
+        response = self.get('/api/store/orders/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({row['id'] for row in response.json()['results']}, {order.pk for order in self.own})
+        self.assertEqual(self.get(f'/api/store/orders/{self.other.pk}/').status_code, 404)
+
+    def test_export_only_contains_the_tenant_orders(self):
+        response = self.get('/api/store/orders/export/')
+        self.assertEqual(response.status_code, 200)
+        rows = b''.join(response.streaming_content).decode().strip().splitlines()[1:]
+        self.assertEqual({int(row.split(',')[0]) for row in rows}, {order.pk for order in self.own})
@@ -6,29 +6,40 @@ from .models import (
     Order, ShippingSetting, LandingPage, TrackingConfig, AddOn, SubscriptionPlan, Subscription, StoreSetting, PartnerRequest
 )
 from .serializers import (
-    StoreCustomizationSerializer, CategorySerializer, ProductSerializer, LicenseKeySerializer,
+    StoreCustomizationSerializer, CategorySerializer, ProductSerializer, ProductListSerializer, LicenseKeySerializer,
     CustomerProfileSerializer, OrderSerializer, ShippingSettingSerializer, LandingPageSerializer,
     TrackingConfigSerializer, AddOnSerializer, SubscriptionPlanSerializer, SubscriptionSerializer, StoreSettingSerializer, PartnerRequestSerializer
 )
 from .services import CommerceService
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.mixins import ExportMixin, SparseFieldsMixin
+from apps.core.pagination import KeysetPagination
 
-class StoreCustomizationViewSet(viewsets.ModelViewSet):
+class StoreCustomizationViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = StoreCustomization.objects.all()
     serializer_class = StoreCustomizationSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(ConditionalGetMixin, SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    etag_models = ['store.Category']
+    etag_scope = 'global'
+    etag_vary_on_user = False
 
     def perform_create(self, serializer):
         CommerceService.create_category(serializer.validated_data, self.request)
 
-class ProductViewSet(viewsets.ModelViewSet):
-    queryset = Product.objects.all().order_by('-created_at')
+class ProductViewSet(ConditionalGetMixin, SparseFieldsMixin, viewsets.ModelViewSet):
+    queryset = Product.objects.prefetch_related('categories', 'components').order_by('-created_at')
     serializer_class = ProductSerializer
+    list_serializer_class = ProductListSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    # Catalogue is not tenant-filtered; same ETag for every caller
+    etag_models = ['store.Product', 'store.Category']
+    etag_scope = 'global'
+    etag_vary_on_user = False
 
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def checkout(self, request, pk=None):
@@ -48,20 +59,42 @@ class ProductViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         CommerceService.create_product(serializer.validated_data, self.request)
 
-class LicenseKeyViewSet(viewsets.ModelViewSet):
-    queryset = LicenseKey.objects.all()
+class LicenseKeyViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
+    queryset = LicenseKey.objects.select_related('product')
     serializer_class = LicenseKeySerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class CustomerProfileViewSet(viewsets.ModelViewSet):
-    queryset = CustomerProfile.objects.all()
+class CustomerProfileViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
+    queryset = CustomerProfile.objects.select_related('user')
     serializer_class = CustomerProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class OrderViewSet(viewsets.ModelViewSet):
-    queryset = Order.objects.all().order_by('-created_at')
+class OrderViewSet(ExportMixin, SparseFieldsMixin, viewsets.ModelViewSet):
+    queryset = (
+        Order.objects.select_related('user', 'product')
+        .prefetch_related(
+            'timeline', 'items__product__categories', 'items__product__components',
+            'product__categories', 'product__components',
+        )
+        .order_by('-created_at')
+    )
     serializer_class = OrderSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    export_filename = 'orders'
+    export_columns = [
+        ('Order', 'id'),
+        ('Created', 'created_at'),
+        ('Customer', 'user__email', 'Guest'),
+        ('Status', 'status'),
+        ('Payment Status', 'payment_status'),
+        ('Fulfillment Status', 'fulfillment_status'),
+        ('Total', 'total_amount'),
+    ]
+
+    def get_queryset(self):
+        # Order is not TenantAwareModel: scope list, detail and export to the caller's tenant
+        return CommerceService.filter_by_context(super().get_queryset(), self.request)
 
     def perform_create(self, serializer):
         CommerceService.create_order(serializer.validated_data, self.request)
@@ -76,45 +109,45 @@ class OrderViewSet(viewsets.ModelViewSet):
         CommerceService.update_order_status(order, new_status, request)
         return Response({"status": "updated", "new_status": new_status})
 
-class ShippingSettingViewSet(viewsets.ModelViewSet):
+class ShippingSettingViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = ShippingSetting.objects.all()
     serializer_class = ShippingSettingSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class LandingPageViewSet(viewsets.ModelViewSet):
+class LandingPageViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = LandingPage.objects.all()
     serializer_class = LandingPageSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class TrackingConfigViewSet(viewsets.ModelViewSet):
+class TrackingConfigViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = TrackingConfig.objects.all()
     serializer_class = TrackingConfigSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class AddOnViewSet(viewsets.ModelViewSet):
+class AddOnViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = AddOn.objects.all()
     serializer_class = AddOnSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class SubscriptionPlanViewSet(viewsets.ModelViewSet):
+class SubscriptionPlanViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = SubscriptionPlan.objects.all()
     serializer_class = SubscriptionPlanSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class SubscriptionViewSet(viewsets.ModelViewSet):
-    queryset = Subscription.objects.all()
+class SubscriptionViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
+    queryset = Subscription.objects.select_related('plan', 'customer__user')
     serializer_class = SubscriptionSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def perform_create(self, serializer):
         CommerceService.create_subscription(serializer.validated_data, self.request)
 
-class StoreSettingViewSet(viewsets.ModelViewSet):
+class StoreSettingViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = StoreSetting.objects.all()
     serializer_class = StoreSettingSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-class PartnerRequestViewSet(viewsets.ModelViewSet):
+class PartnerRequestViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     queryset = PartnerRequest.objects.all().order_by('-created_at')
     serializer_class = PartnerRequestSerializer
     permission_classes = [permissions.AllowAny] # Allow public submission
@@ -1,4 +1,5 @@
-import stripe, json
+import json
+from django.db import transaction
 from django.utils import timezone
 from django.conf import settings
 from django.views.decorators.csrf import csrf_exempt
@@ -6,8 +7,6 @@ from django.http import HttpResponse
 from apps.billing.models import Order, Subscription, Plan
 from .models import LicenseKey
 
-stripe.api_key = settings.STRIPE_SECRET_KEY
-
 @csrf_exempt
 def stripe_webhook(request):
     payload = request.body
@@ -26,13 +25,12 @@ def stripe_webhook(request):
             try:
                 order = Order.objects.get(stripe_session=session.id)
                 
-                # Workflow Engine transition
+                # Workflow Engine transition + event, committed together (transactional outbox)
                 from apps.core.services.workflow import WorkflowEngine
-                WorkflowEngine.transition(order, 'paid', order.user, request=request, reason="Stripe Webhook: Payment Success")
-                
-                # Emit Signal
-                from apps.core.signals import order_paid
-                order_paid.send(sender=None, order=order, request=request)
+                from apps.core.outbox import Outbox
+                with transaction.atomic():
+                    WorkflowEngine.transition(order, 'paid', order.user, request=request, reason="Stripe Webhook: Payment Success")
+                    Outbox.send('order_paid', sender=None, order=order, request=request)
                 
                 # Assign License Key if digital
                 if order.product_id:
@@ -75,13 +73,12 @@ def stripe_webhook(request):
                     }
                 )
                 
-                # Workflow Engine
+                # Workflow Engine transition + event, committed together (transactional outbox)
                 from apps.core.services.workflow import WorkflowEngine
-                WorkflowEngine.transition(sub, 'active', user, request=request, reason="Stripe Webhook: Subscription Started")
-                
-                # Emit Signal
-                from apps.core.signals import order_paid
-                order_paid.send(sender=None, order=sub, request=request)
+                from apps.core.outbox import Outbox
+                with transaction.atomic():
+                    WorkflowEngine.transition(sub, 'active', user, request=request, reason="Stripe Webhook: Subscription Started")
+                    Outbox.send('order_paid', sender=None, order=sub, request=request)
             except (User.DoesNotExist, Plan.DoesNotExist):
                 pass
 
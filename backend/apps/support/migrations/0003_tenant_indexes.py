@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:51
+
+import apps.core.migration_operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction on PostgreSQL
+    atomic = False
+
+    dependencies = [
+        ('support', '0002_knowledgearticle'),
+    ]
+
+    operations = [
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='ticket',
+            index=models.Index(fields=['tenant', 'is_deleted', 'created_at'], name='sup_ticket_tn_created_idx'),
+        ),
+        apps.core.migration_operations.AddIndexOnline(
+            model_name='ticket',
+            index=models.Index(fields=['tenant', 'status'], name='sup_ticket_tn_status_idx'),
+        ),
+    ]
@@ -1,6 +1,6 @@
 from django.db import models
 from django.conf import settings
-from apps.core.models import UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteModel
+from apps.core.models import UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteModel, tenant_indexes
 
 class Ticket(UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteModel):
     PRIORITY_CHOICES = [
@@ -31,6 +31,9 @@ class Ticket(UUIDPrimaryKeyModel, TimeStampedModel, SoftDeleteModel):
     related_articles = models.ManyToManyField('KnowledgeArticle', blank=True, related_name='linked_tickets')
     is_converted_to_kb = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = tenant_indexes('sup_ticket', status_field='status')
+
     def __str__(self):
         return f"[{self.status.upper()}] {self.title}"
 
@@ -23,6 +23,19 @@ class TicketSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'tenant', 'created_at', 'updated_at', 'customer', 'related_articles', 'is_converted_to_kb']
 
+class TicketListSerializer(serializers.ModelSerializer):
+    """Ticket queue rows: no description or message thread."""
+    customer_email = serializers.ReadOnlyField(source='customer.email')
+    assigned_to_email = serializers.ReadOnlyField(source='assigned_to.email')
+
+    class Meta:
+        model = Ticket
+        fields = [
+            'id', 'title', 'status', 'priority', 'customer_email', 'assigned_to_email',
+            'due_date', 'created_at', 'updated_at',
+        ]
+        read_only_fields = fields
+
 class KnowledgeArticleSerializer(serializers.ModelSerializer):
     class Meta:
         model = KnowledgeArticle
@@ -20,7 +20,7 @@ class TicketService(BaseService):
 
     @classmethod
     def get_queryset(cls, request):
-        return cls.filter_by_context(Ticket.objects.all(), request)
+        return cls.filter_by_context(Ticket.objects.select_related('customer', 'assigned_to'), request)
 
     @classmethod
     @transaction.atomic
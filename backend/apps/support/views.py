@@ -8,13 +8,27 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status as drf_status
 from .models import Ticket, TicketMessage, KnowledgeArticle
-from .serializers import TicketSerializer, TicketMessageSerializer, KnowledgeArticleSerializer
+from .serializers import TicketSerializer, TicketListSerializer, TicketMessageSerializer, KnowledgeArticleSerializer
 from .services import TicketService, TicketMessageService
+from apps.core.mixins import ExportMixin, SparseFieldsMixin
 
 
-class TicketViewSet(viewsets.ModelViewSet):
+class TicketViewSet(ExportMixin, SparseFieldsMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = TicketSerializer
+    list_serializer_class = TicketListSerializer
+    export_filename = 'tickets'
+    export_columns = [
+        ('ID', 'id'),
+        ('Created', 'created_at'),
+        ('Title', 'title'),
+        ('Status', 'status'),
+        ('Priority', 'priority'),
+        ('Due', 'due_date'),
+        ('Customer', 'customer__email'),
+        ('Assigned To', 'assigned_to__email', 'Unassigned'),
+        ('Updated', 'updated_at'),
+    ]
 
     def get_queryset(self):
         return TicketService.get_queryset(self.request)
@@ -76,7 +90,7 @@ class TicketViewSet(viewsets.ModelViewSet):
             return Response({'error': str(e)}, status=drf_status.HTTP_400_BAD_REQUEST)
 
 
-class KnowledgeArticleViewSet(viewsets.ModelViewSet):
+class KnowledgeArticleViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = KnowledgeArticleSerializer
     queryset = KnowledgeArticle.objects.filter(is_deleted=False)
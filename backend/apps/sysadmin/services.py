@@ -1,11 +1,17 @@
 from django.core.cache import cache
 from django.contrib.auth import get_user_model
 from django.db.models import Sum
+from apps.core.host_metrics import HostMetrics
 from apps.core.services.base import BaseService
 from .models import SystemSetting, AuditTrail
 
 User = get_user_model()
 
+
+def _percent(value):
+    return 'n/a' if value is None else f'{value:g}%'
+
+
 class SysadminService(BaseService):
     """
     Business logic layer for System Administration.
@@ -58,16 +64,22 @@ class SysadminService(BaseService):
     def get_system_metrics(self):
         """
         Gathers system metrics like active users, estimated load, etc.
+        Host figures come from the host metrics sampler (apps.core.host_metrics):
+        error_rate is the percent of 5xx responses of this worker since the
+        previous sample, server_uptime the share of kept samples whose
+        database ping succeeded.
         """
-        # In a real enterprise system, these would query Redis, Celery queues, OS stats.
-        # We are simulating them for the scope of this scaffold.
         active_users_count = User.objects.filter(is_active=True).count()
         audit_count = AuditTrail.objects.count()
+        sample = HostMetrics.current() or dict.fromkeys(HostMetrics.FIELDS)
+        availability = HostMetrics.availability()
         return {
             'active_users': active_users_count,
-            'error_rate': 0.02, # Simulated value
-            'server_uptime': '99.99%', # Simulated value
-            'cpu_load': '34%', # Simulated value
+            'error_rate': sample['error_rate'],
+            'server_uptime': _percent(availability),
+            'cpu_load': _percent(sample['cpu_percent']),
+            'memory_usage': _percent(sample['memory_percent']),
+            'disk_usage': _percent(sample['disk_percent']),
             'total_audits': audit_count
         }
 
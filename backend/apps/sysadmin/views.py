@@ -4,6 +4,9 @@ from rest_framework.decorators import action
 from django_filters.rest_framework import DjangoFilterBackend
 from django.http import HttpResponse
 import csv
+from apps.core.exports import streaming_export
+from apps.core.mixins import ExportMixin
+from apps.core.pagination import KeysetPagination
 from .models import SystemSetting, AuditTrail
 from .serializers import SystemSettingSerializer, AuditTrailSerializer
 from .services import SysadminService
@@ -103,7 +106,7 @@ class AuditTrailViewSet(viewsets.ReadOnlyModelViewSet):
             
         return response
 
-class AuditTrailViewSet(viewsets.ReadOnlyModelViewSet):
+class AuditTrailViewSet(ExportMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint that allows audit trails to be viewed.
     Read-only for everyone, only accessible by platform admins.
@@ -111,10 +114,21 @@ class AuditTrailViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = AuditTrail.objects.all()
     serializer_class = AuditTrailSerializer
     permission_classes = [permissions.IsAuthenticated, IsPlatformAdmin]
+    export_filename = 'audit_logs_export'
+    export_columns = [
+        ('Timestamp', 'created_at'),
+        ('User', 'user__email', 'System'),
+        ('Action', 'action'),
+        ('Resource', 'resource_type'),
+        ('IP Address', 'ip_address'),
+        ('Details', 'details'),
+    ]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['action', 'resource_type', 'user__email', 'user__first_name', 'details']
     filterset_fields = ['action', 'resource_type']
     ordering_fields = ['created_at']
+    pagination_class = KeysetPagination
+    pagination_mode = 'offset'  # numbered pages on the admin audit screen
     
     def get_queryset(self):
         # If the app is tenant aware, we should filter by tenant
@@ -126,22 +140,6 @@ class AuditTrailViewSet(viewsets.ReadOnlyModelViewSet):
 
     @action(detail=False, methods=['get'])
     def export_csv(self, request):
+        """Route used by the admin audit screen; same stream as export/?file_format=csv."""
         queryset = self.filter_queryset(self.get_queryset())
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="audit_logs_export.csv"'
-        
-        writer = csv.writer(response)
-        writer.writerow(['Timestamp', 'User', 'Action', 'Resource', 'IP Address', 'Details'])
-        
-        for log in queryset:
-            user_str = log.user.email if log.user else 'System'
-            writer.writerow([
-                log.created_at.strftime("%Y-%m-%d %H:%M:%S") if log.created_at else '',
-                user_str,
-                log.action,
-                log.resource_type,
-                log.ip_address or '',
-                str(log.details)
-            ])
-            
-        return response
+        return streaming_export(queryset, self.export_columns, 'csv', self.export_filename)
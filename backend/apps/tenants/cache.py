@@ -0,0 +1,126 @@
+"""
+In-process tenant resolution cache used by TenantMiddleware.
+
+Entries are keyed by domain (X-Tenant-ID header / subdomain) and by user id
+(employee profile fallback), bounded by an LRU size limit and a TTL.
+Tenant and Employee post_save / post_delete signals bump a version key in the
+Django cache so every worker process drops its local entries on the next lookup.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.observability import record_cache_access
+
+DEFAULTS = {
+    'ENABLED': True,
+    'MAX_ENTRIES': 1024,
+    'TTL': 300,
+}
+
+_MISSING = object()
+
+
+class TenantCache:
+    VERSION_KEY = 'tenants:resolution_version'
+
+    _lock = threading.Lock()
+    _entries = OrderedDict()
+    _version = None
+    _stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    @staticmethod
+    def config():
+        return {**DEFAULTS, **getattr(settings, 'TENANT_CACHE', {})}
+
+    # ── Lookups ───────────────────────────────────────────────────────────
+
+    @classmethod
+    def for_domain(cls, domain):
+        """Active tenant for a domain / subdomain, or None."""
+        def load():
+            Tenant = apps.get_model('tenants', 'Tenant')
+            return Tenant.objects.filter(domain=domain, is_active=True).first()
+
+        return cls._get(('domain', domain), load)
+
+    @classmethod
+    def for_user(cls, user):
+        """Tenant of the user's employee profile (internal org fallback), or None."""
+        def load():
+            Employee = apps.get_model('hrm', 'Employee')
+            profile = (
+                Employee.all_objects.select_related('tenant')
+                .filter(user_id=user.pk)
+                .first()
+            )
+            return profile.tenant if profile else None
+
+        return cls._get(('user', user.pk), load)
+
+    # ── Invalidation & stats ──────────────────────────────────────────────
+
+    @classmethod
+    def invalidate(cls):
+        """Drops local entries and bumps the shared version so other processes follow."""
+        try:
+            cache.incr(cls.VERSION_KEY)
+        except ValueError:
+            cache.set(cls.VERSION_KEY, 1, timeout=None)
+        with cls._lock:
+            cls._entries.clear()
+            cls._version = None
+            cls._stats['invalidations'] += 1
+
+    @classmethod
+    def stats(cls):
+        with cls._lock:
+            return {**cls._stats, 'size': len(cls._entries), 'version': cls._version}
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    @classmethod
+    def _get(cls, key, load):
+        cfg = cls.config()
+        if not cfg['ENABLED']:
+            return load()
+
+        cls._sync_version()
+        version = cls._version
+        now = time.monotonic()
+        with cls._lock:
+            entry = cls._entries.get(key, _MISSING)
+            if entry is not _MISSING and entry[0] > now:
+                cls._entries.move_to_end(key)
+                cls._stats['hits'] += 1
+                record_cache_access(True)
+                return copy.copy(entry[1])
+            cls._stats['misses'] += 1
+        record_cache_access(False)
+
+        tenant = load()
+        with cls._lock:
+            if cls._version != version:
+                # Invalidated while loading: serve the fresh row but don't cache it
+                return copy.copy(tenant)
+            cls._entries[key] = (now + cfg['TTL'], tenant)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > cfg['MAX_ENTRIES']:
+                cls._entries.popitem(last=False)
+                cls._stats['evictions'] += 1
+        # Hand out copies so per-request mutations never leak into the shared entry
+        return copy.copy(tenant)
+
+    @classmethod
+    def _sync_version(cls):
+        version = cache.get(cls.VERSION_KEY, 0)
+        if version != cls._version:
+            with cls._lock:
+                if version != cls._version:
+                    cls._entries.clear()
+                    cls._version = version
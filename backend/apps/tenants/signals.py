@@ -0,0 +1,16 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .cache import TenantCache
+
+
+@receiver(post_save, sender='tenants.Tenant')
+@receiver(post_delete, sender='tenants.Tenant')
+@receiver(post_save, sender='hrm.Employee')
+@receiver(post_delete, sender='hrm.Employee')
+def invalidate_tenant_resolution_cache(sender, instance, **kwargs):
+    """
+    Domain changes, deactivation and employee re-assignment all change what
+    TenantMiddleware resolves, so drop cached resolutions in every process.
+    """
+    TenantCache.invalidate()
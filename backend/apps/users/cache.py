@@ -0,0 +1,94 @@
+"""
+Role / group membership snapshots used by HasRole and ControlService.enforce_policy.
+
+A snapshot holds the names of a user's RBAC roles and auth groups as frozensets,
+so permission checks are constant-time set lookups instead of one query each.
+Snapshots are memoised on the user object for the rest of the request and
+shared across processes through the Django cache, keyed by user id and a
+global version. UserRole / group membership changes delete the user's entry;
+renaming or deleting a Role or Group bumps the version.
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.observability import record_cache_access
+
+DEFAULTS = {
+    'ENABLED': True,
+    'TTL': 300,
+}
+
+_REQUEST_ATTR = '_permission_snapshot'
+
+
+class PermissionSnapshot:
+    __slots__ = ('roles', 'groups')
+
+    def __init__(self, roles=(), groups=()):
+        self.roles = frozenset(roles)
+        self.groups = frozenset(groups)
+
+    def has_role(self, *names):
+        return not self.roles.isdisjoint(names)
+
+    def in_group(self, *names):
+        return not self.groups.isdisjoint(names)
+
+    def __getstate__(self):
+        return (tuple(self.roles), tuple(self.groups))
+
+    def __setstate__(self, state):
+        self.roles, self.groups = frozenset(state[0]), frozenset(state[1])
+
+
+class PermissionCache:
+    VERSION_KEY = 'permissions:version'
+
+    @staticmethod
+    def config():
+        return {**DEFAULTS, **getattr(settings, 'PERMISSION_CACHE', {})}
+
+    @classmethod
+    def for_user(cls, user):
+        """Role and group snapshot for an authenticated user (memoised on the instance)."""
+        snapshot = getattr(user, _REQUEST_ATTR, None)
+        if snapshot is not None:
+            return snapshot
+
+        if not cls.config()['ENABLED']:
+            snapshot = cls._load(user)
+        else:
+            key = cls._key(user.pk)
+            snapshot = cache.get(key)
+            record_cache_access(snapshot is not None)
+            if snapshot is None:
+                snapshot = cls._load(user)
+                cache.set(key, snapshot, timeout=cls.config()['TTL'])
+
+        setattr(user, _REQUEST_ATTR, snapshot)
+        return snapshot
+
+    # ── Invalidation ──────────────────────────────────────────────────────
+
+    @classmethod
+    def invalidate_user(cls, user_id):
+        cache.delete(cls._key(user_id))
+
+    @classmethod
+    def invalidate_all(cls):
+        """Role / group renames affect every snapshot holding the old name."""
+        try:
+            cache.incr(cls.VERSION_KEY)
+        except ValueError:
+            cache.set(cls.VERSION_KEY, 1, timeout=None)
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    @classmethod
+    def _key(cls, user_id):
+        return f"permissions:{cache.get(cls.VERSION_KEY, 0)}:{user_id}"
+
+    @staticmethod
+    def _load(user):
+        roles = user.roles.values_list('name', flat=True) if hasattr(user, 'roles') else ()
+        return PermissionSnapshot(roles, user.groups.values_list('name', flat=True))
@@ -0,0 +1,38 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import PermissionCache
+
+
+@receiver(post_save, sender='users.UserRole')
+@receiver(post_delete, sender='users.UserRole')
+def invalidate_user_role_snapshot(sender, instance, **kwargs):
+    PermissionCache.invalidate_user(instance.user_id)
+
+
+@receiver(post_save, sender='users.Role')
+@receiver(post_delete, sender='users.Role')
+@receiver(post_save, sender='auth.Group')
+@receiver(post_delete, sender='auth.Group')
+def invalidate_all_permission_snapshots(sender, instance, **kwargs):
+    PermissionCache.invalidate_all()
+
+
+@receiver(m2m_changed, sender=get_user_model().groups.through)
+@receiver(m2m_changed, sender=get_user_model().roles.through)
+def invalidate_membership_snapshot(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    user.groups / user.roles add, remove and clear, from either side of the
+    relation. Reverse clears (group.user_set.clear()) don't report the affected
+    users, so fall back to a global bump.
+    """
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        PermissionCache.invalidate_user(instance.pk)
+    elif pk_set:
+        for user_id in pk_set:
+            PermissionCache.invalidate_user(user_id)
+    else:
+        PermissionCache.invalidate_all()
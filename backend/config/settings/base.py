@@ -1,3 +1,4 @@
+import importlib.util
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -67,17 +68,16 @@ INSTALLED_APPS = [
 ]
 
 # Django Channels — WebSocket layer (install: pip install channels daphne)
-# Conditionally added so Django starts even without channels installed
-try:
-    import channels  # noqa
+# Conditionally added so Django starts even without channels installed.
+# find_spec() probes without importing: settings load stays cheap for every process.
+if importlib.util.find_spec('channels') is not None:
     INSTALLED_APPS += ['channels', 'daphne']
     CHANNEL_LAYERS = {
         'default': {
             'BACKEND': 'channels.layers.InMemoryChannelLayer',
         }
     }
-except ImportError:
-    pass  # Channels not installed — WebSocket push disabled, HTTP polling still works
+# else: Channels not installed — WebSocket push disabled, HTTP polling still works
 
 # Stripe
 STRIPE_SECRET_KEY = os.getenv('STRIPE_SECRET_KEY', '')
@@ -86,11 +86,14 @@ FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:3000')
 
 
 MIDDLEWARE = ['corsheaders.middleware.CorsMiddleware','django.middleware.security.SecurityMiddleware',
+'apps.core.compression.CompressionMiddleware',
 'django.contrib.sessions.middleware.SessionMiddleware','django.middleware.common.CommonMiddleware',
 'django.middleware.csrf.CsrfViewMiddleware','django.contrib.auth.middleware.AuthenticationMiddleware',
 'django.contrib.messages.middleware.MessageMiddleware','django.middleware.clickjacking.XFrameOptionsMiddleware',
 'apps.core.middleware.RequestLoggingMiddleware',
-'apps.core.middleware.TenantMiddleware',]
+'apps.core.query_inspector.QueryInspectorMiddleware',
+'apps.core.middleware.TenantMiddleware',
+'apps.core.middleware.AuditBufferMiddleware',]
 
 ROOT_URLCONF = 'config.urls'
 
@@ -121,6 +124,173 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ),
     'EXCEPTION_HANDLER': 'apps.core.exceptions.custom_exception_handler',
+    'DEFAULT_RENDERER_CLASSES': (
+        'apps.core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'apps.core.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+}
+
+# Keyset (created_at, id) pagination for views that opt in with
+# pagination_class = KeysetPagination (apps.core.pagination); ?offset= or
+# pagination_mode = 'offset' on a view switches to counted offset pages.
+PAGINATION = {
+    'PAGE_SIZE': 50,
+    'MAX_PAGE_SIZE': 200,
+}
+
+# gzip / brotli for JSON, CSV and other text responses above MIN_SIZE bytes
+# (apps.core.compression); brotli is used when the package is installed. HTML
+# only gets gzip with random padding, as with Django's GZipMiddleware (BREACH).
+COMPRESSION = {
+    'ENABLED': True,
+    'MIN_SIZE': 1024,
+    'GZIP_LEVEL': 6,
+    'BROTLI_QUALITY': 5,
+}
+
+# ETag / 304 support for polled endpoints (apps.core.conditional). Version
+# stamps live in the default cache, so it must be shared between workers
+# (Redis in production) for ETags to be invalidated everywhere.
+CONDITIONAL_GET = {
+    'ENABLED': True,
+    'MAX_AGE': 900,
+}
+
+# Stale-while-revalidate per-tenant cache of dashboard / stats results
+# (apps.core.result_cache): sections older than SOFT_TTL, or whose models
+# changed, are served while one background thread recomputes them.
+RESULT_CACHE = {
+    'ENABLED': True,
+    'SOFT_TTL': 30,
+    'HARD_TTL': 900,
+    'LOCK_TIMEOUT': 60,
+    'WAIT': 5,
+    'BACKGROUND': True,
+}
+
+# Concurrent fan-out of Command Center modules (apps.core.fanout): each module
+# queries on its own pool thread and connection, so WORKERS adds up to that many
+# database connections per process. A module still running after TIMEOUT
+# seconds (TIMEOUTS: per 'dashboard.<module>') is reported as timed out.
+FAN_OUT = {
+    'ENABLED': True,
+    'WORKERS': 8,
+    'TIMEOUT': 5.0,
+    'TIMEOUTS': {},
+}
+
+# Write-behind audit logging (apps.core.services.audit_buffer).
+# DURABILITY: 'commit' writes on transaction commit / end of request,
+# 'async' hands committed rows to a background flusher thread (best effort).
+AUDIT_BUFFER = {
+    'ENABLED': os.getenv('AUDIT_BUFFER_ENABLED', 'False') == 'True',
+    'DURABILITY': os.getenv('AUDIT_BUFFER_DURABILITY', 'commit'),
+    'BATCH_SIZE': 200,
+    'FLUSH_INTERVAL': 1.0,
+    'MAX_PENDING': 10000,
+}
+
+# TenantMiddleware resolution cache (apps.tenants.cache). Invalidated via
+# Tenant/Employee signals and a version key in the default Django cache.
+TENANT_CACHE = {
+    'ENABLED': True,
+    'MAX_ENTRIES': 1024,
+    'TTL': 300,
+}
+
+# Per-user role / group snapshots for HasRole and ControlService.enforce_policy
+# (apps.users.cache), invalidated on UserRole and group membership changes.
+PERMISSION_CACHE = {
+    'ENABLED': True,
+    'TTL': 300,
+}
+
+# Domain event bus (apps.core.events): OrderCreated / OrderCompleted / DealWon
+# subscribers run after commit, inline ('sync') or on a worker pool ('async').
+# Use 'async' with PostgreSQL only: SQLite serialises writers across threads.
+EVENT_BUS = {
+    'MODE': os.getenv('EVENT_BUS_MODE', 'sync'),
+    'WORKERS': 4,
+}
+
+# Transactional outbox for order_paid / lifecycle_transition / obligation_created
+# (apps.core.outbox), drained by `python manage.py run_outbox`.
+OUTBOX = {
+    'BATCH_SIZE': 100,
+    'WORKERS': 4,
+    'MAX_ATTEMPTS': 8,
+    'BACKOFF_BASE': 2.0,
+    'BACKOFF_MAX': 600,
+    'LEASE': 300,
+    'POLL_INTERVAL': 1.0,
+}
+
+# Database-backed background jobs (apps.core.jobs), executed by
+# `python manage.py run_jobs`. CONCURRENCY caps running jobs per queue across
+# all worker processes and hosts.
+JOB_QUEUE = {
+    'PROCESSES': int(os.getenv('JOB_WORKER_PROCESSES', 2)),
+    'QUEUES': {
+        'default': {'CONCURRENCY': 4},
+        'soc': {'CONCURRENCY': 8},
+        'imports': {'CONCURRENCY': 2},
+    },
+    'MAX_ATTEMPTS': 3,
+    'BACKOFF_BASE': 5.0,
+    'BACKOFF_MAX': 900,
+    'LEASE': 600,
+    'POLL_INTERVAL': 1.0,
+}
+
+# Bulk CSV / JSON Lines imports (apps.core.imports). Uploads up to
+# INLINE_MAX_BYTES are imported in the request, larger ones on the 'imports'
+# job queue; each batch is one transaction and one audit entry.
+IMPORTS = {
+    'BATCH_SIZE': 1000,
+    'UPDATE_BATCH_SIZE': 100,
+    'INLINE_MAX_BYTES': 1024 * 1024,
+    'MAX_ERRORS': 100,
+    'STORAGE_PREFIX': 'imports/',
+}
+
+# Streaming CSV / XLSX list exports (apps.core.exports, ExportMixin): rows are
+# read CHUNK_SIZE at a time and sent every FLUSH_BYTES of encoded output.
+EXPORTS = {
+    'CHUNK_SIZE': 2000,
+    'FLUSH_BYTES': 64 * 1024,
+}
+
+# Per-request DB / cache / serializer instrumentation and per-route latency
+# histograms (apps.core.observability), exposed at /api/dashboard/performance/.
+PERF_INSTRUMENTATION = {
+    'ENABLED': os.getenv('PERF_INSTRUMENTATION', 'True') == 'True',
+    'SERIALIZER_TIMING': True,
+    'SLOW_REQUEST_MS': 1000,
+    'MAX_ROUTES': 500,
+}
+
+# Host metrics sampler (apps.core.host_metrics) behind /api/dashboard/health/ and
+# the sysadmin metrics: CPU, memory, disk, worker RSS, DB ping and 5xx rate every
+# INTERVAL seconds into a ring buffer of HISTORY samples per worker process.
+HOST_METRICS = {
+    'ENABLED': True,
+    'INTERVAL': 10,
+    'HISTORY': 360,
+    'DISK_PATH': os.getenv('HOST_METRICS_DISK_PATH', '/'),
+    'DB_PING': True,
+}
+
+# N+1 detector (apps.core.query_inspector). 'report' logs repeated SQL shapes
+# with the serializer field that triggered them, 'raise' fails the request.
+# Sweep every list endpoint with: manage.py scan_nplusone
+QUERY_INSPECTOR = {
+    'MODE': os.getenv('QUERY_INSPECTOR_MODE', 'off'),
+    'THRESHOLD': 5,
 }
 from datetime import timedelta
 SIMPLE_JWT = {
@@ -15,3 +15,5 @@ DATABASES = {
 }
 
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+
+QUERY_INSPECTOR = {**QUERY_INSPECTOR, 'MODE': os.getenv('QUERY_INSPECTOR_MODE', 'report')}
@@ -21,3 +21,6 @@ PASSWORD_HASHERS = [
 ]
 
 EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
+# No host metrics sampler thread (and its database connection) in tests
+HOST_METRICS = {'ENABLED': False}
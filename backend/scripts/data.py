@@ -282,9 +282,9 @@ def main():
     with transaction.atomic():
         tenant = create_tenant()
         
-        # Set thread local tenant for abstract TenantAwareModels
-        from apps.core.middleware import _thread_locals
-        _thread_locals.tenant = tenant
+        # Set the tenant context for abstract TenantAwareModels
+        from apps.core.middleware import set_current_tenant
+        set_current_tenant(tenant)
 
         admin = create_users_and_roles(tenant)
         clients = create_crm_data(tenant, admin)
@@ -192,7 +192,7 @@ const OrdersTab = () => {
         const fetchOrders = async () => {
             try {
                 const res = await storeService.getOrders();
-                setOrders(res || []);
+                setOrders(res?.results || []);
             } catch (err) {
                 console.error("Failed to fetch orders", err);
             } finally {
@@ -5,16 +5,19 @@ import toast from 'react-hot-toast';
 
 const StoreOrders = () => {
     const [orders, setOrders] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
     const [loading, setLoading] = useState(true);
 
     useEffect(() => {
         loadOrders();
     }, []);
 
-    const loadOrders = async () => {
+    const loadOrders = async (cursor) => {
         try {
-            const data = await storeService.getOrders();
-            setOrders(Array.isArray(data) ? data : data.results || []);
+            const data = await storeService.getOrders(cursor ? { cursor } : {});
+            const rows = Array.isArray(data) ? data : data.results || [];
+            setOrders(prev => (cursor ? [...prev, ...rows] : rows));
+            setNextCursor(data.next ? new URL(data.next).searchParams.get('cursor') : null);
         } catch (error) {
             console.error("Failed to load orders", error);
         } finally {
@@ -115,6 +118,16 @@ const StoreOrders = () => {
                         </tbody>
                     </table>
                 </div>
+                {nextCursor && (
+                    <div className="p-4 border-t border-slate-800 text-center">
+                        <button
+                            onClick={() => loadOrders(nextCursor)}
+                            className="px-4 py-2 bg-slate-800 hover:bg-slate-700 text-white border border-slate-700 rounded-lg transition-all"
+                        >
+                            Load more
+                        </button>
+                    </div>
+                )}
             </div>
         </div>
     );
@@ -21,7 +21,7 @@ const StoreAdminDashboard = () => {
                 const [metricsRes, chartRes, ordersRes] = await Promise.all([
                     client.get('dashboard/metrics/'),
                     client.get('dashboard/mrr/'),
-                    storeService.getOrders()
+                    storeService.getOrders({ page_size: 5 })
                 ]);
                 
                 setMetrics(metricsRes.data.data);
@@ -24,7 +24,8 @@ const StoreDashboard = () => {
         try {
             // Parallel fetch of real data
             const [ordersRes, licensesRes] = await Promise.all([
-                storeService.getOrders(),
+                // Newest 200 orders (the page size cap): enough for the 30-day spend and pending count
+                storeService.getOrders({ page_size: 200 }),
                 storeService.getLicenses(),
             ]);
 
@@ -17,7 +17,7 @@ const Payments = () => {
 
                 // Fetch Orders (Store History)
                 const ordersRes = await client.get('store/orders/');
-                setOrders(ordersRes.data);
+                setOrders(ordersRes.data?.results ?? ordersRes.data ?? []);
 
             } catch (err) {
                 console.error("Failed to fetch payments info:", err);
@@ -117,7 +117,7 @@ export const platformService = {
     getSecurityGaps: async (params = {}) => {
         // Map to network events flagged as anomalous
         const response = await client.get('security/network-events/', { params: { ...params, category: 'anomalous_traffic' } });
-        return response.data.data;
+        return response.data;
     },
 
     // --- Monitoring & Network ---
@@ -127,7 +127,7 @@ export const platformService = {
     },
     getNetworkEvents: async (params = {}) => {
         const response = await client.get('security/network-events/', { params });
-        return response.data.data;
+        return response.data;
     },
     getHealthMetrics: async (endpointId) => {
         const response = await client.get('security/monitors/', { params: { endpoint: endpointId } });
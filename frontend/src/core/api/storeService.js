@@ -40,9 +40,10 @@ export const storeService = {
         const response = await client.post(`store/subscription-plans/${planId}/subscribe/`, subscribeData);
         return response.data.data;
     },
-    getOrders: async () => {
-        const response = await client.get('store/orders/');
-        return response.data.data;
+    // Keyset-paginated, newest first: { next, previous, results }; pass { cursor } from page.next for more.
+    getOrders: async (params = {}) => {
+        const response = await client.get('store/orders/', { params });
+        return response.data;
     },
     deleteOrder: async (id) => {
         const response = await client.delete(`store/orders/${id}/`);